@@ -0,0 +1,66 @@
+'''
+Object construction microbenchmark
+
+Compares constructing soft signals and positioners, and
+making their first subscription, with the per-class subscription type cache
+against the previous behavior of scanning dir() on every new instance.
+
+The subscription containers are only allocated on the first subscription,
+which is where the subscription types are looked up.
+
+Usage::
+
+    python benchmarks/bench_construction.py [count]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+
+from ophyd.controls.signal import Signal
+from ophyd.controls.positioner import Positioner
+
+
+def uncached(cls_):
+    '''Subclass of cls_ which scans for subscription types on every init'''
+    def _get_sub_types(cls):
+        return tuple(set(getattr(cls, attr) for attr in dir(cls)
+                         if attr.startswith('SUB_') or
+                         attr.startswith('_SUB_')))
+
+    # Same instance layout (no added __dict__) as cls_
+    return type('Uncached%s' % cls_.__name__, (cls_, ),
+                {'_get_sub_types': classmethod(_get_sub_types),
+                 '__slots__': ()})
+
+
+def _callback(**kwargs):
+    pass
+
+
+def bench(cls_, event_type, count):
+    def construct():
+        obj = cls_(name='bench', register=False)
+        obj.subscribe(_callback, event_type=event_type, run=False)
+
+    return min(timeit.repeat(construct, number=count, repeat=5)) / count
+
+
+def main(count=10000):
+    print('{:<14} {:>16} {:>12} {:>8}'.format('class', 'dir() scan [us]',
+                                              'cached [us]', 'speedup'))
+
+    for cls_, event_type in ((Signal, Signal.SUB_VALUE),
+                             (Positioner, Positioner.SUB_READBACK)):
+        t_uncached = bench(uncached(cls_), event_type, count)
+        t_cached = bench(cls_, event_type, count)
+        print('{:<14} {:>16.2f} {:>12.2f} {:>7.1f}x'
+              ''.format(cls_.__name__, 1e6 * t_uncached, 1e6 * t_cached,
+                        t_uncached / t_cached))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
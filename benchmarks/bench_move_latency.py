@@ -0,0 +1,85 @@
+'''
+Move completion latency benchmark
+
+Moves an EpicsMotor back and forth on a simulated motor record
+(ophyd.controls.sim), measuring the time from the end of motion (DMOV going
+to 1 on the simulated IOC) to move(wait=True) returning. For comparison, the
+same moves are waited on with the former loop, which slept 50 ms between
+live reads of MOVN.
+
+Usage::
+
+    python benchmarks/bench_move_latency.py [count] [latency_ms]
+'''
+
+from __future__ import print_function
+import sys
+import time
+
+from ophyd.controls import (EpicsMotor, use_backend)
+from ophyd.controls.sim import (SimBackend, SimMotor)
+
+
+def _polled_move(motor, position, timeout=30.0):
+    '''Move and wait as Positioner.move used to'''
+    motor._started_moving = False
+    motor._user_setpoint.put(position, wait=False)
+
+    t0 = time.time()
+    while not motor._started_moving:
+        time.sleep(0.05)
+        if time.time() - t0 > timeout:
+            raise RuntimeError('no motion')
+
+    while motor.moving:
+        time.sleep(0.05)
+        if time.time() - t0 > timeout:
+            raise RuntimeError('timeout')
+
+
+def _event_move(motor, position):
+    motor.move(position, wait=True)
+
+
+def _latencies(motor, sim_motor, move, count, distance):
+    latencies = []
+    for i in range(count):
+        move(motor, distance * ((i + 1) % 2))
+        done_ts = sim_motor._dmov.timestamp
+        latencies.append(time.time() - done_ts)
+
+    return sorted(latencies)
+
+
+def main(count=20, latency=1e-3):
+    sim = SimBackend(latency=latency, seed=0)
+    sim_motor = SimMotor(sim, 'SIM:m1', velocity=10.0, update_rate=100.0)
+
+    with use_backend(sim):
+        m1 = EpicsMotor('SIM:m1', name='m1')
+
+    # Wait for all channels to connect
+    m1.position
+    m1.moving
+
+    print('latency {:.2f} ms, moves of 0.1 mm at 10 mm/s'
+          ''.format(1e3 * latency))
+    print('{:<30} {:>12} {:>12}'.format('wait', 'median ms', 'max ms'))
+
+    for label, move in (('polled (50 ms sleep)', _polled_move),
+                        ('event-driven', _event_move)):
+        latencies = _latencies(m1, sim_motor, move, count, 0.1)
+        print('{:<30} {:>12.2f} {:>12.2f}'
+              ''.format(label, 1e3 * latencies[len(latencies) // 2],
+                        1e3 * latencies[-1]))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    kwargs = {}
+    if len(args) > 0:
+        kwargs['count'] = int(args[0])
+    if len(args) > 1:
+        kwargs['latency'] = float(args[1]) * 1e-3
+
+    main(**kwargs)
@@ -0,0 +1,100 @@
+'''
+Signal memory microbenchmark
+
+Reports the memory allocated per signal for the (__slots__-based) signal
+classes, and for signals whose instance __dict__ has been allocated (as it
+was for every signal before), both before and after a subscription is
+made. EpicsSignal numbers include the pyepics PV objects; no IOC is needed
+since the channels are never connected.
+
+Requires Python 3.4+ (tracemalloc).
+
+Usage::
+
+    python benchmarks/bench_signal_memory.py [count]
+'''
+
+from __future__ import print_function
+import gc
+import sys
+import tracemalloc
+
+from ophyd.controls.signal import (Signal, EpicsSignal)
+
+
+class DictSignal(Signal):
+    '''A signal with an instance __dict__'''
+    def __init__(self, *args, **kwargs):
+        Signal.__init__(self, *args, **kwargs)
+        self.__dict__
+
+
+class DictEpicsSignal(EpicsSignal):
+    '''An EPICS signal with an instance __dict__'''
+    def __init__(self, *args, **kwargs):
+        EpicsSignal.__init__(self, *args, **kwargs)
+        self.__dict__
+
+
+def _callback(**kwargs):
+    pass
+
+
+def measure(factory, count, subscribe=False):
+    '''Average number of bytes allocated per object'''
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    objs = [factory(i) for i in range(count)]
+    if subscribe:
+        for obj in objs:
+            obj.subscribe(_callback, run=False)
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del objs
+    return float(used) / count
+
+
+def soft_factory(cls_):
+    def factory(i):
+        return cls_(name='sig%d' % i, value=0.0, register=False)
+    return factory
+
+
+def epics_factory(cls_):
+    # Channels are cached by pyepics; use new PV names on every run
+    runs = [0]
+
+    def factory(i):
+        if i == 0:
+            runs[0] += 1
+        return cls_('OPHYD_BENCH:%s:%d:%d' % (cls_.__name__, runs[0], i),
+                    register=False)
+    return factory
+
+
+def main(count=2000):
+    cases = [(DictSignal, soft_factory(DictSignal), count * 10),
+             (Signal, soft_factory(Signal), count * 10),
+             (DictEpicsSignal, epics_factory(DictEpicsSignal), count),
+             (EpicsSignal, epics_factory(EpicsSignal), count),
+             ]
+
+    print('{:<20} {:>14} {:>16}'.format('class', 'bytes/signal',
+                                        'subscribed'))
+    for cls_, factory, n in cases:
+        # warm up caches (CA context, pyepics and ophyd internals)
+        measure(factory, n)
+        print('{:<20} {:>14.0f} {:>16.0f}'
+              ''.format(cls_.__name__, measure(factory, n),
+                        measure(factory, n, subscribe=True)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,51 @@
+'''
+Signal update throughput microbenchmark
+
+Measures Signal.put and Signal._set_readback (the path taken by every
+monitor update of an EpicsSignal) with and without a subscriber.
+
+Usage::
+
+    python benchmarks/bench_signal_put.py [count]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+
+from ophyd.controls.signal import Signal
+
+
+def _callback(**kwargs):
+    pass
+
+
+def bench(fcn, count):
+    return count / min(timeit.repeat(fcn, number=count, repeat=5))
+
+
+def main(count=100000):
+    print('{:<30} {:>12}'.format('operation', 'updates/s'))
+
+    for subscribers in (0, 1):
+        sig = Signal(name='bench', value=0.0, register=False)
+        for i in range(subscribers):
+            sig.subscribe(_callback, run=False)
+
+        def put():
+            sig.put(1.0)
+
+        def set_readback():
+            sig._set_readback(1.0)
+
+        for label, fcn in (('put', put), ('_set_readback', set_readback)):
+            label = '%s (%d subscriber%s)' % (label, subscribers,
+                                             '' if subscribers == 1 else 's')
+            print('{:<30} {:>12.0f}'.format(label, bench(fcn, count)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,88 @@
+'''
+EpicsSignal.read() microbenchmark
+
+Reads a SignalGroup of 100 EpicsSignals, as done for every recordable
+signal at every scan point. Channel access is replaced by an in-process
+stand-in for epics.PV so that only the ophyd-side cost is measured; the
+previous read() implementation (describe() plus np.round on every call)
+is included for comparison.
+
+Usage::
+
+    python benchmarks/bench_signal_read.py [count]
+'''
+
+from __future__ import print_function
+import sys
+import time
+import timeit
+
+import numpy as np
+
+from ophyd.controls.signal import (EpicsSignal, SignalGroup)
+
+
+TIMESTAMP = time.time()
+
+
+class StandInPV(object):
+    '''A connected, monitored epics.PV stand-in'''
+    connected = True
+    auto_monitor = True
+
+    def __init__(self, pvname, value):
+        self.pvname = pvname
+        self.value = value
+        self.timestamp = TIMESTAMP
+
+    def get(self, **kwargs):
+        return self.value
+
+
+class LegacyEpicsSignal(EpicsSignal):
+    '''EpicsSignal with the previous read() implementation (with its
+    lookups of value and dtype fixed)'''
+    def read(self):
+        value = self.value
+        if self.num_decimals != 'all':
+            value = np.round(self.value, self.num_decimals)
+        value = self.describe()[self.name]['dtype'](value)
+        return {self.name: {'value': value,
+                            'timestamp': self.timestamp}}
+
+
+def make_group(cls_, num_signals, **kwargs):
+    group = SignalGroup(name='group', register=False)
+    for i in range(num_signals):
+        sig = cls_('BENCH:sig%d' % i, name='sig%d' % i, lazy=True,
+                   register=False, **kwargs)
+        sig._read_pv_obj = sig._write_pv_obj = StandInPV(sig.pvname, 1.2345)
+        group.add_signal(sig)
+    return group
+
+
+def bench(group, count):
+    return count / min(timeit.repeat(group.read, number=count, repeat=5))
+
+
+def main(count=1000, num_signals=100):
+    print('{:<24} {:>16} {:>16}'.format('signals', 'legacy [reads/s]',
+                                        'new [reads/s]'))
+
+    for label, kwargs in (('float', {}),
+                          ('float, num_decimals=2', {'num_decimals': 2}),
+                          ('int', {'dtype': int}),
+                          ):
+        legacy = make_group(LegacyEpicsSignal, num_signals, **kwargs)
+        new = make_group(EpicsSignal, num_signals, **kwargs)
+        assert legacy.read() == new.read()
+
+        print('{:<24} {:>16.0f} {:>16.0f}'.format(label, bench(legacy, count),
+                                                  bench(new, count)))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,94 @@
+'''
+Simulated control system benchmark
+
+Runs EpicsMotor, EpicsScaler and EpicsSignal against the in-process
+simulated backend (ophyd.controls.sim), with a given network latency, and
+measures:
+
+* motor move round trips (put VAL, wait for the put completion)
+* scaler acquire and read cycles
+* sequential put(wait=True) against bulk_write() of a number of signals
+
+Usage::
+
+    python benchmarks/bench_sim_stack.py [count] [latency_ms]
+'''
+
+from __future__ import print_function
+import sys
+import time
+
+from ophyd.controls import (EpicsMotor, EpicsScaler, EpicsSignal,
+                            use_backend)
+from ophyd.controls.signal import bulk_write
+from ophyd.controls.sim import (SimBackend, SimMotor, SimScaler)
+
+
+def _timed(fcn, count):
+    '''Per-call times of fcn [sec]'''
+    times = []
+    for i in range(count):
+        t0 = time.time()
+        fcn(i)
+        times.append(time.time() - t0)
+    return sorted(times)
+
+
+def _report(label, times):
+    total = sum(times)
+    median = times[len(times) // 2]
+    print('{:<30} {:>12.1f} {:>12.2f}'.format(label, len(times) / total,
+                                              1e3 * median))
+
+
+def main(count=50, latency=1e-3):
+    sim = SimBackend(latency=latency, jitter=latency / 2., seed=0)
+    SimMotor(sim, 'SIM:m1', velocity=1000.0, update_rate=1000.0)
+    SimScaler(sim, 'SIM:scaler1', numchan=8)
+
+    with use_backend(sim):
+        m1 = EpicsMotor('SIM:m1', name='m1')
+        scaler = EpicsScaler('SIM:scaler1', name='scaler1', numchan=8)
+        signals = [EpicsSignal('SIM:sig%d' % i, name='sig%d' % i)
+                   for i in range(10)]
+
+    # Wait for all channels to connect
+    m1.position
+    scaler.preset_time = 0.001
+    for sig in signals:
+        sig.get()
+
+    print('latency {:.2f} ms'.format(1e3 * latency))
+    print('{:<30} {:>12} {:>12}'.format('operation', 'ops/s', 'median ms'))
+
+    def move(i):
+        m1.move(0.01 * (i % 2), wait=True)
+
+    def acquire(i):
+        status = scaler.acquire()
+        while not status.done:
+            time.sleep(1e-4)
+        scaler.read()
+
+    def put_sequential(i):
+        for sig in signals:
+            sig.put(i, wait=True)
+
+    def put_bulk(i):
+        bulk_write(signals, [i] * len(signals), use_complete=True).wait()
+
+    _report('motor move', _timed(move, count))
+    _report('scaler acquire + read', _timed(acquire, count))
+    _report('10 x put(wait=True)', _timed(put_sequential, count))
+    _report('bulk_write of 10', _timed(put_bulk, count))
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    kwargs = {}
+    if len(args) > 0:
+        kwargs['count'] = int(args[0])
+    if len(args) > 1:
+        kwargs['latency'] = float(args[1]) * 1e-3
+
+    main(**kwargs)
@@ -0,0 +1,71 @@
+'''
+Char waveform to string conversion microbenchmark
+
+Compares the previous per-character conversion with the vectorized
+waveform_to_string, and with the WaveformStringCache used by string
+EpicsSignals (where most monitor updates repeat the previous value).
+
+Usage::
+
+    python benchmarks/bench_waveform_string.py [count]
+'''
+
+from __future__ import print_function
+import sys
+import timeit
+
+import numpy as np
+
+from ophyd.utils.epics_pvs import (waveform_to_string, WaveformStringCache)
+
+
+def legacy_waveform_to_string(value, type_=str, delim=''):
+    '''The previous, per-character implementation'''
+    try:
+        value = delim.join(chr(c) for c in value)
+    except TypeError:
+        value = type_(value)
+
+    try:
+        value = value[:value.index('\0')]
+    except (IndexError, ValueError):
+        pass
+
+    return value
+
+
+def make_waveform(size, text):
+    '''A NUL-padded char waveform, as received from a FilePath-like PV'''
+    value = np.zeros(size, dtype=np.uint8)
+    raw = np.frombuffer(text.encode('latin-1'), dtype=np.uint8)[:size - 1]
+    value[:len(raw)] = raw
+    return value
+
+
+def bench(fcn, count):
+    return count / min(timeit.repeat(fcn, number=count, repeat=5))
+
+
+def main(count=10000):
+    text = '/GPFS/xf23id/xf23id1/2015/06/17/' + 'a1b2c3d4-e5f6' * 10
+
+    print('{:<10} {:>14} {:>14} {:>14}'.format('bytes', 'legacy [/s]',
+                                               'numpy [/s]', 'cached [/s]'))
+    for size in (256, 4096):
+        value = make_waveform(size, text)
+        cache = WaveformStringCache()
+
+        assert (legacy_waveform_to_string(value) ==
+                waveform_to_string(value) == cache.decode(value))
+
+        rates = [bench(lambda: legacy_waveform_to_string(value), count),
+                 bench(lambda: waveform_to_string(value), count),
+                 bench(lambda: cache.decode(value), count)]
+        print('{:<10} {:>14.0f} {:>14.0f} {:>14.0f}'.format(size, *rates))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -89,7 +89,7 @@ def simple_scan(motors=[],
             logger.debug('Stopping motor %s' % m._alias)
             m.stop()
 
-    trajectories = [m._followed for m in motors]
+    trajectories = [m.trajectory.readbacks for m in motors]
     return trajectories, all_data
 
 
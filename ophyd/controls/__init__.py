@@ -10,6 +10,12 @@ from .positioner import (EpicsMotor, PVPositioner)
 from .pseudopos import PseudoPositioner
 from .scaler import EpicsScaler
 from .detector import (Detector, SignalDetector)
+from .connection import ConnectionManager
+from .derived import DerivedSignal
+from .status import (StatusBase, all_of, any_of)
+from .trajectory import Trajectory
+from .flyscan import FlyScan
+from .backend import (get_backend, set_backend, use_backend)
 
 from .areadetector.detectors import *
 from .areadetector.plugins import *
@@ -1,7 +1,8 @@
 from __future__ import print_function
 from .detector import SignalDetector, DetectorStatus
-from .signal import EpicsSignal, Signal
-from epics import caput
+from .signal import EpicsSignal, Signal, bulk_put_pvs
+from ..utils import TimeoutError
+from .backend import get_backend
 from collections import deque
 import time
 from datetime import datetime
@@ -15,6 +16,8 @@ class AreaDetector(SignalDetector):
     _SUB_DONE = 'done'
     _SUB_ACQ_CHECK = 'acq_check'
 
+    _uncached_subs = frozenset([_SUB_ACQ_DONE, _SUB_DONE, _SUB_ACQ_CHECK])
+
     def __init__(self, basename, stats=range(1, 6),
                  shutter=None, shutter_rb=None, shutter_val=(0, 1),
                  cam='cam1:', proc_plugin='Proc1:',
@@ -152,8 +155,40 @@ class AreaDetector(SignalDetector):
 
     def _write_plugin(self, name, value, plugin, wait=True, as_string=False,
                       verify=True):
-        caput('{}{}{}'.format(self._basename, plugin, name),
-              value, wait=wait)
+        get_backend().caput('{}{}{}'.format(self._basename, plugin, name),
+                            value, wait=wait)
+
+    def _write_plugins(self, writes, wait=True, timeout=30.0):
+        """Write a number of plugin parameters at once
+
+        The puts are issued together, in order, rather than waiting on each
+        in turn.
+
+        Parameters
+        ----------
+        writes : list of (name, value, plugin)
+            The parameters to write, as for _write_plugin
+        wait : bool, optional
+            Wait for all of the puts to complete
+        timeout : float, optional
+            Time for the puts to complete [sec]
+
+        Returns
+        -------
+        status : BulkPutStatus
+        """
+        backend = get_backend()
+        pvs = [backend.get_pv('{}{}{}'.format(self._basename, plugin, name))
+               for name, value, plugin in writes]
+
+        status = bulk_put_pvs(pvs, [value for name, value, plugin in writes],
+                              use_complete=wait, timeout=timeout)
+
+        if wait and not status.wait(timeout):
+            raise TimeoutError('Puts to {} did not complete'
+                               .format(', '.join(status.incomplete)))
+
+        return status
 
     def __repr__(self):
         repr = ['basename={0._basename!r}'.format(self),
@@ -179,23 +214,23 @@ class AreaDetector(SignalDetector):
         # If using the stats, configure the proc plugin
 
         if self._use_stats:
-            self._write_plugin('EnableCallbacks', 1, self._proc_plugin)
-            self._write_plugin('EnableFilter', 1, self._proc_plugin)
-            self._write_plugin('FilterType', 2, self._proc_plugin)
-            self._write_plugin('AutoResetFilter', 1, self._proc_plugin)
-            self._write_plugin('FilterCallbacks', 1, self._proc_plugin)
-            self._write_plugin('NumFilter', self._num_images.value,
-                               self._proc_plugin)
-            self._write_plugin('FilterCallbacks', 1, self._proc_plugin)
+            writes = [('EnableCallbacks', 1, self._proc_plugin),
+                      ('EnableFilter', 1, self._proc_plugin),
+                      ('FilterType', 2, self._proc_plugin),
+                      ('AutoResetFilter', 1, self._proc_plugin),
+                      ('FilterCallbacks', 1, self._proc_plugin),
+                      ('NumFilter', self._num_images.value,
+                       self._proc_plugin),
+                      ]
 
             # Turn on the stats plugins
             for i in self._stats:
-                self._write_plugin('EnableCallbacks', 1,
-                                   'Stats{}:'.format(i))
-                self._write_plugin('BlockingCallbacks', 1,
-                                   'Stats{}:'.format(i))
-                self._write_plugin('ComputeStatistics', 1,
-                                   'Stats{}:'.format(i))
+                writes.extend([('EnableCallbacks', 1, 'Stats{}:'.format(i)),
+                               ('BlockingCallbacks', 1, 'Stats{}:'.format(i)),
+                               ('ComputeStatistics', 1, 'Stats{}:'.format(i)),
+                               ])
+
+            self._write_plugins(writes)
 
         # Set the counter for number of acquisitions
 
@@ -509,12 +544,13 @@ class AreaDetectorFileStoreHDF5(AreaDetectorFSBulkEntry):
         # self._image_mode.put(1, wait=True)
 
         self._file_template.put(self.file_template, wait=True)
-        self._write_plugin('AutoIncrement', 1, self._file_plugin)
-        self._write_plugin('FileNumber', 0, self._file_plugin)
-        self._write_plugin('AutoSave', 1, self._file_plugin)
-        self._write_plugin('NumCapture', 10000000, self._file_plugin)
-        self._write_plugin('FileWriteMode', 2, self._file_plugin)
-        self._write_plugin('EnableCallbacks', 1, self._file_plugin)
+        self._write_plugins([('AutoIncrement', 1, self._file_plugin),
+                             ('FileNumber', 0, self._file_plugin),
+                             ('AutoSave', 1, self._file_plugin),
+                             ('NumCapture', 10000000, self._file_plugin),
+                             ('FileWriteMode', 2, self._file_plugin),
+                             ('EnableCallbacks', 1, self._file_plugin),
+                             ])
 
         self._make_filename()
 
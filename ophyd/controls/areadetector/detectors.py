@@ -176,9 +176,12 @@ class ADSignal(object):
             else:
                 write = None
 
+            # Instances can override the keyword arguments of the class
+            kwargs = dict(self.kwargs)
+            kwargs.update(obj._ad_signal_kwargs.get(pv, {}))
+
             signal = EpicsSignal(read_, write_pv=write,
-                                 name=full_name,
-                                 **self.kwargs)
+                                 name=full_name, **kwargs)
 
             obj._ad_signals[pv] = signal
 
@@ -187,7 +190,7 @@ class ADSignal(object):
             else:
                 signal.__doc__ = self.__doc__
 
-            return obj._ad_signals[pv]
+            return signal
 
     def __get__(self, obj, objtype=None):
         return self.check_exists(obj)
@@ -308,6 +311,7 @@ class ADBase(OphydObject):
 
         self._prefix = prefix
         self._ad_signals = {}
+        self._ad_signal_kwargs = {}
         self.__sig_dict = None
 
     def read(self):
@@ -14,11 +14,10 @@ import re
 import logging
 import numpy as np
 
-import epics
-
 from .detectors import (ADBase, NDArrayDriver,
                         ADSignal, ADSignalGroup)
 from ...utils import enum
+from ..backend import get_backend
 
 
 logger = logging.getLogger(__name__)
@@ -119,14 +118,59 @@ class PluginBase(NDArrayDriver):
 
 
 class ImagePlugin(PluginBase):
+    '''Image (NDStdArrays) plugin
+
+    Parameters
+    ----------
+    prefix : str
+        The PV prefix
+    monitor_array : bool, optional
+        Monitor the image array (the default). With monitor_array=False, the
+        image is only transferred when requested (see :meth:`get_image`),
+        and subscribers to array_data are not updated as new images arrive.
+
+    Other keyword arguments are passed on to the base class (PluginBase)
+    initializer
+    '''
     _default_suffix = 'image1:'
     _suffix_re = 'image\d:'
     _html_docs = ['NDPluginStdArrays.html']
 
     array_data = ADSignal('ArrayData')
 
+    def __init__(self, prefix, monitor_array=True, **kwargs):
+        PluginBase.__init__(self, prefix, **kwargs)
+
+        if not monitor_array:
+            self._ad_signal_kwargs['ArrayData'] = {'auto_monitor': False}
+
     @property
     def image(self):
+        return self.get_image()
+
+    def get_image(self, out=None, pool=None):
+        '''Get the current image
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Buffer to read the image into, of the image's shape. With the
+            native data type of the ArrayData PV, the image is written into
+            it without intermediate copies.
+        pool : ArrayBufferPool, optional
+            Take the buffer from this pool. Release it back to the pool when
+            done with the image.
+
+        Returns
+        -------
+        image : np.ndarray
+
+        Raises
+        ------
+        RuntimeError
+            If the image array is smaller than the image size (e.g., when
+            the image size changed while reading)
+        '''
         array_size = self.array_size.value
         if array_size == [0, 0, 0]:
             raise RuntimeError('Invalid image; ensure array_callbacks are on')
@@ -134,9 +178,30 @@ class ImagePlugin(PluginBase):
         if array_size[-1] == 0:
             array_size = array_size[:-1]
 
-        pixel_count = self.array_pixels
-        image = self.array_data.get(count=pixel_count)
-        return np.array(image).reshape(array_size)
+        if out is None and pool is None:
+            pixel_count = self.array_pixels
+            image = self.array_data.get(count=pixel_count)
+            return np.asarray(image).reshape(array_size)
+
+        pooled = (out is None)
+        if pooled:
+            if pool.shape != tuple(array_size):
+                raise ValueError('Pool shape %s does not match the image %s' %
+                                 (pool.shape, tuple(array_size)))
+            out = pool.acquire()
+        elif out.shape != tuple(array_size):
+            raise ValueError('Buffer shape %s does not match the image %s' %
+                             (out.shape, tuple(array_size)))
+
+        image = self.array_data.get(out=out)
+        if image is not out:
+            if pooled:
+                pool.release(out)
+
+            raise RuntimeError('Read %d of %d pixels' % (image.size,
+                                                         out.size))
+
+        return image
 
 
 class StatsPlugin(PluginBase):
@@ -749,7 +814,7 @@ def get_areadetector_plugin_class(prefix, suffix=''):
     class_ = plugin_from_pvname(base)
     if class_ is None:
         type_rbv = ''.join([prefix, suffix, 'PluginType_RBV'])
-        type_ = epics.caget(type_rbv)
+        type_ = get_backend().caget(type_rbv)
 
         # HDF5 includes version number, remove it
         type_ = type_.split(' ')[0]
@@ -0,0 +1,104 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.backend` - Control system backends
+======================================================
+
+.. module:: ophyd.control.backend
+   :synopsis: Select where EPICS signals get their channels from
+'''
+
+from __future__ import print_function
+import logging
+from contextlib import contextmanager
+
+import epics
+
+
+logger = logging.getLogger(__name__)
+
+
+class EpicsBackend(object):
+    '''Channel access through pyepics
+
+    A backend creates the channel (PV) objects of EPICS signals. The objects
+    need to provide the parts of the epics.PV interface ophyd relies on:
+    pvname, connected, auto_monitor, timestamp, get(), put() (with
+    put completion callbacks), get_ctrlvars(), add_callback(),
+    wait_for_connection() and connection_callbacks.
+    '''
+
+    def create_pv(self, pvname, **kwargs):
+        '''Create a new channel
+
+        Keyword arguments are those of epics.PV
+        '''
+        return epics.PV(pvname, **kwargs)
+
+    def get_pv(self, pvname, **kwargs):
+        '''Get a shared, connected channel for one-off gets and puts'''
+        return epics.get_pv(pvname, connect=True, **kwargs)
+
+    def caget(self, pvname, **kwargs):
+        '''Get the value of a channel by name
+
+        Keyword arguments are passed on to get()
+        '''
+        return self.get_pv(pvname).get(**kwargs)
+
+    def caput(self, pvname, value, **kwargs):
+        '''Put a value to a channel by name
+
+        Keyword arguments are passed on to put()
+        '''
+        return self.get_pv(pvname).put(value, **kwargs)
+
+    def __repr__(self):
+        return '{}()'.format(self.__class__.__name__)
+
+
+_backend = EpicsBackend()
+
+
+def get_backend():
+    '''The backend EPICS signals are created with'''
+    return _backend
+
+
+def set_backend(backend):
+    '''Set the backend new EPICS signals are created with
+
+    Signals which were already created keep their channels.
+
+    Parameters
+    ----------
+    backend : EpicsBackend
+        The backend, e.g. :class:`ophyd.controls.sim.SimBackend`. None
+        restores pyepics channel access.
+
+    Returns
+    -------
+    old_backend : EpicsBackend
+    '''
+    global _backend
+
+    if backend is None:
+        backend = EpicsBackend()
+
+    old_backend, _backend = _backend, backend
+    logger.debug('Backend set to %s' % backend)
+    return old_backend
+
+
+@contextmanager
+def use_backend(backend):
+    '''Create the EPICS signals inside of the block with a different
+    backend::
+
+        with use_backend(SimBackend()) as sim:
+            m1 = EpicsMotor('XF:31IDA-OP{Tbl-Ax:X1}Mtr', name='m1')
+    '''
+    old_backend = set_backend(backend)
+    try:
+        yield backend
+    finally:
+        set_backend(old_backend)
@@ -0,0 +1,283 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.connection` - Bulk channel connection
+=========================================================
+
+.. module:: ophyd.control.connection
+   :synopsis: Connect the channels of many devices at once
+'''
+
+from __future__ import print_function
+import logging
+import sys
+import time
+from collections import OrderedDict
+
+from ..utils import TimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+# Stack of active ConnectionManagers, the innermost last
+_managers = []
+
+
+def get_connection_manager():
+    '''The innermost active ConnectionManager, or None'''
+    try:
+        return _managers[-1]
+    except IndexError:
+        return None
+
+
+def run_when_connected(owner, fcn, *args, **kwargs):
+    '''Run fcn(*args, **kwargs), deferring it until all channels are
+    connected if a ConnectionManager is active
+
+    Devices use this for their initial reads, which would otherwise block on
+    each channel connection in turn.
+
+    Parameters
+    ----------
+    owner : OphydObject
+        The device the call belongs to. It is skipped if any of the device's
+        channels fail to connect.
+    fcn : callable
+        The function to run
+    '''
+    manager = get_connection_manager()
+    if manager is None:
+        fcn(*args, **kwargs)
+    else:
+        manager.defer(owner, fcn, *args, **kwargs)
+
+
+class ConnectionManager(object):
+    '''Connect the channels of many devices at once
+
+    Used as a context manager, the EPICS signals created inside of it register
+    their channels with the manager. Devices defer their initial reads until
+    the end of the block, where all channels are waited on together with a
+    single timeout. This way, the connection time of a configuration is that
+    of the slowest channel rather than the sum of them all::
+
+        with ConnectionManager(timeout=5.0) as conn:
+            m1 = EpicsMotor('XF:31IDA-OP{Tbl-Ax:X1}Mtr', name='m1')
+            m2 = EpicsMotor('XF:31IDA-OP{Tbl-Ax:X2}Mtr', name='m2')
+
+        conn.report()
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Time to wait for all of the channels to connect [sec]
+    raise_on_failure : bool, optional
+        Raise TimeoutError when leaving the context if any channels failed to
+        connect. Otherwise, the failures are only logged.
+    '''
+
+    def __init__(self, timeout=5.0, raise_on_failure=False):
+        self.timeout = float(timeout)
+        self.raise_on_failure = bool(raise_on_failure)
+
+        # pvname -> [pv, owner, connection time]
+        self._pvs = OrderedDict()
+        # owner -> [pvname], so that claim() only touches its channels
+        self._owned = {}
+        self._deferred = []
+        self._t0 = None
+
+    def __enter__(self):
+        if self._t0 is None:
+            self._t0 = time.time()
+
+        _managers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _managers.remove(self)
+
+        if exc_type is None:
+            self.wait()
+
+    def add_pv(self, pv, owner):
+        '''Wait on a pyepics PV
+
+        Parameters
+        ----------
+        pv : epics.PV
+            The PV
+        owner : OphydObject
+            The signal or device the PV belongs to
+        '''
+        if self._t0 is None:
+            self._t0 = time.time()
+
+        if pv.pvname in self._pvs:
+            return
+
+        info = [pv, owner, None]
+        self._pvs[pv.pvname] = info
+        self._owned.setdefault(owner, []).append(pv.pvname)
+
+        if pv.connected:
+            info[2] = 0.0
+            return
+
+        def connected(conn=None, **kwargs):
+            if conn and info[2] is None:
+                info[2] = time.time() - self._t0
+
+        pv.connection_callbacks.append(connected)
+        info.append(connected)
+
+    def add_signal(self, signal):
+        '''Wait on the channels of an EpicsSignal'''
+        for pv in (signal._read_pv, signal._write_pv):
+            if pv is not None:
+                self.add_pv(pv, signal)
+
+    def claim(self, signal, device):
+        '''Attribute the channels of signal to the device it was added to'''
+        pvnames = self._owned.pop(signal, None)
+        if not pvnames:
+            return
+
+        for pvname in pvnames:
+            self._pvs[pvname][1] = device
+
+        self._owned.setdefault(device, []).extend(pvnames)
+
+    def defer(self, owner, fcn, *args, **kwargs):
+        '''Run fcn(*args, **kwargs) once all channels are connected'''
+        self._deferred.append((owner, fcn, args, kwargs))
+
+    def wait(self, timeout=None):
+        '''Wait for all channels to connect, then run the deferred calls
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Defaults to the timeout the manager was created with
+
+        Returns
+        -------
+        connected : bool
+            All channels connected
+
+        Raises
+        ------
+        TimeoutError
+            If channels failed to connect and raise_on_failure is set
+        '''
+        if timeout is None:
+            timeout = self.timeout
+
+        t0 = time.time()
+        for info in self._pvs.values():
+            pv = info[0]
+            if not pv.connected:
+                remaining = timeout - (time.time() - t0)
+                pv.wait_for_connection(timeout=max(remaining, 1e-3))
+
+            if len(info) > 3:
+                try:
+                    pv.connection_callbacks.remove(info.pop())
+                except ValueError:
+                    pass
+
+            if pv.connected and info[2] is None:
+                info[2] = time.time() - self._t0
+
+        failed = self.failed
+        for owner, pvnames in failed.items():
+            logger.warning('%s: %d channel(s) failed to connect: %s' %
+                           (self._owner_name(owner), len(pvnames),
+                            ', '.join(pvnames)))
+
+        deferred, self._deferred = self._deferred, []
+        for owner, fcn, args, kwargs in deferred:
+            if owner in failed:
+                logger.debug('%s: skipping %s' % (self._owner_name(owner),
+                                                  fcn))
+                continue
+
+            try:
+                fcn(*args, **kwargs)
+            except Exception as ex:
+                logger.error('%s: %s failed' % (self._owner_name(owner), fcn),
+                             exc_info=ex)
+
+        logger.debug('%d channels of %d devices connected in %.3f sec '
+                     '(%d failed)' % (len(self._pvs), len(self.owners),
+                                      time.time() - self._t0, len(failed)))
+
+        if failed and self.raise_on_failure:
+            raise TimeoutError('%d channel(s) failed to connect' %
+                               sum(len(pvnames)
+                                   for pvnames in failed.values()))
+
+        return not failed
+
+    @staticmethod
+    def _owner_name(owner):
+        return getattr(owner, 'name', None) or repr(owner)
+
+    @property
+    def owners(self):
+        '''Devices (and lone signals) in order of creation'''
+        owners = []
+        for info in self._pvs.values():
+            if info[1] not in owners:
+                owners.append(info[1])
+        return owners
+
+    @property
+    def failed(self):
+        '''Unconnected PV names, keyed by owner'''
+        failed = OrderedDict()
+        for pvname, info in self._pvs.items():
+            if not info[0].connected:
+                failed.setdefault(info[1], []).append(pvname)
+        return failed
+
+    @property
+    def connection_times(self):
+        '''Time for all channels of a device to connect, keyed by owner
+
+        Times are relative to the start of the context [sec]. Devices with
+        unconnected channels have a time of None.
+        '''
+        times = OrderedDict()
+        for info in self._pvs.values():
+            owner, elapsed = info[1], info[2]
+            if not info[0].connected:
+                elapsed = None
+
+            if owner not in times:
+                times[owner] = elapsed
+            elif times[owner] is not None:
+                times[owner] = (None if elapsed is None
+                                else max(times[owner], elapsed))
+
+        return times
+
+    def report(self, file=None):
+        '''Print connection times and failed channels
+
+        Parameters
+        ----------
+        file : file-like, optional
+            Defaults to sys.stdout
+        '''
+        if file is None:
+            file = sys.stdout
+
+        failed = self.failed
+        for owner, elapsed in self.connection_times.items():
+            name = self._owner_name(owner)
+            if elapsed is None:
+                print('{:<30} FAILED: {}'.format(name, ', '.join(failed[owner])),
+                      file=file)
+            else:
+                print('{:<30} {:.3f} sec'.format(name, elapsed), file=file)
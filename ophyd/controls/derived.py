@@ -0,0 +1,226 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.derived` - Derived signals
+==============================================
+
+.. module:: ophyd.control.derived
+   :synopsis: Signals calculated from other signals
+'''
+
+from __future__ import print_function
+import logging
+import threading
+import time
+
+import numpy as np
+
+from ..utils import ReadOnlyError
+from .signal import (Signal, EpicsSignal)
+
+
+logger = logging.getLogger(__name__)
+
+
+class DerivedSignal(Signal):
+    '''A read-only signal calculated from the values of other signals
+
+    The value is only recalculated when one of the sources has changed
+    since the last calculation; until then, the last result is returned.
+    Sources which do not report their changes (EPICS signals which are not
+    monitored, or derived signals calculated from them) cause a
+    recalculation on every get().
+
+    Like any signal, derived signals can be added to signal groups and
+    detectors, and are read along with the other signals::
+
+        i0 = EpicsSignal('XF:23ID1-ES{Sclr:1}.S2', name='i0')
+        det = EpicsSignal('XF:23ID1-ES{Sclr:1}.S3', name='det')
+        norm = DerivedSignal([det, i0], lambda det, i0: det / i0,
+                             name='det_norm')
+
+    Parameters
+    ----------
+    sources : sequence of Signal
+        The input signals
+    fcn : callable
+        Called with the values of the sources, in order, returning the value
+        of the derived signal. To use :meth:`from_history`, it should work
+        on numpy arrays as well.
+
+    Other keyword arguments are passed on to the base class (Signal)
+    initializer
+    '''
+
+    def __init__(self, sources, fcn, **kwargs):
+        Signal.__init__(self, **kwargs)
+
+        self._sources = list(sources)
+        self._fcn = fcn
+        self._dirty = True
+        self._source_ts = None
+        self._timestamp = None
+        # Guards _dirty and the timestamps, which are updated from the
+        # monitor threads of the sources as well as by callers of get()
+        self._lock = threading.Lock()
+        # Serializes recalculations
+        self._update_lock = threading.RLock()
+        self._watching = False
+
+    def _watch_sources(self):
+        '''Subscribe to the sources, on first use so that the channels of
+        lazy EPICS sources are not created along with the derived signal'''
+        with self._update_lock:
+            if self._watching:
+                return
+
+            self._watching = True
+            for source in self._sources:
+                source.subscribe(self._source_changed,
+                                 event_type=source.SUB_VALUE, run=False)
+
+    def subscribe(self, cb, event_type=None, run=True, **kwargs):
+        '''Subscribe to events of this signal, watching the sources first
+
+        See :meth:`OphydObject.subscribe`
+        '''
+        self._watch_sources()
+        return Signal.subscribe(self, cb, event_type=event_type, run=run,
+                                **kwargs)
+
+    @property
+    def sources(self):
+        '''The input signals'''
+        return list(self._sources)
+
+    def _source_changed(self, timestamp=None, **kwargs):
+        '''Value callback of the sources'''
+        with self._lock:
+            self._dirty = True
+            if timestamp is not None and (self._source_ts is None or
+                                          timestamp > self._source_ts):
+                self._source_ts = timestamp
+
+        # Subscribers to the derived value are notified right away
+        if self._subs and self._subs.get(self.SUB_VALUE):
+            self._update()
+
+    def _polled(self):
+        '''Any of the sources, or of their sources, does not report
+        changes'''
+        for source in self._sources:
+            if isinstance(source, DerivedSignal):
+                if source._polled():
+                    return True
+                continue
+            elif not isinstance(source, EpicsSignal):
+                continue
+
+            # Not through _read_pv, which would create the channels of lazy
+            # signals. Without a channel, there is no monitor either.
+            pv = source._read_pv_obj
+            if pv is None or not pv.auto_monitor:
+                return True
+
+        return False
+
+    def _update(self):
+        '''Recalculate the value from the sources'''
+        with self._update_lock:
+            # Changes coming in during the calculation mark it dirty again
+            with self._lock:
+                self._dirty = False
+                timestamp = self._source_ts
+
+            values = [source.get() for source in self._sources]
+            value = self._fcn(*values)
+
+            if timestamp is None:
+                timestamp = time.time()
+
+            with self._lock:
+                self._timestamp = timestamp
+
+            self._set_readback(value, timestamp=timestamp)
+
+    def invalidate(self):
+        '''Recalculate the value on the next get()'''
+        with self._lock:
+            self._dirty = True
+
+    def get(self):
+        '''The value, recalculated if any of the sources have changed'''
+        self._watch_sources()
+
+        with self._lock:
+            dirty = self._dirty
+
+        if dirty or self._polled():
+            self._update()
+
+        return self._readback
+
+    def put(self, value, **kwargs):
+        raise ReadOnlyError('Derived signals are read-only')
+
+    @property
+    def timestamp(self):
+        '''The latest timestamp of the sources at the last calculation'''
+        self.get()
+        return self._timestamp
+
+    def read(self):
+        '''Read the signal for data acquisition
+
+        Returns
+        -------
+        dict
+            {name: {'value': value, 'timestamp': timestamp}}
+        '''
+        value = self.get()
+        return {self.name: {'value': value,
+                            'timestamp': self._timestamp}}
+
+    def describe(self):
+        '''Return the description as a dictionary'''
+        names = ', '.join(source.name for source in self._sources)
+        return {self.name: {'source': 'DERIVED:{}'.format(names),
+                            'shape': []}}
+
+    def from_history(self, start=None, stop=None):
+        '''Apply the function to the value histories of the sources
+
+        All sources need a history (see :meth:`Signal.enable_history`).
+        The timestamps of the first source are used; the other sources are
+        sampled at those times with the last value at or before each of
+        them. The function is called once, with numpy arrays.
+
+        Parameters
+        ----------
+        start : float, optional
+            Start time
+        stop : float, optional
+            Stop time
+
+        Returns
+        -------
+        timestamps : np.ndarray
+        values : np.ndarray
+        '''
+        histories = [source.history for source in self._sources]
+        if any(history is None for history in histories):
+            raise ValueError('All sources need a value history')
+
+        timestamps, first = histories[0].window(start=start, stop=stop)
+
+        samples = []
+        valid = np.ones(len(timestamps), dtype=bool)
+        for history in histories[1:]:
+            ts, values = history.last()
+            idx = np.searchsorted(ts, timestamps, side='right') - 1
+            valid &= (idx >= 0)
+            samples.append((idx, values))
+
+        # Times before all sources have a value are left out
+        arrays = [first[valid]]
+        arrays.extend(values[idx[valid]] for idx, values in samples)
+        return timestamps[valid], self._fcn(*arrays)
@@ -9,15 +9,23 @@
 
 from __future__ import print_function
 from .signal import (Signal, SignalGroup)
+from .status import StatusBase
 
 
-class DetectorStatus(object):
-    def __init__(self, detector):
-        self.done = False
+class DetectorStatus(StatusBase):
+    '''Acquisition status of a detector
+
+    Parameters
+    ----------
+    detector : Detector
+
+    Other keyword arguments are passed on to the base class (StatusBase)
+    initializer
+    '''
+    def __init__(self, detector, **kwargs):
         self.detector = detector
 
-    def _finished(self, **kwargs):
-        self.done = True
+        StatusBase.__init__(self, **kwargs)
 
 
 class Detector(object):
@@ -56,7 +64,7 @@ class Detector(object):
         DetectorStatus : Object to tell if detector has finished acquiring
         '''
         status = DetectorStatus(self)
-        status.done = True
+        status._finished(success=True)
         return status
 
     def read(self, **kwargs):
@@ -73,6 +81,8 @@ class SignalDetector(SignalGroup, Detector):
     SUB_ACQ_DONE = 'acq_done'  # requested acquire
     SUB_ACQ_DONE_DARK = 'acq_done'  # requested acquire
 
+    _uncached_subs = frozenset([SUB_ACQ_DONE])
+
     def __init__(self, signal=None, *args, **kwargs):
         super(SignalDetector, self).__init__(*args, **kwargs)
         self._acq_signal = None
@@ -0,0 +1,332 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.flyscan` - Fly scans
+========================================
+
+.. module:: ophyd.control.flyscan
+   :synopsis: Continuous motion scans, recording the motor readback and
+       detector signals as they stream in
+'''
+
+from __future__ import print_function
+import logging
+
+import numpy as np
+
+from .signal import SignalGroup
+from ..utils import TimeoutError
+from ..utils.history import History
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['FlyScan',
+           ]
+
+
+class FlyScan(object):
+    '''A continuous move of an EPICS motor, recording what happens on the way
+
+    Rather than stepping, moving, settling and reading at each point, the
+    motor makes a single move from `start` to `stop`. Its readback and the
+    detector signals are recorded from their monitors into time-stamped
+    buffers (see :class:`ophyd.utils.history.History`). :meth:`bin` then
+    reduces the data to one event per position bin::
+
+        scan = FlyScan(m1, 0.0, 10.0, velocity=0.5, detectors=[i0, det])
+        scan.run()
+        events = scan.bin(100)
+
+    Detectors need to update on their own during the move, e.g. a scaler
+    in auto count mode or a detector acquiring continuously.
+
+    Parameters
+    ----------
+    motor : EpicsMotor
+    start : float
+        Where the motor is moved to before the scan
+    stop : float
+        Where the scan ends
+    velocity : float, optional
+        Speed during the scan (VELO). Defaults to the current speed.
+    acceleration : float, optional
+        Acceleration time during the scan (ACCL). Defaults to the current
+        one.
+    detectors : sequence of Signal or SignalGroup, optional
+        The signals to record. Of signal groups (and detectors), the
+        recordable signals are recorded.
+    capacity : int, optional
+        Samples kept for the readback and for each signal. Older samples are
+        dropped once a buffer is full.
+
+    Attributes
+    ----------
+    readbacks : History
+        The motor readback
+    data : dict
+        A History of each signal, keyed by signal name
+    status : MoveStatus
+        The status of the move of the scan, once started
+    edges : np.ndarray or None
+        The bin edges of the last :meth:`bin`
+    events : list of dict or None
+        The events of the last :meth:`bin`
+    '''
+
+    def __init__(self, motor, start, stop, velocity=None, acceleration=None,
+                 detectors=None, capacity=100000):
+        self.motor = motor
+        self.start = start
+        self.stop = stop
+        self.velocity = velocity
+        self.acceleration = acceleration
+
+        self.signals = []
+        for det in (detectors or []):
+            if isinstance(det, SignalGroup):
+                self.signals.extend(sig for sig in det.signals
+                                    if sig.recordable)
+            else:
+                self.signals.append(det)
+
+        self.readbacks = History(capacity)
+        self.data = dict((sig.name, History(capacity))
+                         for sig in self.signals)
+        self.status = None
+        self.edges = None
+        self.events = None
+
+        self._subscriptions = []
+        self._restore = []
+
+    def __repr__(self):
+        return ('{0}(motor={1.motor.name!r}, start={1.start!r}, '
+                'stop={1.stop!r}, velocity={1.velocity!r}, '
+                'samples={2})'.format(self.__class__.__name__, self,
+                                      len(self.readbacks)))
+
+    def _recorder(self, history):
+        def record(value=None, timestamp=None, **kwargs):
+            try:
+                history.append(timestamp, value)
+            except (TypeError, ValueError):
+                pass
+
+        return record
+
+    def _subscribe(self, signal, history):
+        cb = self._recorder(history)
+        signal.subscribe(cb, event_type=signal.SUB_VALUE, run=False)
+        self._subscriptions.append((signal, cb))
+
+    def _set(self, signal, value):
+        '''Set a motor parameter for the scan, restoring it afterwards'''
+        if value is None:
+            return
+
+        self._restore.append((signal, signal.get()))
+        signal.put(value, wait=True)
+
+    def start_scan(self, timeout=30.0):
+        '''Move to the start position and start the scan
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time for the move to the start position [sec]
+
+        Returns
+        -------
+        status : MoveStatus
+            Finishes at the end of the scan
+        '''
+        motor = self.motor
+        motor.move(self.start, wait=True, timeout=timeout)
+
+        self.readbacks.clear()
+        for history in self.data.values():
+            history.clear()
+
+        self._set(motor._velocity, self.velocity)
+        self._set(motor._acceleration, self.acceleration)
+
+        readback = motor._user_readback
+        self._subscribe(readback, self.readbacks)
+        for sig in self.signals:
+            self._subscribe(sig, self.data[sig.name])
+
+        # The starting point, in case the first update is a while away
+        self.readbacks.append(readback.timestamp, readback.get())
+
+        self.status = motor.move(self.stop, wait=False)
+        if self.status is not None:
+            self.status.add_callback(self._finish)
+
+        return self.status
+
+    def _finish(self, status=None):
+        '''Stop recording, and restore the motor parameters
+
+        Runs from the completion callback of the move, so the parameters
+        are restored without waiting on the puts.
+        '''
+        for signal, cb in self._subscriptions:
+            signal.clear_sub(cb)
+
+        del self._subscriptions[:]
+
+        for signal, value in reversed(self._restore):
+            try:
+                signal.put(value, wait=False)
+            except Exception as ex:
+                logger.error('Failed to restore %s' % signal.name,
+                             exc_info=ex)
+
+        del self._restore[:]
+
+    def run(self, timeout=None):
+        '''Run the scan, waiting for it to finish
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time for the scan move [sec]. Defaults to waiting until the
+            move finishes.
+
+        Raises
+        ------
+        TimeoutError
+            If the scan did not finish in time
+        RuntimeError
+            If the move did not complete (e.g., it was stopped or hit a
+            limit). The exception of the move status is raised instead, if
+            set.
+
+        On any error while starting or waiting for the scan (including
+        KeyboardInterrupt), the motor is stopped and its parameters are
+        restored.
+        '''
+        try:
+            status = self.start_scan()
+            if status is None:
+                # The move was interrupted (see EpicsMotor.move)
+                raise RuntimeError('Fly scan of %s was not started' %
+                                   self.motor.name)
+
+            if not status.wait(timeout) and not status.done:
+                raise TimeoutError('Fly scan of %s did not finish in %s s' %
+                                   (self.motor.name, timeout))
+        except BaseException:
+            self.motor.stop()
+            self._finish()
+            raise
+
+        if not status.success:
+            if status.exception is not None:
+                raise status.exception
+
+            raise RuntimeError('Fly scan of %s did not complete (%s)' %
+                               (self.motor.name, status))
+
+        return self
+
+    def edge_times(self, edges):
+        '''When the motor crossed each of the given positions
+
+        Parameters
+        ----------
+        edges : array-like
+            Positions, in the direction of the scan
+
+        Returns
+        -------
+        times : np.ndarray
+            nan for positions which were not crossed
+        '''
+        timestamps, positions = self.readbacks.last()
+        edges = np.asarray(edges, dtype=float)
+
+        if len(positions) < 2:
+            return np.nan * np.ones(len(edges))
+
+        # Interpolate in the direction of motion, ignoring any overshoot
+        sign = 1.0 if self.stop >= self.start else -1.0
+        positions = np.maximum.accumulate(sign * positions)
+        return np.interp(sign * edges, positions, timestamps,
+                         left=np.nan, right=np.nan)
+
+    def bin(self, bins=None, edges=None):
+        '''Reduce the recorded data to one event per position bin
+
+        The value of each signal in a bin is the mean of its samples taken
+        while the motor was in the bin. Without any samples in the bin, the
+        last value before the end of the bin is used.
+
+        Parameters
+        ----------
+        bins : int, optional
+            Number of equal bins from start to stop
+        edges : array-like, optional
+            The bin edges, in the direction of the scan, instead of `bins`
+
+        Returns
+        -------
+        events : list of dict
+            As read() of the motor and signals, with the bin centers as the
+            motor position, and the time the motor was in the middle of the
+            bin as timestamps. Bins the motor did not get through are left
+            out. Also kept as `events`, with the edges as `edges`.
+        '''
+        if edges is None:
+            if bins is None:
+                raise ValueError('Number of bins or bin edges required')
+
+            edges = np.linspace(self.start, self.stop, int(bins) + 1)
+
+        edges = np.asarray(edges, dtype=float)
+        times = self.edge_times(edges)
+        valid = np.isfinite(times[:-1]) & np.isfinite(times[1:])
+
+        centers = (edges[:-1] + edges[1:]) / 2.
+        mid_times = self.edge_times(centers)
+        valid &= np.isfinite(mid_times)
+
+        columns = {}
+        for name, history in self.data.items():
+            columns[name] = self._bin_signal(history, times)
+
+        motor_name = self.motor.name
+        events = []
+        for i in np.flatnonzero(valid):
+            ts = mid_times[i]
+            event = {motor_name: {'value': centers[i], 'timestamp': ts}}
+            for name, values in columns.items():
+                event[name] = {'value': values[i], 'timestamp': ts}
+
+            events.append(event)
+
+        self.edges = edges
+        self.events = events
+        return events
+
+    @staticmethod
+    def _bin_signal(history, times):
+        '''Mean of the samples between consecutive times'''
+        timestamps, values = history.last()
+        bins = len(times) - 1
+        if not len(values):
+            return np.nan * np.ones(bins)
+
+        # Bins which were not crossed get no samples
+        times = np.where(np.isfinite(times), times, -np.inf)
+        idx = np.searchsorted(timestamps, times, side='left')
+
+        sums = np.concatenate(([0.0], np.cumsum(values)))
+        counts = np.diff(idx)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.diff(sums[idx]) / counts
+
+        # Sample and hold without samples in the bin
+        hold = idx[1:] - 1
+        held = np.where(hold >= 0, values[np.maximum(hold, 0)], np.nan)
+        return np.where(counts > 0, means, held)
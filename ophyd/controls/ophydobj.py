@@ -12,6 +12,9 @@ from __future__ import print_function
 import time
 
 from ..session import register_object
+from ..utils.dispatch import (QueuedCallback, RateLimitedCallback,
+                              DeadbandCallback, CallbackWrapper,
+                              unwrap_callback, OVERFLOW_DROP_OLDEST)
 
 
 class OphydObject(object):
@@ -34,22 +37,58 @@ class OphydObject(object):
     ----------
     name
     alias
+
+    .. note:: Subclasses which do not define __slots__ get an instance
+        __dict__ as usual. The subscription containers are only allocated
+        once they are needed.
     '''
 
+    __slots__ = ('_name', '_alias', '_subs', '_sub_cache',
+                 '_session', '_ses_logger', '__weakref__')
+
     _default_sub = None
 
+    # Subscription types whose last event is not kept for replaying to new
+    # subscribers (e.g., one-shot completion events which are always
+    # subscribed to with run=False)
+    _uncached_subs = frozenset()
+
+    # CallbackTimer recording the run time of every callback, if enabled
+    # (see SessionManager.enable_callback_timing)
+    _callback_timer = None
+
     def __init__(self, name=None, alias=None, register=True):
         self._name = name
         self._alias = alias
 
-        self._subs = dict((getattr(self, sub), []) for sub in dir(self)
-                          if sub.startswith('SUB_') or sub.startswith('_SUB_'))
-        self._sub_cache = {}
+        # Allocated on the first subscription / event, respectively
+        self._subs = None
+        self._sub_cache = None
+        self._session = None
         self._ses_logger = None
 
         if register:
             self._register()
 
+    @classmethod
+    def _get_sub_types(cls):
+        '''All subscription types of the class
+
+        These are the values of the class attributes named SUB_* or _SUB_*.
+        They are looked up once per class and cached.
+        '''
+        try:
+            # Look only at this class; a subclass may add its own types
+            return cls.__dict__['_sub_type_cache']
+        except KeyError:
+            pass
+
+        sub_types = tuple(set(getattr(cls, attr) for attr in dir(cls)
+                              if attr.startswith('SUB_') or
+                              attr.startswith('_SUB_')))
+        cls._sub_type_cache = sub_types
+        return sub_types
+
     def _run_sub(self, cb, *args, **kwargs):
         '''Run a single subscription callback
 
@@ -59,6 +98,15 @@ class OphydObject(object):
             The callback
         '''
 
+        # Wrapped callbacks (executor, max_rate) are timed when the wrapper
+        # runs the callback itself, not when the event is handed to it
+        timer = self._callback_timer
+        if timer is not None and isinstance(cb, CallbackWrapper):
+            timer = None
+
+        if timer is not None:
+            t0 = time.time()
+
         try:
             cb(*args, **kwargs)
         except Exception as ex:
@@ -66,6 +114,9 @@ class OphydObject(object):
             self._ses_logger.error('Subscription %s callback exception (%s)' %
                                    (sub_type, self), exc_info=ex)
 
+        if timer is not None:
+            timer.record(self, kwargs.get('sub_type'), cb, time.time() - t0)
+
     def _run_cached_sub(self, sub_type, cb):
         '''Run a single subscription callback using the most recent
         cached arguments
@@ -80,7 +131,7 @@ class OphydObject(object):
 
         try:
             args, kwargs = self._sub_cache[sub_type]
-        except KeyError as ex:
+        except (KeyError, TypeError) as ex:
             # This can be called before the cache is even created,
             # so we don't think this is actually a problem.
             # TODO: Reflect on this in a peaceful silence.
@@ -112,14 +163,25 @@ class OphydObject(object):
         if 'timestamp' in kwargs and kwargs['timestamp'] is None:
             kwargs['timestamp'] = time.time()
 
-        # Shallow-copy the callback arguments for replaying the
-        # callback at a later time (e.g., when a new subscription is made)
-        self._sub_cache[sub_type] = (tuple(args), dict(kwargs))
+        # Keep the callback arguments for replaying the callback at a later
+        # time (e.g., when a new subscription is made). args and kwargs
+        # belong to this call alone, and callbacks only ever see copies of
+        # them, so they are stored as-is.
+        if sub_type not in self._uncached_subs:
+            if self._sub_cache is None:
+                self._sub_cache = {}
+            self._sub_cache[sub_type] = (args, kwargs)
+
+        if self._subs is None:
+            return
 
         for cb in self._subs[sub_type]:
             self._run_sub(cb, *args, **kwargs)
 
-    def subscribe(self, cb, event_type=None, run=True):
+    def subscribe(self, cb, event_type=None, run=True, executor=None,
+                  max_queue=100, overflow=OVERFLOW_DROP_OLDEST,
+                  max_rate=None, coalesce=True, deadband=None,
+                  rel_deadband=None):
         '''Subscribe to events this signal group emits
 
         See also :func:`clear_sub`
@@ -134,21 +196,87 @@ class OphydObject(object):
             defaults to SignalGroup._default_sub)
         run : bool, optional
             Run the callback now
+        executor : CallbackExecutor, optional
+            Run the callback from the executor's worker threads instead of
+            the thread generating the event. Use this for slow callbacks
+            (plotting, logging) so that they do not hold up other
+            subscribers.
+        max_queue : int, optional
+            With an executor, the maximum number of pending events for this
+            callback
+        overflow : {'drop_oldest', 'drop_newest', 'block'}, optional
+            With an executor, what to do when the callback's queue is full
+        max_rate : float, optional
+            Run the callback at most this many times per second. Useful for
+            displays of high-rate monitors.
+        coalesce : bool, optional
+            With max_rate, deliver the most recent of the events which came
+            in too quickly once the rate allows it. If not set, those events
+            are dropped.
+        deadband : float, optional
+            Run the callback only when the value of the event has changed by
+            more than this since the callback last ran. Other subscribers
+            are not affected.
+        rel_deadband : float, optional
+            As deadband, relative to the value the callback last ran with
+            (e.g., 0.01 for 1%). If both are set, the larger threshold
+            applies.
         '''
         if event_type is None:
             event_type = self._default_sub
 
-        try:
-            self._subs[event_type].append(cb)
-        except KeyError:
+        if self._subs is None:
+            self._subs = dict((sub, []) for sub in self._get_sub_types())
+
+        if event_type not in self._subs:
             raise KeyError('Unknown event type: %s' % event_type)
 
+        runner = self._run_sub
+        if executor is not None:
+            cb = QueuedCallback(cb, executor, max_queue=max_queue,
+                                overflow=overflow, runner=runner)
+            # Queueing an event never fails
+            runner = None
+
+        if max_rate is not None:
+            cb = RateLimitedCallback(cb, max_rate, coalesce=coalesce,
+                                     runner=runner)
+            runner = None
+
+        # Filtered first, so that events within the deadband are neither
+        # queued nor counted against the rate
+        if deadband is not None or rel_deadband is not None:
+            cb = DeadbandCallback(cb, deadband=deadband,
+                                  rel_deadband=rel_deadband, runner=runner)
+
+        self._subs[event_type].append(cb)
+
         if run:
             self._run_cached_sub(event_type, cb)
 
     def _reset_sub(self, event_type):
         '''Remove all subscriptions in an event type'''
-        del self._subs[event_type][:]
+        if self._subs is None:
+            return
+
+        cbs = self._subs[event_type]
+        for cb in cbs:
+            if isinstance(cb, CallbackWrapper):
+                cb.close()
+
+        del cbs[:]
+
+    def _remove_sub(self, event_type, cb):
+        '''Remove a single subscription, which may be wrapped'''
+        cbs = self._subs[event_type] if self._subs is not None else []
+        for i, sub in enumerate(cbs):
+            if sub == cb or unwrap_callback(sub) == cb:
+                del cbs[i]
+                if isinstance(sub, CallbackWrapper):
+                    sub.close()
+                return
+
+        raise ValueError('%s is not subscribed to %s' % (cb, event_type))
 
     def clear_sub(self, cb, event_type=None):
         '''Remove a subscription, given the original callback function
@@ -164,13 +292,13 @@ class OphydObject(object):
             types)
         '''
         if event_type is None:
-            for event_type, cbs in self._subs.items():
+            for event_type in (self._subs or {}):
                 try:
-                    cbs.remove(cb)
+                    self._remove_sub(event_type, cb)
                 except ValueError:
                     pass
         else:
-            self._subs[event_type].remove(cb)
+            self._remove_sub(event_type, cb)
 
     def _register(self):
         '''Register this object with the session'''
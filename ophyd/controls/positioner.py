@@ -9,6 +9,7 @@
 
 from __future__ import print_function
 import logging
+import threading
 import time
 import warnings
 import numpy as np
@@ -16,13 +17,18 @@ import numpy as np
 from epics.pv import fmt_time
 
 from .signal import (EpicsSignal, SignalGroup)
+from .status import StatusBase
+from .trajectory import Trajectory
+from .flyscan import FlyScan
+from .connection import run_when_connected
 from ..utils import TimeoutError
+from ..utils.history import History
 from ..utils.epics_pvs import record_field
 
 logger = logging.getLogger(__name__)
 
 
-class MoveStatus(object):
+class MoveStatus(StatusBase):
     '''Asynchronous movement status
 
     Parameters
@@ -35,6 +41,9 @@ class MoveStatus(object):
     start_ts : float, optional
         The motion start timestamp
 
+    Other keyword arguments are passed on to the base class (StatusBase)
+    initializer
+
     Attributes
     ----------
     pos : Positioner
@@ -53,18 +62,16 @@ class MoveStatus(object):
     '''
 
     def __init__(self, positioner, target, done=False,
-                 start_ts=None):
-        if start_ts is None:
-            start_ts = time.time()
-
+                 start_ts=None, **kwargs):
         self.pos = positioner
         self.target = target
-        self.done = False
-        self.success = False
-        self.start_ts = start_ts
-        self.finish_ts = None
         self.finish_pos = None
 
+        StatusBase.__init__(self, start_ts=start_ts, **kwargs)
+
+        if done:
+            self._finished(success=True)
+
     @property
     def error(self):
         if self.finish_pos is not None:
@@ -78,24 +85,10 @@ class MoveStatus(object):
             return None
 
     def _finished(self, success=True, **kwargs):
-        self.done = True
-        self.success = success
-        self.finish_ts = kwargs.get('timestamp', time.time())
-        self.finish_pos = self.pos.position
-
-    @property
-    def elapsed(self):
-        if self.finish_ts is None:
-            return time.time() - self.start_ts
-        else:
-            return self.finish_ts - self.start_ts
-
-    def __str__(self):
-        return '{0}(done={1.done}, elapsed={1.elapsed:.1f}, ' \
-               'success={1.success})'.format(self.__class__.__name__,
-                                             self)
+        if not self.done:
+            self.finish_pos = self.pos.position
 
-    __repr__ = __str__
+        StatusBase._finished(self, success=success, **kwargs)
 
 
 class Positioner(SignalGroup):
@@ -109,17 +102,24 @@ class Positioner(SignalGroup):
     SUB_READBACK = 'readback'
     _SUB_REQ_DONE = '_req_done'  # requested move finished subscription
 
+    _uncached_subs = frozenset([_SUB_REQ_DONE])
+
+    # Blocking moves wake up on changes of the motion state, and check it
+    # at least this often in case a change goes unreported [sec]
+    _move_poll_interval = 0.05
+
     def __init__(self, *args, **kwargs):
         SignalGroup.__init__(self, *args, **kwargs)
 
         self._started_moving = False
         self._moving = False
+        self._motion_event = threading.Event()
         self._default_sub = None
         self._position = None
         self._timeout = kwargs.get('timeout', 0.0)
         self._trajectory = None
-        self._trajectory_idx = None
-        self._followed = []
+        self._history = None
+        self._history_ts = None
         self._egu = kwargs.get('egu', '')
 
     def set_trajectory(self, traj):
@@ -127,11 +127,20 @@ class Positioner(SignalGroup):
 
         Parameters
         ----------
-        traj : iterable
-            Sequence of positions to follow
+        traj : Trajectory or iterable
+            Sequence of positions to follow. Iterators without a length
+            (e.g., generators) are followed lazily.
         '''
-        self._trajectory = iter(traj)
-        self._followed = []
+        if not isinstance(traj, Trajectory):
+            traj = Trajectory(traj)
+
+        self._trajectory = traj
+
+    @property
+    def trajectory(self):
+        '''The trajectory being followed, with the readbacks recorded at each
+        point so far'''
+        return self._trajectory
 
     @property
     def egu(self):
@@ -157,20 +166,36 @@ class Positioner(SignalGroup):
             raise ValueError('Trajectory unset')
 
         try:
-            next_pos = next(self._trajectory)
+            return next(self._trajectory)
         except StopIteration:
             return None
 
-        self._followed.append(next_pos)
-        return next_pos
-
     def move_next(self, **kwargs):
-        '''Move to the next point in the trajectory'''
+        '''Move to the next point in the trajectory
+
+        The position reached is recorded in the trajectory once the move
+        has finished. Moves which did not complete (e.g., interrupted by the
+        next move) record nan.
+        '''
         pos = self.next_pos
         if pos is None:
             raise StopIteration('End of trajectory')
 
+        trajectory = self._trajectory
+        index = trajectory.index - 1
+
         ret = self.move(pos, **kwargs)
+
+        if isinstance(ret, StatusBase):
+            def moved(status):
+                readback = self.position if status.success else np.nan
+                trajectory.record(index, readback,
+                                  timestamp=status.finish_ts)
+
+            ret.add_callback(moved)
+        else:
+            trajectory.record(index, self.position)
+
         return pos, ret
 
     def move(self, position, wait=True,
@@ -203,17 +228,13 @@ class Positioner(SignalGroup):
             def check_timeout():
                 return timeout is not None and (time.time() - t0) > timeout
 
-            while not self._started_moving:
-                time.sleep(0.05)
-
+            while not self._wait_motion(lambda: self._started_moving):
                 if check_timeout():
                     raise TimeoutError('Failed to move %s to %s '
                                        'in %s s (no motion)' %
                                        (self, position, timeout))
 
-            while self.moving:
-                time.sleep(0.05)
-
+            while not self._wait_motion(lambda: not self._moving_state()):
                 if check_timeout():
                     raise TimeoutError('Failed to move %s to %s in %s s' %
                                        (self, position, timeout))
@@ -229,8 +250,35 @@ class Positioner(SignalGroup):
 
             return status
 
+    def _wait_motion(self, condition):
+        '''Wait for a change in the motion state, unless condition() holds
+
+        Returns
+        -------
+        bool
+            condition(), after waiting at most _move_poll_interval
+        '''
+        # Cleared before checking, so that a change in between is not missed
+        self._motion_event.clear()
+        if condition():
+            return True
+
+        self._motion_event.wait(self._move_poll_interval)
+        return condition()
+
+    def _motion_changed(self):
+        '''Wake up blocking moves to check the motion state'''
+        self._motion_event.set()
+
+    def _moving_state(self):
+        '''Whether or not the positioner is moving, as checked by blocking
+        moves. Positioners which track it with monitors return that state
+        instead of reading it.'''
+        return self.moving
+
     def _done_moving(self, timestamp=None, value=None, **kwargs):
         '''Call when motion has completed.  Runs SUB_DONE subscription.'''
+        self._motion_changed()
 
         self._run_subs(sub_type=self.SUB_DONE, timestamp=timestamp,
                        value=value, **kwargs)
@@ -256,14 +304,113 @@ class Positioner(SignalGroup):
         '''
         return self._position
 
-    def _set_position(self, value, **kwargs):
-        '''Set the current internal position, run the readback subscription'''
+    def _set_position(self, value, history_ts=None, **kwargs):
+        '''Set the current internal position, run the readback subscription
+
+        Parameters
+        ----------
+        value : float
+            The position
+        history_ts : float, optional
+            The timestamp of the position in the history, if it differs from
+            the one passed to the readback subscription (e.g., the IOC
+            timestamp of the readback)
+        '''
         self._position = value
 
-        timestamp = kwargs.pop('timestamp', time.time())
+        timestamp = kwargs.pop('timestamp', None)
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self._history is not None:
+            if history_ts is None:
+                history_ts = timestamp
+            self._record_history(history_ts, value)
+
         self._run_subs(sub_type=self.SUB_READBACK, timestamp=timestamp,
                        value=value, **kwargs)
 
+    def _record_history(self, timestamp, value):
+        # Keep the history sorted in time, for binary searches
+        if self._history_ts is not None and timestamp < self._history_ts:
+            logger.debug('%s: position at %s out of order' %
+                         (self.name, timestamp))
+            return
+
+        try:
+            self._history.append(timestamp, value)
+        except (TypeError, ValueError):
+            logger.debug('Position %r not added to history' % (value, ))
+        else:
+            self._history_ts = timestamp
+
+    def enable_history(self, capacity=10000):
+        '''Keep a history of the readback positions
+
+        Positions are recorded as they are reported (see SUB_READBACK).
+        For EPICS positioners, they are recorded with the timestamp of the
+        readback according to EPICS. Only positioners with scalar positions
+        are supported.
+
+        See :class:`ophyd.utils.history.History`
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of positions kept
+        '''
+        self._history_ts = None
+        self._history = History(capacity)
+
+    def disable_history(self):
+        '''Stop keeping a history of positions'''
+        self._history = None
+
+    @property
+    def history(self):
+        '''History of the readback positions, or None'''
+        return self._history
+
+    def positions_at(self, timestamps):
+        '''The positions at the given times, from the position history
+
+        Positions are linearly interpolated between readbacks. After the
+        last readback, the positioner is taken to still be there.
+
+        Parameters
+        ----------
+        timestamps : array-like
+
+        Returns
+        -------
+        positions : np.ndarray
+            nan for times before the first readback kept
+
+        Raises
+        ------
+        ValueError
+            If the position history is not enabled
+        '''
+        if self._history is None:
+            raise ValueError('Position history not enabled')
+
+        # Copies: samples appended from the monitor thread meanwhile would
+        # overwrite the oldest ones in place, unsorting the timestamps
+        hist_ts, hist_pos = self._history.snapshot()
+        timestamps = np.asarray(timestamps, dtype=float)
+        if not len(hist_ts):
+            return np.nan * np.ones(timestamps.shape)
+
+        return np.interp(timestamps, hist_ts, hist_pos,
+                         left=np.nan, right=hist_pos[-1])
+
+    def position_at(self, timestamp):
+        '''The position at a given time, from the position history
+
+        See :meth:`positions_at`
+        '''
+        return float(self.positions_at([timestamp])[0])
+
     @property
     def moving(self):
         '''Whether or not the motor is moving
@@ -301,24 +448,34 @@ class EpicsMotor(Positioner):
                                limits=True,
                                recordable=False),
                    EpicsSignal(self.field_pv('EGU'), alias='_egu',
-                               recordable=False),
+                               recordable=False, lazy=True),
                    EpicsSignal(self.field_pv('MOVN'), alias='_is_moving',
                                recordable=False),
                    EpicsSignal(self.field_pv('DMOV'), alias='_done_move',
                                recordable=False),
+                   # Never lazy: stopping must not wait on a connection
                    EpicsSignal(self.field_pv('STOP'), alias='_stop',
-                               recordable=False),
+                               recordable=False, lazy=False),
+                   EpicsSignal(self.field_pv('VELO'), alias='_velocity',
+                               recordable=False, lazy=True),
+                   EpicsSignal(self.field_pv('ACCL'), alias='_acceleration',
+                               recordable=False, lazy=True),
                    # EpicsSignal(self.field_pv('RDBD'), alias='retry_deadband'),
                    ]
 
         for signal in signals:
             self.add_signal(signal)
 
-        self._moving = bool(self._is_moving.value)
         self._done_move.subscribe(self._move_changed)
         self._user_readback.subscribe(self._pos_changed)
 
-        self._set_position(self._user_readback.value)
+        run_when_connected(self, self._read_initial_state)
+
+    def _read_initial_state(self):
+        self._moving = bool(self._is_moving.value)
+        # The history is in IOC time, as for monitor updates
+        readback = self._user_readback
+        self._set_position(readback.value, history_ts=readback.timestamp)
 
     @property
     def precision(self):
@@ -336,13 +493,34 @@ class EpicsMotor(Positioner):
 
     @property
     def moving(self):
+        '''Whether or not the motor is moving, as last reported by the
+        monitor of the done moving (DMOV) field
+
+        See :meth:`is_moving` to read it from the motor record instead
+
+        Returns
+        -------
+        moving : bool
+        '''
+        return self._moving
+
+    def is_moving(self, verify=False):
         '''Whether or not the motor is moving
 
+        Parameters
+        ----------
+        verify : bool, optional
+            Read the motion status (MOVN) from the motor record, rather than
+            using the monitored state
+
         Returns
         -------
         moving : bool
         '''
-        return bool(self._is_moving.get(use_monitor=False))
+        if verify:
+            return bool(self._is_moving.get(use_monitor=False))
+
+        return self._moving
 
     def stop(self):
         self._stop.put(1, wait=False)
@@ -358,16 +536,52 @@ class EpicsMotor(Positioner):
         '''Return a full PV from the field name'''
         return record_field(self._record, field)
 
+    def fly(self, start, stop, velocity=None, acceleration=None,
+            detectors=None, bins=None, timeout=None, **kwargs):
+        '''Run a fly scan: a single continuous move from start to stop,
+        recording the readback and detector signals on the way
+
+        See :class:`ophyd.controls.flyscan.FlyScan` for the parameters.
+
+        Parameters
+        ----------
+        bins : int, optional
+            Number of position bins to reduce the data to. The events and
+            bin edges are then available as scan.events and scan.edges.
+        timeout : float, optional
+            Time for the scan move [sec]
+
+        Returns
+        -------
+        scan : FlyScan
+            The scan with the recorded data
+        '''
+        scan = FlyScan(self, start, stop, velocity=velocity,
+                       acceleration=acceleration, detectors=detectors,
+                       **kwargs)
+        scan.run(timeout=timeout)
+
+        if bins is not None:
+            scan.bin(bins)
+
+        return scan
+
     def move(self, position, wait=True,
              **kwargs):
 
         self._started_moving = False
 
         try:
-            self._user_setpoint.put(position, wait=wait)
+            if wait:
+                self._user_setpoint.put(position, wait=True)
+                return Positioner.move(self, position, wait=True, **kwargs)
 
-            return Positioner.move(self, position, wait=wait,
-                                   **kwargs)
+            # Set up the status first, interrupting the move in progress.
+            # Otherwise a quick done-moving report for the new setpoint could
+            # be missed by the new status, or mark the old one successful.
+            status = Positioner.move(self, position, wait=False, **kwargs)
+            self._user_setpoint.put(position, wait=False)
+            return status
         except KeyboardInterrupt:
             self.stop()
 
@@ -381,7 +595,9 @@ class EpicsMotor(Positioner):
     def _pos_changed(self, timestamp=None, value=None,
                      **kwargs):
         '''Callback from EPICS, indicating a change in position'''
-        self._set_position(value)
+        # SUB_READBACK is timestamped locally; the history keeps the IOC
+        # timestamp of the readback
+        self._set_position(value, history_ts=timestamp)
 
     def _move_changed(self, timestamp=None, value=None, sub_type=None,
                       **kwargs):
@@ -400,6 +616,8 @@ class EpicsMotor(Positioner):
             self._run_subs(sub_type=self.SUB_START, timestamp=timestamp,
                            value=value, **kwargs)
 
+        self._motion_changed()
+
         if was_moving and not self._moving:
             self._done_moving(timestamp=timestamp, value=value)
 
@@ -480,7 +698,7 @@ class PVPositioner(Positioner):
 
             self._readback.subscribe(self._pos_changed)
 
-            self._set_position(self._readback.value)
+            run_when_connected(self, self._read_initial_state)
         else:
             self._setpoint.subscribe(self._pos_changed)
 
@@ -489,8 +707,9 @@ class PVPositioner(Positioner):
                                         recordable=False))
 
         if stop is not None:
+            # Never lazy: stopping must not wait on a connection
             self.add_signal(EpicsSignal(stop, alias='_stop',
-                                        recordable=False))
+                                        recordable=False, lazy=False))
 
         if done is None and not self._put_complete:
             # TODO is this exception worthy?
@@ -508,26 +727,46 @@ class PVPositioner(Positioner):
         for signal in signals:
             self.add_signal(signal)
 
+    def _read_initial_state(self):
+        # The history is in IOC time, as for monitor updates
+        readback = self._readback
+        self._set_position(readback.value, history_ts=readback.timestamp)
+
     def check_value(self, pos):
         '''Check that the position is within the soft limits'''
         self._setpoint.check_value(pos)
 
     @property
     def moving(self):
+        '''Whether or not the motor is moving, as last reported by the
+        monitor of the `done` PV (or by put completion, without one)
+
+        See :meth:`is_moving` to read the `done` PV instead
+
+        Returns
+        -------
+        bool
+        '''
+        return self._moving
+
+    def is_moving(self, verify=False):
         '''Whether or not the motor is moving
 
-        If a `done` PV is specified, it will be read directly to get the motion
-        status. If not, it determined from the internal state of PVPositioner.
+        Parameters
+        ----------
+        verify : bool, optional
+            Read the `done` PV, if specified, rather than using the monitored
+            state
 
         Returns
         -------
         bool
         '''
-        if self._done is not None:
+        if verify and self._done is not None:
             dval = self._done.get(use_monitor=False)
             return (dval != self._done_val)
-        else:
-            return self._moving
+
+        return self._moving
 
     def _move_wait_pc(self, position, **kwargs):
         '''*put complete* Move and wait until motion has completed'''
@@ -637,6 +876,8 @@ class PVPositioner(Positioner):
             self._run_subs(sub_type=self.SUB_START, timestamp=timestamp,
                            value=value, **kwargs)
 
+        self._motion_changed()
+
         if not self._put_complete:
             # In the case of put completion, motion complete
             if was_moving and not self._moving:
@@ -645,7 +886,9 @@ class PVPositioner(Positioner):
     def _pos_changed(self, timestamp=None, value=None,
                      **kwargs):
         '''Callback from EPICS, indicating a change in position'''
-        self._set_position(value)
+        # SUB_READBACK is timestamped locally; the history keeps the IOC
+        # timestamp of the readback
+        self._set_position(value, history_ts=timestamp)
 
     def stop(self):
         self._stop.put(self._stop_val, wait=False)
@@ -256,6 +256,7 @@ class PseudoPositioner(Positioner):
         moving then fire a callback (via `Positioner._done_moving`)
         '''
         real = obj
+        self._motion_changed()
 
         if real in self._real_waiting:
             self._real_waiting.remove(real)
@@ -47,14 +47,14 @@ class EpicsScaler(SignalDetector):
             sig = EpicsSignal(pv, rw=True,
                               alias='_preset{}'.format(ch),
                               name='{}_preset{}'.format(self.name, ch),
-                              recordable=False)
+                              recordable=False, lazy=True)
             self.add_signal(sig, add_property=True)
 
             pv = '{}{}'.format(record_field(record, 'G'), ch)
             sig = EpicsSignal(pv, rw=True,
                               alias='_gate{}'.format(ch),
                               name='{}_gate{}'.format(self.name, ch),
-                              recordable=False)
+                              recordable=False, lazy=True)
             self.add_signal(sig, add_property=True)
 
         self.add_acquire_signal(self._count)
@@ -10,18 +10,24 @@
 from __future__ import print_function
 
 import logging
+import threading
 import time
 
-import numpy as np
-import epics
-
 from ..utils import (ReadOnlyError, TimeoutError, LimitError)
-from ..utils.epics_pvs import (get_pv_form, waveform_to_string)
+from ..utils.history import History
+from ..utils.epics_pvs import (get_pv_form, waveform_to_string, read_array,
+                               bulk_get, bulk_put, WaveformStringCache)
 from .ophydobj import OphydObject
+from .connection import get_connection_manager
+from .backend import get_backend
+from .status import StatusBase
 
 
 logger = logging.getLogger(__name__)
 
+# Guards the creation of the channels of lazy EPICS signals
+_lazy_lock = threading.Lock()
+
 
 class Signal(OphydObject):
     '''A signal, which can have a read-write or read-only value.
@@ -37,20 +43,33 @@ class Signal(OphydObject):
         The initial setpoint value
     recordable : bool
         A flag to indicate if the signal is recordable by DAQ
+
+    To only be notified of significant changes of the value, subscribe with
+    a deadband (see :meth:`OphydObject.subscribe`).
+
+    .. note:: The attributes of signals are kept in __slots__. Other
+        attributes may still be set; the instance __dict__ holding them is
+        only allocated once the first one is set.
     '''
+    __slots__ = ('_setpoint', '_readback', '_recordable', '_separate_readback',
+                 '_history', '_setpoint_history', '__dict__')
+
     SUB_SETPOINT = 'setpoint'
     SUB_VALUE = 'value'
 
+    _default_sub = SUB_VALUE
+
     def __init__(self, separate_readback=False,
                  value=None, setpoint=None,
                  recordable=True, **kwargs):
 
-        self._default_sub = self.SUB_VALUE
         OphydObject.__init__(self, **kwargs)
 
         self._setpoint = setpoint
         self._readback = value
         self._recordable = recordable
+        self._history = None
+        self._setpoint_history = None
 
         self._separate_readback = separate_readback
 
@@ -94,8 +113,14 @@ class Signal(OphydObject):
         if not self._separate_readback:
             self._set_readback(value)
 
+        timestamp = kwargs.pop('timestamp', None)
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self._setpoint_history is not None:
+            self._record_history(self._setpoint_history, timestamp, value)
+
         if allow_cb:
-            timestamp = kwargs.pop('timestamp', time.time())
             self._run_subs(sub_type=Signal.SUB_SETPOINT,
                            old_value=old_value, value=value,
                            timestamp=timestamp, **kwargs)
@@ -121,12 +146,60 @@ class Signal(OphydObject):
         old_value = self._readback
         self._readback = value
 
+        timestamp = kwargs.pop('timestamp', None)
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self._history is not None:
+            self._record_history(self._history, timestamp, value)
+
         if allow_cb:
-            timestamp = kwargs.pop('timestamp', time.time())
             self._run_subs(sub_type=Signal.SUB_VALUE,
                            old_value=old_value, value=value,
                            timestamp=timestamp, **kwargs)
 
+    @staticmethod
+    def _record_history(history, timestamp, value):
+        try:
+            history.append(timestamp, value)
+        except (TypeError, ValueError):
+            logger.debug('Value %r not added to history' % (value, ))
+
+    def enable_history(self, capacity=1000, dtype=float, setpoint=False):
+        '''Keep a history of the values of the signal
+
+        See :class:`ophyd.utils.history.History`
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of values kept
+        dtype : np.dtype, optional
+            Data type of the values
+        setpoint : bool, optional
+            Keep a history of the setpoint values as well
+        '''
+        self._history = History(capacity, dtype=dtype)
+        if setpoint:
+            self._setpoint_history = History(capacity, dtype=dtype)
+        else:
+            self._setpoint_history = None
+
+    def disable_history(self):
+        '''Stop keeping a history of values'''
+        self._history = None
+        self._setpoint_history = None
+
+    @property
+    def history(self):
+        '''History of the readback values, or None'''
+        return self._history
+
+    @property
+    def setpoint_history(self):
+        '''History of the setpoint values, or None'''
+        return self._setpoint_history
+
     def read(self):
         '''Put the status of the signal into a simple dictionary format
         for data acquisition
@@ -178,6 +251,10 @@ class EpicsSignal(Signal):
         Check limits prior to writing value
     auto_monitor : bool, optional
         Use automonitor with epics.PV
+    lazy : bool, optional
+        Create the PVs on first use (get, put, subscribe) instead of right
+        away. Defaults to EpicsSignal._lazy_default, which can be changed
+        for the session with SessionManager.lazy_signals.
     dtype : {float, int, string}
         Defaults to float.
         This is the type that read() will be return.
@@ -185,7 +262,23 @@ class EpicsSignal(Signal):
         Round the value of this signal.
         if num_decimals < 0, round to that many decimals before the '.'
         if num_decimals > 0, round to that many decimals after the '.'
+
+    .. note:: The attributes of signals are kept in __slots__ (see
+        :class:`Signal`).
     """
+    __slots__ = ('_read_pvname', '_write_pvname', '_read_pv_obj',
+                 '_write_pv_obj', '_put_complete', '_string', '_string_cache',
+                 '_check_limits', '_rw', '_pv_kw', '_auto_monitor',
+                 '_ctrl_cache', '_dtype', '_num_decimals',
+                 '_read_converter', '_backend')
+
+    # Default for the lazy argument (see SessionManager.lazy_signals)
+    _lazy_default = False
+
+    # Control limits and precision are read from EPICS at most this often
+    # [sec]. See invalidate_ctrl_vars.
+    ctrl_ttl = 10.0
+
     def __init__(self, read_pv, write_pv=None,
                  rw=True, pv_kw={},
                  put_complete=False,
@@ -194,29 +287,34 @@ class EpicsSignal(Signal):
                  auto_monitor=None,
                  dtype=None,
                  num_decimals=None,
+                 lazy=None,
                  **kwargs):
 
         if pv_kw is None:
             pv_kw = dict()
-        self._read_pv = None
-        self._write_pv = None
+        if lazy is None:
+            lazy = self._lazy_default
+
+        self._read_pv_obj = None
+        self._write_pv_obj = None
+        self._backend = get_backend()
+        self._ctrl_cache = None
         self._put_complete = put_complete
         self._string = bool(string)
+        self._string_cache = WaveformStringCache() if string else None
         self._check_limits = bool(limits)
         self._rw = rw
         self._pv_kw = pv_kw
         self._auto_monitor = auto_monitor
 
-        if dtype is None:
-            dtype = float
-        valid_dtypes = ['float', 'int', 'str']
-        if dtype.__name__ not in valid_dtypes:
-            raise ValueError("dtype must be one of {}. You provided {"
-                             "}".format(valid_dtypes, dtype))
-        self.dtype = dtype
-        if num_decimals is None:
-            num_decimals = 'all'
-        self.num_decimals = num_decimals
+        self._dtype = float
+        self._num_decimals = 'all'
+        if dtype is not None:
+            self.dtype = dtype
+        if num_decimals is not None:
+            self.num_decimals = num_decimals
+        else:
+            self._update_read_converter()
 
         separate_readback = False
 
@@ -229,28 +327,107 @@ class EpicsSignal(Signal):
                 separate_readback = True
 
         name = kwargs.pop('name', read_pv)
-        Signal.__init__(self, separate_readback=separate_readback, name=name,
-                        **kwargs)
-
-        self._read_pv = epics.PV(read_pv, form=get_pv_form(),
-                                 callback=self._read_changed,
-                                 connection_callback=self._connected,
-                                 auto_monitor=auto_monitor,
-                                 **pv_kw)
-
-        if write_pv is not None:
-            self._write_pv = epics.PV(write_pv, form=get_pv_form(),
-                                      callback=self._write_changed,
-                                      connection_callback=self._connected,
-                                      auto_monitor=auto_monitor,
-                                      **pv_kw)
-        elif rw:
-            self._write_pv = self._read_pv
+        Signal.__init__(self, separate_readback=separate_readback,
+                        name=name, **kwargs)
+
+        self._read_pvname = read_pv
+        self._write_pvname = write_pv
+
+        if not lazy:
+            self._create_pvs()
+
+            manager = get_connection_manager()
+            if manager is not None:
+                manager.add_signal(self)
+
+    def _create_pvs(self):
+        '''Create the channels, if that has not happened yet'''
+        with _lazy_lock:
+            if self._read_pv_obj is not None:
+                return
+
+            pv_kw = dict(self._pv_kw)
+            pv_kw.update(form=get_pv_form(),
+                         connection_callback=self._connected,
+                         auto_monitor=self._auto_monitor)
+
+            backend = self._backend
+            read_pv = backend.create_pv(self._read_pvname,
+                                        callback=self._read_changed, **pv_kw)
+
+            if self._write_pvname is not None:
+                self._write_pv_obj = backend.create_pv(
+                    self._write_pvname, callback=self._write_changed, **pv_kw)
+            elif self._rw:
+                self._write_pv_obj = read_pv
+
+            self._read_pv_obj = read_pv
+
+    @property
+    def _read_pv(self):
+        '''The readback epics.PV, created on first use for lazy signals'''
+        if self._read_pv_obj is None:
+            self._create_pvs()
+        return self._read_pv_obj
+
+    @property
+    def _write_pv(self):
+        '''The setpoint epics.PV (None if read-only), created on first use
+        for lazy signals'''
+        if self._read_pv_obj is None:
+            self._create_pvs()
+        return self._write_pv_obj
+
+    @property
+    def connected(self):
+        '''The channels have been created and are connected'''
+        if self._read_pv_obj is None:
+            return False
+
+        pvs = (self._read_pv_obj, self._write_pv_obj)
+        return all(pv.connected for pv in pvs if pv is not None)
+
+    def _get_ctrl_vars(self, pv):
+        '''Control values of a PV, from the cache if not older than ctrl_ttl
+
+        Returns
+        -------
+        ctrl_vars : dict
+            As returned by epics.PV.get_ctrlvars. Empty if the PV is not
+            connected.
+        '''
+        cache = self._ctrl_cache
+        if cache is None:
+            cache = self._ctrl_cache = {}
+
+        now = time.time()
+        try:
+            timestamp, ctrl_vars = cache[pv.pvname]
+        except KeyError:
+            pass
+        else:
+            if (now - timestamp) < self.ctrl_ttl:
+                return ctrl_vars
+
+        ctrl_vars = pv.get_ctrlvars()
+        if ctrl_vars is None:
+            return {}
+
+        cache[pv.pvname] = (now, ctrl_vars)
+        return ctrl_vars
+
+    def invalidate_ctrl_vars(self):
+        '''Read the control limits and precision from EPICS on next access
+
+        This happens automatically on reconnection, and once ctrl_ttl has
+        passed. Call this after changing the limits of the record.
+        '''
+        self._ctrl_cache = None
 
     @property
     def precision(self):
         '''The precision of the read PV, as reported by EPICS'''
-        return self._read_pv.precision
+        return self._get_ctrl_vars(self._read_pv).get('precision')
 
     @property
     def setpoint_ts(self):
@@ -268,23 +445,34 @@ class EpicsSignal(Signal):
     @property
     def pvname(self):
         '''The readback PV name'''
-        try:
-            return self._read_pv.pvname
-        except AttributeError:
-            return None
+        return self._read_pvname
 
     @property
     def setpoint_pvname(self):
         '''The setpoint PV name'''
-        try:
-            return self._write_pv.pvname
-        except AttributeError:
+        if self._write_pvname is not None:
+            return self._write_pvname
+        elif self._rw:
+            return self._read_pvname
+        else:
             return None
 
+    def subscribe(self, cb, event_type=None, run=True, **kwargs):
+        '''Subscribe to events of this signal, creating the channels of a
+        lazy signal first
+
+        See :meth:`OphydObject.subscribe`
+        '''
+        if self._read_pv_obj is None:
+            self._create_pvs()
+
+        return Signal.subscribe(self, cb, event_type=event_type,
+                                run=run, **kwargs)
+
     def __repr__(self):
-        repr = ['read_pv={0._read_pv.pvname!r}'.format(self)]
-        if self._write_pv is not None:
-            repr.append('write_pv={0._write_pv.pvname!r}'.format(self))
+        repr = ['read_pv={0.pvname!r}'.format(self)]
+        if self.setpoint_pvname is not None:
+            repr.append('write_pv={0.setpoint_pvname!r}'.format(self))
 
         repr.append('rw={0._rw!r}, string={0._string!r}'.format(self))
         repr.append('limits={0._check_limits!r}'.format(self))
@@ -295,6 +483,9 @@ class EpicsSignal(Signal):
 
     def _connected(self, pvname=None, conn=None, pv=None, **kwargs):
         '''Connection callback from PyEpics'''
+        # The record may have changed while disconnected
+        self._ctrl_cache = None
+
         if conn:
             msg = '%s connected' % pvname
         else:
@@ -307,9 +498,10 @@ class EpicsSignal(Signal):
 
     @property
     def limits(self):
-        pv = self._write_pv
-        pv.get_ctrlvars()
-        return (pv.lower_ctrl_limit, pv.upper_ctrl_limit)
+        '''The control limits of the setpoint PV (low, high)'''
+        ctrl_vars = self._get_ctrl_vars(self._write_pv)
+        return (ctrl_vars.get('lower_ctrl_limit'),
+                ctrl_vars.get('upper_ctrl_limit'))
 
     @property
     def low_limit(self):
@@ -340,10 +532,34 @@ class EpicsSignal(Signal):
             raise LimitError('Value {} outside of range: [{}, {}]'
                              .format(value, low_limit, high_limit))
 
-    # TODO: monitor updates self._readback - this shouldn't be necessary
-    #       ... but, there should be a mode of operation without using
-    #           monitor updates, e.g., for large arrays
-    def get(self, as_string=None, **kwargs):
+    def get(self, as_string=None, out=None, **kwargs):
+        '''Get the readback value
+
+        For large arrays, create the signal with auto_monitor=False so that
+        the array is only transferred when requested, and pass a
+        preallocated buffer as `out`.
+
+        Parameters
+        ----------
+        as_string : bool, optional
+            Get the value as a string
+        out : np.ndarray, optional
+            Read an array into this C-contiguous buffer. Data of the native
+            type of the PV are written into it without intermediate copies.
+            If the whole buffer was filled, it is returned as is; if the PV
+            had fewer elements, a flat view of the elements read is returned
+            instead. See also :class:`ophyd.utils.epics_pvs.ArrayBufferPool`.
+
+        Other keyword arguments are passed on to epics.PV.get()
+        '''
+        if out is not None:
+            count = read_array(self._read_pv, out,
+                               timeout=kwargs.get('timeout'))
+            if count < out.size:
+                return out.reshape(-1)[:count]
+
+            return out
+
         if as_string is None:
             as_string = self._string
 
@@ -398,7 +614,7 @@ class EpicsSignal(Signal):
 
     def _fix_type(self, value):
         if self._string:
-            value = waveform_to_string(value)
+            value = self._string_cache.decode(value)
 
         return value
 
@@ -420,19 +636,12 @@ class EpicsSignal(Signal):
 
     @property
     def report(self):
-        # FIXME:
-        if self._read_pv == self._write_pv:
-            value = self._read_pv.value
-            pv = self.pvname
-        elif self._read_pv is not None:
-            value = self._read_pv.value
-            pv = self.pvname
-        elif self._write_pv is not None:
-            value = self._write_pv.value
-            pv = self.setpoint_pvname
+        return self._format_report(self._read_pv.value)
 
+    def _format_report(self, value):
+        '''The report dictionary of a value'''
         return {self.name: value,
-                'pv': pv
+                'pv': self.pvname
                 }
 
     def describe(self):
@@ -443,16 +652,56 @@ class EpicsSignal(Signal):
         dict
             Dictionary of name and formatted description string
         """
-        return {self.name: {'source': 'PV:%s' % self._read_pv.pvname,
+        return {self.name: {'source': 'PV:%s' % self._read_pvname,
                             'dtype': self.dtype,
                             'num_decimals': self.num_decimals,
                             'shape': []}}
 
+    @property
+    def dtype(self):
+        '''The type of the value returned by read()'''
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        valid_dtypes = ['float', 'int', 'str']
+        if dtype.__name__ not in valid_dtypes:
+            raise ValueError("dtype must be one of {}. You provided {"
+                             "}".format(valid_dtypes, dtype))
+        self._dtype = dtype
+        self._update_read_converter()
+
+    @property
+    def num_decimals(self):
+        '''The number of decimals read() rounds the value to ('all' for no
+        rounding)'''
+        return self._num_decimals
+
+    @num_decimals.setter
+    def num_decimals(self, num_decimals):
+        if num_decimals is None:
+            num_decimals = 'all'
+        self._num_decimals = num_decimals
+        self._update_read_converter()
+
+    def _update_read_converter(self):
+        '''Build the function read() formats values with'''
+        dtype = self._dtype
+        num_decimals = self._num_decimals
+
+        if num_decimals == 'all':
+            self._read_converter = dtype
+        else:
+            def converter(value):
+                return dtype(round(value, num_decimals))
+
+            self._read_converter = converter
+
     def read(self):
         """Read the signal and combine it with its timestamp.
 
         This value is formatted according to the values in self.dtype and
-        self.format
+        self.num_decimals
 
         Returns
         -------
@@ -460,11 +709,287 @@ class EpicsSignal(Signal):
             Dictionary of value timestamp pairs
             {'value': value, 'timestamp': timestamp}
         """
-        if self.num_decimals != 'all':
-            value = np.round(self.value, self.num_decimals)
-        value = self.describe()['dtype'](value)
-        return {self.name: {'value': value,
-                            'timestamp': self.timestamp}}
+        pv = self._read_pv
+        return self._format_read(self.get(), pv.timestamp)
+
+    def _format_read(self, value, timestamp):
+        '''The read() dictionary of a value'''
+        return {self._name: {'value': self._read_converter(value),
+                             'timestamp': timestamp}}
+
+
+def _defining_class(obj, attr):
+    '''The class in the MRO of obj which defines attr'''
+    for cls in type(obj).__mro__:
+        if attr in cls.__dict__:
+            return cls
+
+
+def _bulk_get_signals(signals, timeout=None, use_monitor=True):
+    '''Get the values and timestamps of EpicsSignals in one round trip
+
+    Signals which time out fall back to a regular get().
+
+    Returns
+    -------
+    results : list of (value, timestamp)
+    '''
+    results = bulk_get([signal._read_pv for signal in signals],
+                       timeout=timeout, use_monitor=use_monitor)
+
+    ret = []
+    for signal, result in zip(signals, results):
+        if result is None:
+            result = (signal.get(), signal.timestamp)
+        ret.append(result)
+
+    return ret
+
+
+def _bulk_gettable(signal):
+    '''Values of the signal can be fetched by _bulk_get_signals'''
+    # String conversion is left to EpicsSignal.get
+    return isinstance(signal, EpicsSignal) and not signal._string
+
+
+def _bulk_get_dict(signals):
+    '''{signal: (value, timestamp)} for those signals which can be fetched
+    by _bulk_get_signals'''
+    batch = [signal for signal in signals if _bulk_gettable(signal)]
+    return dict(zip(batch, _bulk_get_signals(batch)))
+
+
+def bulk_read(objs, timeout=None, use_monitor=True):
+    '''Read a number of signals, signal groups and detectors at once
+
+    The values of all of their EPICS signals are requested together, with a
+    single round trip. Objects with their own read() implementation (other
+    than those of EpicsSignal and SignalGroup) are read as usual.
+
+    Parameters
+    ----------
+    objs : sequence
+        Signals, signal groups and detectors to read
+    timeout : float, optional
+        Time to wait for all values [sec]
+    use_monitor : bool, optional
+        Use the latest monitor values of monitored signals instead of
+        requesting them
+
+    Returns
+    -------
+    values : dict
+        The combined read() dictionaries
+    '''
+    batch = []
+    others = []
+
+    def add(obj):
+        read_cls = _defining_class(obj, 'read')
+        if read_cls is EpicsSignal and _bulk_gettable(obj):
+            batch.append(obj)
+        elif read_cls is SignalGroup and not obj.snapshot:
+            for signal in obj.signals:
+                if signal.recordable:
+                    add(signal)
+        else:
+            others.append(obj)
+
+    for obj in objs:
+        add(obj)
+
+    values = {}
+    results = _bulk_get_signals(batch, timeout=timeout,
+                                use_monitor=use_monitor)
+    for signal, (value, timestamp) in zip(batch, results):
+        values.update(signal._format_read(value, timestamp))
+
+    for obj in others:
+        values.update(obj.read())
+
+    return values
+
+
+class BulkPutStatus(StatusBase):
+    '''Completion status of a number of puts issued together
+
+    Parameters
+    ----------
+    pvnames : sequence of str
+        The channels whose put completion is waited on
+    timeout : float, optional
+        Mark the status as failed if the puts have not completed after this
+        long [sec]
+    start_ts : float, optional
+        The timestamp the puts were issued at
+
+    Attributes
+    ----------
+    done : bool
+        All puts completed, or the status timed out
+    success : bool
+        All puts completed in time
+    pending : set of str
+        The channels still waiting on completion
+    start_ts : float
+        The timestamp the puts were issued at
+    finish_ts : float
+        The completion timestamp
+    '''
+
+    def __init__(self, pvnames=None, timeout=None, start_ts=None):
+        self.pending = set(pvnames or [])
+
+        if not self.pending:
+            timeout = None
+
+        StatusBase.__init__(self, timeout=timeout, start_ts=start_ts)
+
+        if not self.pending:
+            self._finished(success=True)
+
+    def _put_complete(self, pvname=None, **kwargs):
+        '''Put completion callback of a single channel'''
+        with self._lock:
+            self.pending.discard(pvname)
+            if self.pending or self.done:
+                return
+
+        self._finished(success=True)
+
+    @property
+    def incomplete(self):
+        '''The sorted names of the channels whose put completion is still
+        missing'''
+        with self._lock:
+            return sorted(self.pending)
+
+    def _timed_out(self):
+        if not self.done:
+            pending = ', '.join(self.incomplete)
+            logger.warning('Puts to %s did not complete within %s sec' %
+                           (pending, self.timeout))
+            self._finished(success=False,
+                           exception=TimeoutError('Puts to {} did not '
+                                                  'complete'.format(pending)))
+
+    def __str__(self):
+        return ('{0}(done={1.done}, elapsed={1.elapsed:.1f}, '
+                'success={1.success}, pending={2})'
+                ''.format(self.__class__.__name__, self, self.incomplete))
+
+    __repr__ = __str__
+
+
+def bulk_put_pvs(pvs, values, use_complete=False, timeout=30.0):
+    '''Write the values of a number of PVs at once, tracking completion
+
+    Parameters
+    ----------
+    pvs : sequence of epics.PV
+        The PVs to write
+    values : sequence
+        A value for each PV
+    use_complete : bool or sequence of bool, optional
+        Track put completion, for all PVs or for each one. Puts without
+        completion tracking are done as soon as they are issued.
+    timeout : float, optional
+        Time for all puts to complete before the status fails [sec]
+
+    Returns
+    -------
+    status : BulkPutStatus
+
+    Raises
+    ------
+    TimeoutError
+        If any of the PVs fail to connect
+    '''
+    # Completion callbacks may arrive before bulk_put returns, so all
+    # channels are registered with the status up front
+    status = BulkPutStatus(pvnames=[pv.pvname for pv in pvs],
+                           timeout=timeout)
+
+    try:
+        pending = bulk_put(pvs, values, use_complete=use_complete,
+                           callback=status._put_complete)
+    except Exception:
+        status._finished(success=False)
+        raise
+
+    for pv in pvs:
+        if pv.pvname not in pending:
+            status._put_complete(pvname=pv.pvname)
+
+    return status
+
+
+def bulk_write(signals, values, use_complete=None, timeout=30.0,
+               force=False, **kwargs):
+    '''Write the values of a number of signals at once
+
+    The writes of all EPICS signals are issued together, without waiting on
+    any of them in between. Other signals are set with their own put().
+
+    Parameters
+    ----------
+    signals : sequence of Signal
+        The signals to write
+    values : sequence
+        A value for each signal
+    use_complete : bool, optional
+        Track put completion of the EPICS signals. Defaults to the
+        put_complete setting of each signal.
+    timeout : float, optional
+        Time for all puts to complete before the status fails [sec]
+    force : bool, optional
+        Skip checking the values first
+
+    Other keyword arguments are passed on to the put() of non-EPICS signals
+
+    Returns
+    -------
+    status : BulkPutStatus
+        Done once all tracked puts have completed
+
+    Raises
+    ------
+    ReadOnlyError
+        If any of the EPICS signals are read-only
+    TimeoutError
+        If any of the channels fail to connect
+    '''
+    signals = list(signals)
+    values = list(values)
+
+    batch = []
+    for signal, value in zip(signals, values):
+        if not isinstance(signal, EpicsSignal):
+            continue
+
+        if signal._write_pv is None:
+            raise ReadOnlyError('Read-only EPICS signal: %s' % signal.name)
+
+        if not force:
+            signal.check_value(value)
+
+        batch.append((signal, value))
+
+    if use_complete is None:
+        use_complete = [signal._put_complete for signal, value in batch]
+
+    status = bulk_put_pvs([signal._write_pv for signal, value in batch],
+                          [value for signal, value in batch],
+                          use_complete=use_complete, timeout=timeout)
+
+    for signal, value in batch:
+        Signal.put(signal, value, force=True)
+
+    for signal, value in zip(signals, values):
+        if not isinstance(signal, EpicsSignal):
+            signal.put(value, force=force, **kwargs)
+
+    return status
 
 
 class SignalGroup(OphydObject):
@@ -474,17 +999,29 @@ class SignalGroup(OphydObject):
     ----------
     signals : sequence of Signal, optional
         Signals to add to the group
+    snapshot : bool, optional
+        Serve read() from the latest monitor values of the signals, see
+        :attr:`snapshot`
+    max_age : float, optional
+        In snapshot mode, values not updated for longer than this are read
+        live again [sec]
     '''
 
-    def __init__(self, signals=None, **kwargs):
+    def __init__(self, signals=None, snapshot=False, max_age=None,
+                 **kwargs):
         OphydObject.__init__(self, **kwargs)
 
         self._signals = []
+        self._snapshot = None
+        self._snapshot_received = {}
+        self.max_age = max_age
 
         if signals:
             for signal in signals:
                 self.add_signal(signal)
 
+        self.snapshot = snapshot
+
     def __repr__(self):
         repr = []
 
@@ -512,23 +1049,87 @@ class SignalGroup(OphydObject):
         if signal not in self._signals:
             self._signals.append(signal)
 
+            manager = get_connection_manager()
+            if manager is not None and not isinstance(signal, SignalGroup):
+                manager.claim(signal, self)
+
             if prop_name is None:
                 prop_name = signal.alias
 
             if prop_name:
                 setattr(self, prop_name, signal)
 
+            if self._snapshot is not None and self._snapshot_capable(signal):
+                signal.subscribe(self._snapshot_changed,
+                                 event_type=signal.SUB_VALUE)
+
     def get(self, **kwargs):
-        return [signal.get(**kwargs) for signal in self._signals]
+        if kwargs:
+            return [signal.get(**kwargs) for signal in self._signals]
+
+        # Fetch the values of all EPICS signals in a single round trip
+        signals = self._signals
+        results = _bulk_get_dict(signals)
+
+        return [results[signal][0] if signal in results else signal.get()
+                for signal in signals]
 
     @property
     def signals(self):
         return self._signals
 
     def put(self, values, **kwargs):
+        '''Set the values of the signals of the group, one at a time
+
+        Keyword arguments are passed on to the put() of each signal. See
+        :meth:`bulk_put` to issue the writes together.
+
+        Returns
+        -------
+        results : list
+            The result of the put() of each signal
+        '''
         return [signal.put(value, **kwargs)
                 for signal, value in zip(self._signals, values)]
 
+    def bulk_put(self, values, wait=False, timeout=30.0, use_complete=None,
+                 **kwargs):
+        '''Set the values of the signals of the group, issuing the writes of
+        all EPICS signals together (see :func:`bulk_write`)
+
+        Parameters
+        ----------
+        values : sequence
+            A value for each signal of the group
+        wait : bool, optional
+            Wait for all puts to complete. Implies use_complete.
+        timeout : float, optional
+            Time for all puts to complete [sec]
+        use_complete : bool, optional
+            Track put completion. Defaults to the put_complete setting of
+            each signal.
+
+        Returns
+        -------
+        status : BulkPutStatus
+
+        Raises
+        ------
+        TimeoutError
+            If wait is set and the puts did not complete in time
+        '''
+        if wait:
+            use_complete = True
+
+        status = bulk_write(self._signals, values, use_complete=use_complete,
+                            timeout=timeout, **kwargs)
+
+        if wait and not status.wait(timeout):
+            raise TimeoutError('Puts to %s did not complete' %
+                               ', '.join(status.incomplete))
+
+        return status
+
     def get_setpoint(self, **kwargs):
         return [signal.get_setpoint(**kwargs)
                 for signal in self._signals]
@@ -565,7 +1166,13 @@ class SignalGroup(OphydObject):
 
     @property
     def report(self):
-        return [signal.report for signal in self._signals]
+        # Fetch the values of all EPICS signals in a single round trip
+        signals = self._signals
+        results = _bulk_get_dict(signals)
+
+        return [signal._format_report(results[signal][0])
+                if signal in results else signal.report
+                for signal in signals]
 
     def describe(self):
         """Describe for data acquisition the signals of the group
@@ -581,8 +1188,100 @@ class SignalGroup(OphydObject):
         """Read signals for data acquisition
 
         This method uses the `recordable` flag in ophyd to filter
-        the returned signals of the signal group"""
-        values = {}
-        [values.update(signal.read()) for signal in self._signals
-         if signal.recordable]
+        the returned signals of the signal group. The values of all EPICS
+        signals are requested together (see :func:`bulk_read`), or, in
+        snapshot mode, taken from the latest monitor updates."""
+        if self._snapshot is not None:
+            return self._read_snapshot()
+
+        return bulk_read([signal for signal in self._signals
+                          if signal.recordable])
+
+    @staticmethod
+    def _snapshot_capable(signal):
+        '''Values of the signal can be kept by the snapshot'''
+        return (signal.recordable and
+                _defining_class(signal, 'read') is EpicsSignal and
+                _bulk_gettable(signal))
+
+    @property
+    def snapshot(self):
+        '''Snapshot mode
+
+        In snapshot mode, the group keeps the read() values of its monitored
+        EPICS signals up to date from their value callbacks, so that read()
+        does not go out on the network for them. Signals which have not had
+        a monitor update, and those with their own read(), are read live.
+
+        If max_age is set, values not updated for longer than max_age are
+        read live as well, and the snapshot is refreshed with them.
+        '''
+        return self._snapshot is not None
+
+    @snapshot.setter
+    def snapshot(self, enable):
+        if bool(enable) == self.snapshot:
+            return
+
+        signals = [signal for signal in self._signals
+                   if self._snapshot_capable(signal)]
+
+        if enable:
+            self._snapshot = {}
+            self._snapshot_received = {}
+            for signal in signals:
+                signal.subscribe(self._snapshot_changed,
+                                 event_type=signal.SUB_VALUE)
+        else:
+            for signal in signals:
+                signal.clear_sub(self._snapshot_changed,
+                                 event_type=signal.SUB_VALUE)
+
+            self._snapshot = None
+            self._snapshot_received = {}
+
+    def _snapshot_changed(self, obj=None, **kwargs):
+        '''Value callback of signals in snapshot mode'''
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+
+        # Value callbacks also run on puts; the snapshot should only hold
+        # what the channel reports
+        pv = obj._read_pv
+        if not pv.auto_monitor:
+            return
+
+        snapshot.update(obj._format_read(pv.get(), pv.timestamp))
+        self._snapshot_received[obj] = time.time()
+
+    def _read_snapshot(self):
+        '''read() in snapshot mode'''
+        values = dict(self._snapshot)
+        received = self._snapshot_received
+        max_age = self.max_age
+        now = time.time()
+
+        live = []
+        stale = []
+        for signal in self._signals:
+            if not signal.recordable:
+                continue
+
+            ts = received.get(signal)
+            if ts is None:
+                live.append(signal)
+            elif max_age is not None and now - ts > max_age:
+                stale.append(signal)
+
+        if not (live or stale):
+            return values
+
+        fresh = bulk_read(live + stale)
+        values.update(fresh)
+
+        for signal in stale:
+            self._snapshot[signal.name] = fresh[signal.name]
+            received[signal] = now
+
         return values
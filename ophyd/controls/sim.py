@@ -0,0 +1,996 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.sim` - Simulated control system
+===================================================
+
+.. module:: ophyd.control.sim
+   :synopsis: An in-process backend for EPICS signals, with simulated motor,
+       scaler and areaDetector records
+'''
+
+from __future__ import print_function
+import heapq
+import itertools
+import logging
+import math
+import random
+import threading
+import time
+
+import numpy as np
+
+from .backend import EpicsBackend
+from ..utils.epics_pvs import record_field
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['SimBackend',
+           'SimRecord',
+           'SimPV',
+           'SimMotor',
+           'SimScaler',
+           'SimAreaDetector',
+           ]
+
+
+class _Scheduler(object):
+    '''Runs functions at given times from a single worker thread
+
+    Like the callbacks of channel access, everything the simulation does
+    happens on this thread.
+    '''
+
+    def __init__(self, name='sim_scheduler'):
+        self._name = name
+        self._queue = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def schedule_at(self, due, fcn, *args, **kwargs):
+        '''Run fcn(*args, **kwargs) at time due'''
+        with self._cond:
+            heapq.heappush(self._queue,
+                           (due, next(self._counter), fcn, args, kwargs))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name=self._name)
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._cond.notify()
+
+    def schedule(self, delay, fcn, *args, **kwargs):
+        '''Run fcn(*args, **kwargs) after delay seconds'''
+        self.schedule_at(time.time() + delay, fcn, *args, **kwargs)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+
+                    remaining = self._queue[0][0] - time.time()
+                    if remaining <= 0:
+                        break
+
+                    self._cond.wait(remaining)
+
+                due, _, fcn, args, kwargs = heapq.heappop(self._queue)
+
+            try:
+                fcn(*args, **kwargs)
+            except Exception as ex:
+                logger.error('Simulation callback %s failed' % fcn,
+                             exc_info=ex)
+
+
+class SimRecord(object):
+    '''A simulated channel, holding a value and its control information
+
+    Parameters
+    ----------
+    backend : SimBackend
+    pvname : str
+    value : any, optional
+    lower_ctrl_limit : float, optional
+    upper_ctrl_limit : float, optional
+    precision : int, optional
+    units : str, optional
+    enum_strs : sequence of str, optional
+    on_put : callable, optional
+        Called as on_put(record, value, done) from the simulation thread when
+        a value is put. It updates the record (and any others) as it sees
+        fit, and calls done() once processing has completed, which is when
+        put completion is reported. By default, the record takes the value,
+        copies it to the record of the same name with an _RBV suffix (if
+        there is one) and completes right away.
+    '''
+
+    def __init__(self, backend, pvname, value=0.0,
+                 lower_ctrl_limit=0.0, upper_ctrl_limit=0.0,
+                 precision=0, units='', enum_strs=None, on_put=None):
+        self.backend = backend
+        self.pvname = pvname
+        self.value = value
+        self.timestamp = time.time()
+        self.severity = 0
+        self.status = 0
+
+        self.lower_ctrl_limit = lower_ctrl_limit
+        self.upper_ctrl_limit = upper_ctrl_limit
+        self.precision = precision
+        self.units = units
+        self.enum_strs = enum_strs
+        self.on_put = on_put
+
+        self._monitors = []
+
+    def __repr__(self):
+        return '{}({!r}, value={!r})'.format(self.__class__.__name__,
+                                             self.pvname, self.value)
+
+    @property
+    def count(self):
+        '''Number of elements of the value'''
+        if isinstance(self.value, np.ndarray):
+            return self.value.size
+        return 1
+
+    def update(self, value, timestamp=None):
+        '''Set the value, posting it to all monitors'''
+        if timestamp is None:
+            timestamp = time.time()
+
+        self.value = value
+        self.timestamp = timestamp
+
+        for pv in list(self._monitors):
+            pv._monitor_event(self)
+
+    def process(self, value, done):
+        '''Handle a put from a client'''
+        if self.on_put is not None:
+            self.on_put(self, value, done)
+            return
+
+        self.update(value)
+
+        rbv = self.backend.records.get(self.pvname + '_RBV')
+        if rbv is not None:
+            rbv.update(value)
+
+        done()
+
+    @property
+    def ctrlvars(self):
+        '''Control information, as returned by epics.PV.get_ctrlvars'''
+        ctrl = {'lower_ctrl_limit': self.lower_ctrl_limit,
+                'upper_ctrl_limit': self.upper_ctrl_limit,
+                'precision': self.precision,
+                'units': self.units,
+                'severity': self.severity,
+                'status': self.status,
+                }
+
+        if self.enum_strs is not None:
+            ctrl['enum_strs'] = tuple(self.enum_strs)
+
+        return ctrl
+
+
+class SimPV(object):
+    '''A client of a simulated channel, behaving like epics.PV
+
+    Created by :meth:`SimBackend.create_pv`, with the arguments of epics.PV.
+    Reads of monitored channels return the latest monitor value; all other
+    requests take the latency of the backend.
+    '''
+
+    # Not a channel access channel
+    chid = None
+    ftype = None
+
+    def __init__(self, backend, pvname, callback=None, form='time',
+                 auto_monitor=None, connection_callback=None,
+                 connection_timeout=None, **kwargs):
+        self.pvname = pvname
+        self.form = form
+        self.auto_monitor = (auto_monitor is None or bool(auto_monitor))
+        self.connected = False
+        self.connection_callbacks = []
+        self.callbacks = {}
+        self.timestamp = None
+        self.severity = None
+        self.status = None
+
+        self._backend = backend
+        self._record = None
+        self._value = None
+        self._put_complete = None
+        self._connection_timeout = connection_timeout
+        self._connect_event = threading.Event()
+        self._cb_index = itertools.count(1)
+
+        if connection_callback is not None:
+            self.connection_callbacks.append(connection_callback)
+
+        if callback is not None:
+            self.add_callback(callback)
+
+        backend._connect(self)
+
+    def __repr__(self):
+        return '<{} {!r}: {}>'.format(self.__class__.__name__, self.pvname,
+                                      'connected' if self.connected
+                                      else 'disconnected')
+
+    def _on_connect(self, record):
+        '''Connection, from the simulation thread'''
+        self._record = record
+        self._value = record.value
+        self.timestamp = record.timestamp
+        self.severity = record.severity
+        self.status = record.status
+
+        if self.auto_monitor:
+            record._monitors.append(self)
+
+        self.connected = True
+        self._connect_event.set()
+
+        for cb in list(self.connection_callbacks):
+            try:
+                cb(pvname=self.pvname, conn=True, pv=self)
+            except Exception as ex:
+                logger.error('Connection callback %s failed' % cb,
+                             exc_info=ex)
+
+        if self.auto_monitor:
+            self._run_callbacks()
+
+    def _monitor_event(self, record):
+        '''Monitor update, from the simulation thread'''
+        self._value = record.value
+        self.timestamp = record.timestamp
+        self.severity = record.severity
+        self.status = record.status
+        self._run_callbacks()
+
+    def _run_callbacks(self):
+        value = self._value
+        for index, (fcn, kwargs) in list(self.callbacks.items()):
+            cb_kwargs = dict(pvname=self.pvname, value=value,
+                             char_value=self._char_value(value),
+                             timestamp=self.timestamp,
+                             severity=self.severity, status=self.status,
+                             count=self.count, cb_info=(index, self))
+            cb_kwargs.update(kwargs)
+
+            try:
+                fcn(**cb_kwargs)
+            except Exception as ex:
+                logger.error('Monitor callback %s of %s failed' %
+                             (fcn, self.pvname), exc_info=ex)
+
+    def _char_value(self, value):
+        record = self._record
+        if record is None or value is None:
+            return None
+
+        if record.enum_strs is not None:
+            try:
+                return record.enum_strs[int(value)]
+            except (IndexError, TypeError, ValueError):
+                pass
+
+        if isinstance(value, float) and record.precision is not None:
+            return '{:.{}f}'.format(value, record.precision)
+
+        return str(value)
+
+    def wait_for_connection(self, timeout=None):
+        '''Wait for the channel to connect'''
+        if self.connected:
+            return True
+
+        if timeout is None:
+            timeout = self._connection_timeout
+        if timeout is None:
+            timeout = self._backend.connection_timeout
+
+        return self._connect_event.wait(timeout)
+
+    def get(self, count=None, as_string=False, as_numpy=True, timeout=None,
+            use_monitor=True, **kwargs):
+        '''Get the value, as epics.PV.get'''
+        if not self.wait_for_connection(timeout):
+            return None
+
+        if use_monitor and self.auto_monitor:
+            value = self._value
+        else:
+            self._backend._round_trip()
+            record = self._record
+            value = record.value
+            if isinstance(value, np.ndarray):
+                value = value.copy()
+
+            self._value = value
+            self.timestamp = record.timestamp
+
+        if count is not None and isinstance(value, np.ndarray):
+            value = value[:count]
+
+        if as_string:
+            return self._char_value(value)
+
+        return value
+
+    @property
+    def value(self):
+        return self.get()
+
+    @property
+    def char_value(self):
+        return self.get(as_string=True)
+
+    def put(self, value, wait=False, timeout=30.0, use_complete=False,
+            callback=None, callback_data=None):
+        '''Put a value, as epics.PV.put'''
+        if not self.wait_for_connection():
+            return None
+
+        record = self._record
+        if record.enum_strs is not None and isinstance(value, str):
+            try:
+                value = list(record.enum_strs).index(value)
+            except ValueError:
+                pass
+
+        self._put_complete = False if use_complete else None
+        event = threading.Event()
+
+        def completed():
+            if use_complete:
+                self._put_complete = True
+
+            event.set()
+            if callback is not None:
+                if isinstance(callback_data, dict):
+                    callback(pvname=self.pvname, **callback_data)
+                else:
+                    callback(pvname=self.pvname, data=callback_data)
+
+        self._backend._put(record, value, completed)
+
+        if wait and not event.wait(timeout):
+            return -1
+
+        return 1
+
+    @property
+    def put_complete(self):
+        return self._put_complete
+
+    def get_ctrlvars(self, timeout=None, warn=True):
+        '''Get the control information, as epics.PV.get_ctrlvars'''
+        if not self.wait_for_connection(timeout):
+            return None
+
+        self._backend._round_trip()
+        return self._record.ctrlvars
+
+    def get_timevars(self, timeout=None, warn=True):
+        if not self.wait_for_connection(timeout):
+            return None
+
+        return {'timestamp': self.timestamp,
+                'severity': self.severity,
+                'status': self.status,
+                }
+
+    def _ctrl_attr(self, attr):
+        if self._record is None:
+            return None
+        return getattr(self._record, attr)
+
+    precision = property(lambda self: self._ctrl_attr('precision'))
+    units = property(lambda self: self._ctrl_attr('units'))
+    enum_strs = property(lambda self: self._ctrl_attr('enum_strs'))
+    lower_ctrl_limit = property(
+        lambda self: self._ctrl_attr('lower_ctrl_limit'))
+    upper_ctrl_limit = property(
+        lambda self: self._ctrl_attr('upper_ctrl_limit'))
+
+    @property
+    def count(self):
+        if self._record is None:
+            return None
+        return self._record.count
+
+    nelm = count
+
+    def add_callback(self, callback=None, index=None, run_now=False,
+                     with_ctrlvars=True, **kwargs):
+        '''Add a monitor callback, as epics.PV.add_callback'''
+        if index is None:
+            index = next(self._cb_index)
+
+        self.callbacks[index] = (callback, kwargs)
+
+        if run_now and self.connected:
+            self._run_callbacks()
+
+        return index
+
+    def remove_callback(self, index=None):
+        self.callbacks.pop(index, None)
+
+    def clear_callbacks(self):
+        self.callbacks.clear()
+
+    def disconnect(self):
+        '''Stop monitoring the channel'''
+        record = self._record
+        if record is not None:
+            try:
+                record._monitors.remove(self)
+            except ValueError:
+                pass
+
+        self.connected = False
+        self.callbacks.clear()
+
+
+class SimBackend(EpicsBackend):
+    '''An in-process simulated control system
+
+    Use it in place of channel access with
+    :func:`ophyd.controls.backend.set_backend` or
+    :func:`ophyd.controls.backend.use_backend`. Records of simulated devices
+    (:class:`SimMotor`, :class:`SimScaler`, :class:`SimAreaDetector`)
+    should be created before the ophyd objects using them::
+
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'XF:31IDA-OP{Tbl-Ax:X1}Mtr', velocity=2.0)
+
+        with use_backend(sim):
+            m1 = EpicsMotor('XF:31IDA-OP{Tbl-Ax:X1}Mtr', name='m1')
+
+    Parameters
+    ----------
+    latency : float, optional
+        Time each request takes to reach the simulated IOC, and each reply
+        to come back [sec]
+    jitter : float, optional
+        Random additional latency, up to this much [sec]. Requests are
+        still handled in the order they were made.
+    auto_create : bool, optional
+        Create records holding 0.0 for unknown channels. Otherwise, channels
+        without a record never connect.
+    connection_timeout : float, optional
+        Default time to wait for channels to connect [sec]
+    seed : int, optional
+        Seed of the random numbers used for jitter and simulated data
+
+    Attributes
+    ----------
+    records : dict
+        The records, keyed by channel name
+    '''
+
+    def __init__(self, latency=0.0, jitter=0.0, auto_create=True,
+                 connection_timeout=1.0, seed=None):
+        self.latency = float(latency)
+        self.jitter = float(jitter)
+        self.auto_create = bool(auto_create)
+        self.connection_timeout = connection_timeout
+        self.records = {}
+        self.random = random.Random(seed)
+
+        self._scheduler = _Scheduler()
+        self._lock = threading.Lock()
+        self._last_request = 0.0
+        self._pvs = {}
+
+    def __repr__(self):
+        return ('{}(latency={!r}, jitter={!r}, records={})'
+                ''.format(self.__class__.__name__, self.latency, self.jitter,
+                          len(self.records)))
+
+    def delay(self):
+        '''The latency of a single message [sec]'''
+        if self.jitter:
+            return self.latency + self.random.uniform(0.0, self.jitter)
+        return self.latency
+
+    def _round_trip(self):
+        '''Block for a request and its reply'''
+        delay = self.delay() + self.delay()
+        if delay > 0.0:
+            time.sleep(delay)
+
+    def schedule(self, delay, fcn, *args, **kwargs):
+        '''Run fcn(*args, **kwargs) on the simulation thread after delay
+        seconds, e.g. to step the state of a simulated device'''
+        self._scheduler.schedule(delay, fcn, *args, **kwargs)
+
+    def _request(self, fcn, *args, **kwargs):
+        '''Run fcn on the simulation thread once a request arrives'''
+        with self._lock:
+            due = max(time.time() + self.delay(), self._last_request)
+            self._last_request = due
+
+        self._scheduler.schedule_at(due, fcn, *args, **kwargs)
+
+    def _put(self, record, value, completed):
+        '''Process a put, replying with completed() when done'''
+        def done():
+            self.schedule(self.delay(), completed)
+
+        self._request(record.process, value, done)
+
+    def _connect(self, pv):
+        record = self.record(pv.pvname)
+        if record is None:
+            logger.debug('No simulated record for %s' % pv.pvname)
+            return
+
+        self._request(pv._on_connect, record)
+
+    def add_record(self, pvname, value=0.0, **kwargs):
+        '''Add a record, replacing any of the same name
+
+        Keyword arguments are passed on to :class:`SimRecord`
+        '''
+        record = SimRecord(self, pvname, value=value, **kwargs)
+        with self._lock:
+            self.records[pvname] = record
+        return record
+
+    def record(self, pvname):
+        '''The record of a channel, created if auto_create is set
+
+        Returns
+        -------
+        record : SimRecord or None
+        '''
+        with self._lock:
+            try:
+                return self.records[pvname]
+            except KeyError:
+                if not self.auto_create:
+                    return None
+
+            value = 0.0
+            if pvname.endswith('_RBV'):
+                base = self.records.get(pvname[:-4])
+                if base is not None:
+                    value = base.value
+
+            record = self.records[pvname] = SimRecord(self, pvname,
+                                                      value=value)
+            return record
+
+    def create_pv(self, pvname, **kwargs):
+        '''Create a new simulated channel client'''
+        return SimPV(self, pvname, **kwargs)
+
+    def get_pv(self, pvname, **kwargs):
+        '''Get a shared, connected channel client'''
+        with self._lock:
+            try:
+                pv = self._pvs[pvname]
+            except KeyError:
+                pv = None
+
+        if pv is None:
+            pv = self.create_pv(pvname, **kwargs)
+            with self._lock:
+                pv = self._pvs.setdefault(pvname, pv)
+
+        pv.wait_for_connection()
+        return pv
+
+
+class SimMotor(object):
+    '''A simulated motor record
+
+    Moves at a constant velocity, updating its readback as it goes. Puts to
+    VAL complete when the move is done.
+
+    Parameters
+    ----------
+    backend : SimBackend
+    record : str
+        The motor record name
+    position : float, optional
+        Initial position
+    velocity : float, optional
+        Speed [egu/sec]
+    limits : (low, high), optional
+        Soft limits. Moves outside of them are rejected.
+    precision : int, optional
+    egu : str, optional
+        Engineering units
+    update_rate : float, optional
+        Readback updates per second while moving
+    '''
+
+    def __init__(self, backend, record, position=0.0, velocity=1.0,
+                 limits=(-100.0, 100.0), precision=3, egu='mm',
+                 update_rate=20.0):
+        self.backend = backend
+        self.record = record
+        self.update_rate = float(update_rate)
+
+        low, high = limits
+
+        def add(field, value, **kwargs):
+            return backend.add_record(record_field(record, field), value,
+                                      **kwargs)
+
+        self._val = add('VAL', position, lower_ctrl_limit=low,
+                        upper_ctrl_limit=high, precision=precision,
+                        units=egu, on_put=self._move)
+        self._rbv = add('RBV', position, lower_ctrl_limit=low,
+                        upper_ctrl_limit=high, precision=precision,
+                        units=egu)
+        self._dmov = add('DMOV', 1)
+        self._movn = add('MOVN', 0)
+        self._stop = add('STOP', 0, on_put=self._stop_put)
+        self._egu = add('EGU', egu)
+        self._hlm = add('HLM', high, on_put=self._limit_put)
+        self._llm = add('LLM', low, on_put=self._limit_put)
+        self._velo = add('VELO', velocity, units='{}/s'.format(egu))
+
+        self._lock = threading.Lock()
+        self._move_id = 0
+        self._pending = []
+
+    @property
+    def position(self):
+        return self._rbv.value
+
+    @property
+    def velocity(self):
+        return self._velo.value
+
+    @property
+    def moving(self):
+        return self._movn.value == 1
+
+    def _move(self, record, value, done):
+        low, high = record.lower_ctrl_limit, record.upper_ctrl_limit
+        if low < high and not (low <= value <= high):
+            logger.debug('%s: move to %s outside of limits' %
+                         (self.record, value))
+            done()
+            return
+
+        with self._lock:
+            self._move_id += 1
+            move_id = self._move_id
+            self._pending.append(done)
+
+        record.update(value)
+
+        start = self.position
+        velocity = abs(self.velocity) or 1.0
+        duration = abs(value - start) / velocity
+
+        if self._dmov.value != 0:
+            self._dmov.update(0)
+            self._movn.update(1)
+
+        self._step(move_id, start, value, time.time(), duration)
+
+    def _step(self, move_id, start, target, t0, duration):
+        if move_id != self._move_id:
+            # Superseded by another move or stopped
+            return
+
+        elapsed = time.time() - t0
+        if elapsed >= duration:
+            self._rbv.update(target)
+            self._finish()
+            return
+
+        self._rbv.update(start + (target - start) * elapsed / duration)
+        self.backend.schedule(min(1.0 / self.update_rate, duration - elapsed),
+                              self._step, move_id, start, target, t0,
+                              duration)
+
+    def _finish(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        self._movn.update(0)
+        self._dmov.update(1)
+
+        for done in pending:
+            done()
+
+    def _stop_put(self, record, value, done):
+        if value:
+            with self._lock:
+                self._move_id += 1
+
+            if self._dmov.value == 0:
+                self._val.update(self.position)
+                self._finish()
+
+        done()
+
+    def _limit_put(self, record, value, done):
+        record.update(value)
+        self._val.lower_ctrl_limit = self._llm.value
+        self._val.upper_ctrl_limit = self._hlm.value
+        done()
+
+
+class SimScaler(object):
+    '''A simulated scaler record
+
+    Puts to CNT count for the preset time TP, after which the channels S1..
+    hold the counts and the put completes.
+
+    Parameters
+    ----------
+    backend : SimBackend
+    record : str
+        The scaler record name
+    numchan : int, optional
+        Number of channels
+    rates : sequence of float, optional
+        Count rate of each channel [counts/sec]. Defaults to the clock
+        frequency for the first channel and 1000 for the others.
+    noise : bool, optional
+        Add counting noise
+    freq : float, optional
+        Clock frequency [Hz]
+    '''
+
+    def __init__(self, backend, record, numchan=8, rates=None, noise=False,
+                 freq=1e7):
+        self.backend = backend
+        self.record = record
+        self.noise = bool(noise)
+
+        if rates is None:
+            rates = [freq] + [1e3] * (numchan - 1)
+
+        self.rates = list(rates)
+
+        def add(field, value=0.0, **kwargs):
+            return backend.add_record(record_field(record, field), value,
+                                      **kwargs)
+
+        self._cnt = add('CNT', 0, on_put=self._count)
+        add('CONT', 0)
+        self._t = add('T', 0.0, precision=3)
+        self._tp = add('TP', 1.0, precision=3)
+        add('TP1', 1.0, precision=3)
+        add('FREQ', freq)
+
+        self._channels = []
+        for ch in range(1, numchan + 1):
+            self._channels.append(add('S%d' % ch, 0))
+            add('PR%d' % ch, 0)
+            add('G%d' % ch, 0)
+
+        self._lock = threading.Lock()
+        self._count_id = 0
+        self._pending = []
+        self._t0 = None
+
+    def _count(self, record, value, done):
+        if not value:
+            # Stop counting early
+            with self._lock:
+                self._count_id += 1
+                counting = self._t0 is not None
+
+            if counting:
+                self._finish(time.time() - self._t0)
+
+            record.update(0)
+            done()
+            return
+
+        with self._lock:
+            self._count_id += 1
+            count_id = self._count_id
+            self._pending.append(done)
+            self._t0 = time.time()
+
+        record.update(1)
+        preset = float(self._tp.value)
+        self.backend.schedule(preset, self._count_done, count_id, preset)
+
+    def _count_done(self, count_id, elapsed):
+        if count_id != self._count_id:
+            return
+
+        self._finish(elapsed)
+
+    def _finish(self, elapsed):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._t0 = None
+
+        rng = self.backend.random
+        self._t.update(elapsed)
+        for record, rate in zip(self._channels, self.rates):
+            counts = rate * elapsed
+            if self.noise and counts > 0:
+                counts = max(0.0, rng.gauss(counts, math.sqrt(counts)))
+            record.update(int(counts))
+
+        self._cnt.update(0)
+
+        for done in pending:
+            done()
+
+
+class SimAreaDetector(object):
+    '''A simulated areaDetector with an image plugin and stats plugins
+
+    Puts to cam1:Acquire take images of Poisson-distributed counts, updating
+    the array counters, the image plugin's ArrayData and the stats plugins'
+    totals. The put completes once all images of the acquisition are taken.
+    Parameters without simulated behavior are plain records, with an _RBV
+    record following each put.
+
+    Parameters
+    ----------
+    backend : SimBackend
+    prefix : str
+        The detector prefix
+    cam : str, optional
+        The camera suffix
+    image : str, optional
+        The image plugin suffix
+    stats : sequence of int, optional
+        Stats plugin numbers
+    shape : (rows, columns), optional
+        Image shape
+    dtype : np.dtype, optional
+        Image data type
+    mean : float, optional
+        Mean counts per pixel and second of exposure
+    '''
+
+    def __init__(self, backend, prefix, cam='cam1:', image='image1:',
+                 stats=range(1, 6), shape=(256, 256), dtype=np.uint16,
+                 mean=100.0):
+        self.backend = backend
+        self.prefix = prefix
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.mean = float(mean)
+
+        self._rng = np.random.RandomState(backend.random.randint(0, 2 ** 31))
+
+        def add(suffix, value=0, **kwargs):
+            return backend.add_record(prefix + suffix, value, **kwargs)
+
+        def param(suffix, value=0, **kwargs):
+            # Setting and readback of a driver parameter
+            rbv = add(suffix + '_RBV', value, **kwargs)
+            add(suffix, value, **kwargs)
+            return rbv
+
+        rows, cols = self.shape
+
+        self._acquire = add(cam + 'Acquire', 0, on_put=self._acquire_put)
+        self._acquire_rbv = add(cam + 'Acquire_RBV', 0)
+        self._state = add(cam + 'DetectorState_RBV', 0,
+                          enum_strs=('Idle', 'Acquire', 'Readout'))
+        self._acquire_time = param(cam + 'AcquireTime', 0.1, precision=3)
+        self._acquire_period = param(cam + 'AcquirePeriod', 0.1, precision=3)
+        self._num_images = param(cam + 'NumImages', 1)
+        param(cam + 'NumExposures', 1)
+        self._image_mode = param(cam + 'ImageMode', 0,
+                                 enum_strs=('Single', 'Multiple',
+                                            'Continuous'))
+        self._counter = param(cam + 'ArrayCounter', 0)
+        param(cam + 'ArrayCallbacks', 1)
+        param(cam + 'SizeX', cols)
+        param(cam + 'SizeY', rows)
+        add(cam + 'MaxSizeX_RBV', cols)
+        add(cam + 'MaxSizeY_RBV', rows)
+        add(cam + 'ArraySizeX_RBV', cols)
+        add(cam + 'ArraySizeY_RBV', rows)
+
+        self._array_data = add(image + 'ArrayData',
+                               np.zeros(rows * cols, dtype=self.dtype))
+        add(image + 'ArraySize0_RBV', cols)
+        add(image + 'ArraySize1_RBV', rows)
+        add(image + 'ArraySize2_RBV', 0)
+        self._image_counter = add(image + 'ArrayCounter_RBV', 0)
+
+        self._totals = [add('Stats%d:Total_RBV' % n, 0.0) for n in stats]
+
+        self._lock = threading.Lock()
+        self._acq_id = 0
+        self._pending = []
+
+    @property
+    def image(self):
+        '''The last image taken'''
+        return self._array_data.value.reshape(self.shape)
+
+    def _acquire_put(self, record, value, done):
+        record.update(value)
+        self._acquire_rbv.update(value)
+
+        if not value:
+            with self._lock:
+                self._acq_id += 1
+
+            self._finish()
+            done()
+            return
+
+        mode = self._image_mode.value
+        if mode == 0:
+            images = 1
+        elif mode == 1:
+            images = max(int(self._num_images.value), 1)
+        else:
+            images = None
+
+        with self._lock:
+            self._acq_id += 1
+            acq_id = self._acq_id
+            self._pending.append(done)
+
+        self._state.update(1)
+        self.backend.schedule(self._frame_time, self._frame, acq_id, images)
+
+    @property
+    def _frame_time(self):
+        return max(float(self._acquire_time.value),
+                   float(self._acquire_period.value), 0.0)
+
+    def _frame(self, acq_id, remaining):
+        if acq_id != self._acq_id:
+            return
+
+        lam = self.mean * float(self._acquire_time.value)
+        image = self._rng.poisson(lam, self.shape[0] * self.shape[1])
+        image = image.astype(self.dtype)
+
+        self._array_data.update(image)
+        self._counter.update(self._counter.value + 1)
+        self._image_counter.update(self._image_counter.value + 1)
+
+        total = float(image.sum())
+        for record in self._totals:
+            record.update(total)
+
+        if remaining is not None:
+            remaining -= 1
+            if remaining <= 0:
+                self._acquire.update(0)
+                self._acquire_rbv.update(0)
+                self._finish()
+                return
+
+        self.backend.schedule(self._frame_time, self._frame, acq_id,
+                              remaining)
+
+    def _finish(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        self._state.update(0)
+
+        for done in pending:
+            done()
@@ -0,0 +1,268 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.status` - Status objects
+============================================
+
+.. module:: ophyd.control.status
+   :synopsis: Completion status of asynchronous operations (moves,
+       acquisitions, puts), and combinations of them
+'''
+
+from __future__ import print_function
+import logging
+import threading
+import time
+import weakref
+
+from ..utils import TimeoutError
+from ..utils.dispatch import get_callback_scheduler
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['StatusBase',
+           'AndStatus',
+           'OrStatus',
+           'all_of',
+           'any_of',
+           ]
+
+
+class StatusBase(object):
+    '''Completion status of an asynchronous operation
+
+    The operation marks the status finished by calling :meth:`_finished`.
+    Instead of polling `done`, callers can block in :meth:`wait` or be
+    called back with :meth:`add_callback`.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Fail the status if it has not finished after this long [sec]. The
+        timeouts of all statuses are handled by the shared callback scheduler
+        thread (see :func:`ophyd.utils.dispatch.get_callback_scheduler`).
+    start_ts : float, optional
+        The timestamp the operation started at
+
+    Attributes
+    ----------
+    done : bool
+        The operation has finished (successfully or not)
+    success : bool
+        The operation finished successfully
+    exception : Exception or None
+        Why the operation failed, if known
+    start_ts : float
+        The timestamp the operation started at
+    finish_ts : float
+        The timestamp the operation finished at
+    '''
+
+    def __init__(self, timeout=None, start_ts=None):
+        if start_ts is None:
+            start_ts = time.time()
+
+        self.done = False
+        self.success = False
+        self.exception = None
+        self.timeout = timeout
+        self.start_ts = start_ts
+        self.finish_ts = None
+
+        self._lock = threading.RLock()
+        self._done_event = threading.Event()
+        self._callbacks = []
+
+        if timeout is not None:
+            # The scheduler only holds a weak reference, so finished statuses
+            # are not kept alive until their timeouts
+            ref = weakref.ref(self)
+
+            def timed_out():
+                status = ref()
+                if status is not None:
+                    status._timed_out()
+
+            get_callback_scheduler().call_later(timeout, timed_out)
+
+    def _finished(self, success=True, exception=None, **kwargs):
+        '''Mark the status as finished, running the callbacks
+
+        Only the first call has any effect.
+        '''
+        with self._lock:
+            if self.done:
+                return
+
+            self.success = bool(success)
+            self.exception = exception
+            self.finish_ts = kwargs.get('timestamp', None) or time.time()
+            self.done = True
+
+            callbacks, self._callbacks = self._callbacks, []
+
+        self._done_event.set()
+
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    def _timed_out(self):
+        '''The status did not finish within the timeout'''
+        if not self.done:
+            self._finished(success=False,
+                           exception=TimeoutError('{} timed out after {} s'
+                                                  ''.format(self,
+                                                            self.timeout)))
+
+    def set_exception(self, exception):
+        '''Mark the operation as failed'''
+        self._finished(success=False, exception=exception)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception as ex:
+            logger.error('Status callback %s failed' % callback, exc_info=ex)
+
+    def add_callback(self, callback):
+        '''Call callback(status) when the status finishes
+
+        The callback is run right away if the status has already finished.
+        '''
+        with self._lock:
+            if not self.done:
+                self._callbacks.append(callback)
+                return
+
+        self._run_callback(callback)
+
+    def wait(self, timeout=None):
+        '''Wait for the status to finish
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time to wait [sec]. Defaults to waiting until the status is done.
+
+        Returns
+        -------
+        success : bool
+            The operation finished successfully in time
+        '''
+        self._done_event.wait(timeout)
+        return self.success
+
+    @property
+    def elapsed(self):
+        '''Time since the operation started, or until it finished [sec]'''
+        if self.finish_ts is None:
+            return time.time() - self.start_ts
+        else:
+            return self.finish_ts - self.start_ts
+
+    def __and__(self, other):
+        return AndStatus([self, other])
+
+    def __or__(self, other):
+        return OrStatus([self, other])
+
+    def __str__(self):
+        return ('{0}(done={1.done}, elapsed={1.elapsed:.1f}, '
+                'success={1.success})'.format(self.__class__.__name__, self))
+
+    __repr__ = __str__
+
+
+class AndStatus(StatusBase):
+    '''Finishes once all of a number of statuses have finished
+
+    Succeeds if all of them succeeded. The exception is that of the first
+    status (in order) which failed.
+
+    Parameters
+    ----------
+    statuses : sequence of StatusBase
+        An empty sequence finishes successfully right away
+
+    Other keyword arguments are passed on to the base class (StatusBase)
+    initializer
+    '''
+
+    def __init__(self, statuses, **kwargs):
+        StatusBase.__init__(self, **kwargs)
+
+        self.statuses = list(statuses)
+        self._remaining = len(self.statuses)
+
+        if not self.statuses:
+            self._finished(success=True)
+
+        for status in self.statuses:
+            status.add_callback(self._status_finished)
+
+    def _status_finished(self, status):
+        with self._lock:
+            self._remaining -= 1
+            if self._remaining > 0:
+                return
+
+        exception = None
+        for status in self.statuses:
+            if not status.success:
+                exception = status.exception
+                break
+
+        self._finished(success=all(status.success
+                                   for status in self.statuses),
+                       exception=exception)
+
+
+class OrStatus(StatusBase):
+    '''Finishes as soon as any of a number of statuses has finished
+
+    Its success and exception are those of the status which finished first.
+
+    Parameters
+    ----------
+    statuses : sequence of StatusBase
+        An empty sequence finishes successfully right away
+
+    Other keyword arguments are passed on to the base class (StatusBase)
+    initializer
+    '''
+
+    def __init__(self, statuses, **kwargs):
+        StatusBase.__init__(self, **kwargs)
+
+        self.statuses = list(statuses)
+        self.first = None
+
+        if not self.statuses:
+            self._finished(success=True)
+
+        for status in self.statuses:
+            status.add_callback(self._status_finished)
+
+    def _status_finished(self, status):
+        with self._lock:
+            if self.first is not None:
+                return
+            self.first = status
+
+        self._finished(success=status.success, exception=status.exception)
+
+
+def all_of(statuses, **kwargs):
+    '''A status which finishes once all of the statuses have finished
+
+    See :class:`AndStatus`
+    '''
+    return AndStatus(statuses, **kwargs)
+
+
+def any_of(statuses, **kwargs):
+    '''A status which finishes as soon as any of the statuses has finished
+
+    See :class:`OrStatus`
+    '''
+    return OrStatus(statuses, **kwargs)
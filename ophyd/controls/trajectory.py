@@ -0,0 +1,242 @@
+# vi: ts=4 sw=4
+'''
+:mod:`ophyd.control.trajectory` - Positioner trajectories
+=========================================================
+
+.. module:: ophyd.control.trajectory
+   :synopsis: Sequences of positions for positioners to follow, with the
+       readbacks recorded along the way
+'''
+
+from __future__ import print_function
+import logging
+import time
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['Trajectory',
+           ]
+
+
+class Trajectory(object):
+    '''A sequence of positions to follow, stored in a numpy array
+
+    A cursor keeps track of the next point. The readback and timestamp at
+    each point are recorded into arrays allocated up front, so following a
+    trajectory does not grow any lists. After the scan, the commanded and
+    actual positions are available as arrays::
+
+        traj = Trajectory(np.linspace(0, 1, 100001))
+        m1.set_trajectory(traj)
+        ...
+        print(np.abs(traj.following_error).max())
+
+    Positions may also come from an iterator without a length (e.g., a
+    generator, which need not end). Its points are only taken as they are
+    followed, and the arrays are grown as needed. The length of such a
+    trajectory is the number of points taken so far.
+
+    Parameters
+    ----------
+    positions : array-like or iterator
+        The positions, one per point. For positioners with more than one
+        axis (e.g. pseudo positioners), an array of shape (points, axes).
+    '''
+
+    # Number of points initially allocated for iterators
+    _initial_capacity = 64
+
+    def __init__(self, positions):
+        if hasattr(positions, '__len__'):
+            positions = np.array(positions)
+            if positions.ndim == 0:
+                raise ValueError('Positions must be a sequence')
+
+            self._source = None
+            self._allocate(positions)
+            self._length = len(positions)
+        else:
+            self._source = iter(positions)
+            self._allocate(None)
+            self._length = 0
+
+        self.reset()
+
+    def _allocate(self, positions):
+        '''Use positions as the positions array, with readback and timestamp
+        arrays to match'''
+        if positions is None:
+            positions = np.empty(0)
+
+        self._positions = positions
+        self._readbacks = np.empty(positions.shape)
+        self._readbacks.fill(np.nan)
+        self._timestamps = np.empty(len(positions))
+        self._timestamps.fill(np.nan)
+
+    def _take(self):
+        '''Take the next position from the iterator into the arrays
+
+        Raises
+        ------
+        StopIteration
+            If the iterator is exhausted
+        '''
+        try:
+            position = np.asarray(next(self._source))
+        except StopIteration:
+            self._source = None
+            raise
+
+        length = self._length
+        if length >= len(self._positions):
+            # Grow the arrays, keeping what was recorded so far
+            positions = self._positions
+            readbacks = self._readbacks
+            timestamps = self._timestamps
+
+            capacity = max(2 * length, self._initial_capacity)
+            self._allocate(np.empty((capacity, ) + position.shape,
+                                    dtype=position.dtype))
+            if length:
+                self._positions[:length] = positions
+                self._readbacks[:length] = readbacks
+                self._timestamps[:length] = timestamps
+
+        self._positions[length] = position
+        self._length = length + 1
+
+    def reset(self):
+        '''Move the cursor back to the start, clearing the readbacks
+
+        Points already taken from an iterator are followed again before any
+        new ones are taken.
+        '''
+        self._index = 0
+        self._readbacks.fill(np.nan)
+        self._timestamps.fill(np.nan)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        '''The next position, advancing the cursor
+
+        Raises
+        ------
+        StopIteration
+            At the end of the trajectory
+        '''
+        index = self._index
+        if index >= self._length:
+            if self._source is None:
+                raise StopIteration('End of trajectory')
+
+            self._take()
+
+        self._index = index + 1
+        return self._positions[index]
+
+    __next__ = next
+
+    @property
+    def index(self):
+        '''Number of points started'''
+        return self._index
+
+    @property
+    def remaining(self):
+        '''Number of points left (None if following an iterator which is not
+        exhausted yet)'''
+        if self._source is not None:
+            return None
+
+        return self._length - self._index
+
+    @property
+    def done(self):
+        '''All points have been started'''
+        if self._index < self._length:
+            return False
+        elif self._source is None:
+            return True
+
+        # An iterator is only known to be exhausted once it says so
+        try:
+            self._take()
+        except StopIteration:
+            return True
+
+        return False
+
+    @property
+    def progress(self):
+        '''Fraction of the points started, from 0 to 1 (None if following an
+        iterator which is not exhausted yet)'''
+        if self._source is not None:
+            return None
+        elif not self._length:
+            return 1.0
+
+        return float(self._index) / self._length
+
+    def record(self, index, readback, timestamp=None):
+        '''Record the readback at a point
+
+        Parameters
+        ----------
+        index : int
+            The point
+        readback : float or array-like
+            The position reached
+        timestamp : float, optional
+            Defaults to now
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+
+        try:
+            self._readbacks[index] = readback
+        except (TypeError, ValueError):
+            logger.debug('Readback %r does not fit the trajectory' %
+                         (readback, ))
+            return
+
+        self._timestamps[index] = timestamp
+
+    @property
+    def positions(self):
+        '''All positions of the trajectory (those taken so far, for
+        iterators)'''
+        return self._positions[:self._length]
+
+    @property
+    def commanded(self):
+        '''The positions of the points started so far'''
+        return self._positions[:self._index]
+
+    @property
+    def readbacks(self):
+        '''The readbacks of the points started so far (nan where none
+        were recorded)'''
+        return self._readbacks[:self._index]
+
+    @property
+    def timestamps(self):
+        '''The timestamps of the readbacks of the points started so far'''
+        return self._timestamps[:self._index]
+
+    @property
+    def following_error(self):
+        '''Readback minus commanded position of the points started so far'''
+        return self.readbacks - self.commanded
+
+    def __repr__(self):
+        return ('{0}(points={1}, index={2})'
+                ''.format(self.__class__.__name__, len(self), self._index))
@@ -10,6 +10,9 @@ from Queue import Queue
 import numpy as np
 from ..session import register_object
 from ..controls.detector import Detector
+from ..controls.signal import bulk_read
+from ..controls.status import all_of
+from ..utils import TimeoutError
 from metadatastore import api as mds
 
 
@@ -109,10 +112,14 @@ class RunEngine(object):
     logger : logging.Logger
     '''
 
+    # Default time to wait for the positioners to reach each point [sec]
+    move_timeout = 600.0
+
     def __init__(self, logger):
         self._demuxer = Demuxer()
         self._sessionmgr = register_object(self)
         self._scan_state = False
+        self._scan_failed = False
         self.logger = self._sessionmgr._logger
 
     # start/stop/pause/resume are external api methods
@@ -143,17 +150,38 @@ class RunEngine(object):
         mds.insert_run_stop(bre, time.time(), exit_status=state)
         self.logger.info('End Run...')
 
-    def _move_positioners(self, positioners=None, settle_time=None, **kwargs):
+    def _move_positioners(self, positioners=None, settle_time=None,
+                          move_timeout=None, **kwargs):
+        if move_timeout is None:
+            move_timeout = self.move_timeout
+
         try:
             status = [pos.move_next(wait=False)[1] for pos in positioners]
         except StopIteration:
             return None
 
-        # status now holds the MoveStatus() instances
-        time.sleep(0.05)
-        # TODO: this should iterate at most N times to catch hangups
-        while not all(s.done for s in status):
-            time.sleep(0.1)
+        # status now holds the MoveStatus() instances, or None for moves
+        # which were interrupted
+        if any(st is None for st in status):
+            for pos in positioners:
+                pos.stop()
+
+            names = [pos.name for pos, st in zip(positioners, status)
+                     if st is None]
+            raise RuntimeError('Move of %s was interrupted' %
+                               ', '.join(names))
+
+        all_of(status).wait(move_timeout)
+
+        hung = [pos for pos, st in zip(positioners, status) if not st.done]
+        if hung:
+            for pos in hung:
+                pos.stop()
+
+            raise TimeoutError('%s did not finish moving within %s s' %
+                               (', '.join(pos.name for pos in hung),
+                                move_timeout))
+
         if settle_time is not None:
             time.sleep(settle_time)
 
@@ -186,23 +214,25 @@ class RunEngine(object):
         while self._scan_state is True:
             self.logger.debug(
                 'self._scan_state is True in self._start_scan')
-            posvals = self._move_positioners(positioners=positioners, **kwargs)
+            try:
+                posvals = self._move_positioners(positioners=positioners,
+                                                 **kwargs)
+            except (TimeoutError, RuntimeError) as ex:
+                self.logger.error('Scan failed: %s', ex)
+                self._scan_failed = True
+                break
+
             self.logger.debug('moved positioners')
             # if we're done iterating over positions, get outta Dodge
             if posvals is None:
                 break
 
             # Trigger detector acquisision
-            acq_status = [trig.acquire() for trig in triggers]
-
-            while any([not stat.done for stat in acq_status]):
-                time.sleep(0.05)
+            all_of([trig.acquire() for trig in triggers]).wait()
 
             time.sleep(0.05)
-            # Read detector values
-            tmp_detvals = {}
-            for det in dets + positioners:
-                tmp_detvals.update(det.read())
+            # Read detector values, requesting all EPICS values together
+            tmp_detvals = bulk_read(dets + positioners)
 
             detvals = mds.format_events(tmp_detvals)
 
@@ -347,10 +377,14 @@ class RunEngine(object):
                                    kwargs=scan_args)
         self._scan_thread.daemon = True
         self._scan_state = True
+        self._scan_failed = False
         self._scan_thread.start()
         try:
             while self._scan_state is True:
                 time.sleep(0.10)
+
+            if self._scan_failed:
+                end_args['state'] = 'fail'
         except KeyboardInterrupt:
             self._scan_state = False
             self._scan_thread.join()
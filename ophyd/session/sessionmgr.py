@@ -6,8 +6,11 @@ import warnings
 import epics
 
 from ..controls.positioner import Positioner
-from ..controls.signal import (OphydObject, Signal, SignalGroup)
+from ..controls.signal import (OphydObject, Signal, SignalGroup,
+                               EpicsSignal)
 from ..utils.epics_pvs import MonitorDispatcher
+from ..utils.dispatch import CallbackExecutor
+from ..utils.timing import CallbackTimer
 from ..runengine import RunEngine
 
 try:
@@ -60,6 +63,7 @@ class SessionManager(object):
                           'beamline_config': {}}
 
         self._dispatcher = None
+        self._callback_executor = None
         self._setup_epics()
 
         # Override the IPython exit request function
@@ -156,6 +160,9 @@ class SessionManager(object):
             self._dispatcher.stop()
             self._dispatcher.join()
 
+        if self._callback_executor is not None:
+            self._callback_executor.stop()
+
         if self._cas is not None:
             # Stopping the channel access server causes disconnections right as
             # the program is quitting. To stop it from being noisy and
@@ -223,10 +230,14 @@ class SessionManager(object):
         if self._run_engine is not None:
             self._run_engine.stop()
 
+        # Keep stopping the others if one of them fails
         for pos in self._registry['positioners'].itervalues():
-            if pos.moving is True:
-                pos.stop()
-                self._logger.debug('Stopped %s' % pos)
+            try:
+                if pos.moving:
+                    pos.stop()
+                    self._logger.debug('Stopped %s' % pos)
+            except Exception as ex:
+                self._logger.error('Failed to stop %s' % pos, exc_info=ex)
 
     def get_positioners(self):
         return self._registry['positioners']
@@ -271,6 +282,79 @@ class SessionManager(object):
         '''The monitor dispatcher'''
         return self._dispatcher
 
+    @property
+    def callback_executor(self):
+        '''The shared executor for slow subscription callbacks
+
+        Created on first access. Pass it to `subscribe(..., executor=...)` to
+        move a callback off of the monitor dispatcher thread.
+        '''
+        if self._callback_executor is None:
+            self._callback_executor = CallbackExecutor(num_threads=4,
+                                                       name='ophyd_callbacks')
+        return self._callback_executor
+
+    @property
+    def lazy_signals(self):
+        '''Default for the `lazy` argument of EPICS signals
+
+        When set, EpicsSignals created afterward (without specifying `lazy`)
+        only create their channels on first get, put or subscribe.
+        '''
+        return EpicsSignal._lazy_default
+
+    @lazy_signals.setter
+    def lazy_signals(self, lazy):
+        EpicsSignal._lazy_default = bool(lazy)
+
+    @property
+    def callback_timer(self):
+        '''The CallbackTimer in use, or None if timing is disabled'''
+        return OphydObject._callback_timer
+
+    def enable_callback_timing(self, slow_threshold=None, window=1000,
+                               max_entries=1000):
+        '''Record the run time of all subscription callbacks
+
+        Statistics are kept per object, subscription type and callback.
+        Enabling timing again resets them.
+
+        Parameters
+        ----------
+        slow_threshold : float, optional
+            Log a warning for every callback taking at least this long [sec]
+        window : int, optional
+            Number of most recent run times the percentiles are calculated
+            over
+        max_entries : int, optional
+            Maximum number of (object, subscription type, callback) entries
+            kept; the least recently updated ones are dropped first
+
+        Returns
+        -------
+        timer : CallbackTimer
+        '''
+        timer = CallbackTimer(window=window, slow_threshold=slow_threshold,
+                              logger=self._logger, max_entries=max_entries)
+        OphydObject._callback_timer = timer
+        return timer
+
+    def disable_callback_timing(self):
+        '''Stop recording callback run times'''
+        OphydObject._callback_timer = None
+
+    def callback_timing(self, obj=None, sub_type=None, sort_key='total'):
+        '''Callback run time statistics
+
+        See :meth:`CallbackTimer.summary`. Timing must be enabled first with
+        :meth:`enable_callback_timing`.
+        '''
+        timer = OphydObject._callback_timer
+        if timer is None:
+            raise RuntimeError('Callback timing is not enabled')
+
+        return timer.summary(obj=obj, sub_type=sub_type, sort_key=sort_key)
+
     def _setup_epics(self):
         # It's important to use the same context in the callback dispatcher
         # as the main thread, otherwise not-so-savvy users will be very
@@ -1,7 +1,6 @@
 """Command Line Interface to opyd objects"""
 
 from __future__ import print_function
-import time
 import functools
 import sys
 from contextlib import contextmanager, closing
@@ -10,9 +9,11 @@ import collections
 
 from IPython.utils.coloransi import TermColors as tc
 
-from epics import caget, caput
-
 from ..controls.positioner import EpicsMotor, Positioner, PVPositioner
+from ..controls.signal import bulk_put_pvs
+from ..controls.status import all_of
+from ..controls.backend import get_backend
+from ..utils import TimeoutError
 from ..session import get_session_manager
 
 session_mgr = get_session_manager()
@@ -105,24 +106,23 @@ def mov(positioner, position):
             pos_prec.append(FMT_PREC)
 
     with catch_keyboard_interrupt(positioner):
-        stat = [p.move(v, wait=False) for p, v in
-                zip(positioner, position)]
+        stat = all_of([p.move(v, wait=False) for p, v in
+                       zip(positioner, position)])
 
         # The loop below ensures that at least a couple prints
         # will happen
         flag = 0
-        done = False
 
-        while not all(s.done for s in stat) or (flag < 2):
+        while not stat.done or (flag < 2):
             print(tc.LightGreen, end='')
             print('   ', end='')
             for p, prec in zip(positioner, pos_prec):
                 print_value(p.position, egu=p.egu, prec=prec)
             print('\n')
             print('\033[2A', end='')
-            time.sleep(0.01)
-            done = all(s.done for s in stat)
-            if done:
+            # Refresh the positions, but stop as soon as all are done
+            stat.wait(0.01)
+            if stat.done:
                 flag += 1
 
     print(tc.Normal + '\n')
@@ -182,34 +182,50 @@ def set_lm(positioner, limits):
 
     high_fields = []
     low_fields = []
+    setpoints = []
     for p in positioner:
         if isinstance(p, EpicsMotor):
             high_fields.append(p._record + '.HLM')
             low_fields.append(p._record + '.LLM')
+            setpoints.append(p._user_setpoint)
         elif isinstance(p, PVPositioner):
             high_fields.append(p.setpoint_pvname[0] + '.DRVH')
             low_fields.append(p.setpoint_pvname[0] + '.DRVL')
+            setpoints.append(p._setpoint)
         else:
             raise TypeError("Positioners must be EpicsMotors or PVPositioners"
                             "to set the limits")
 
-    for p, lim, high_field, low_field in zip(positioner,
-                                             limits,
+    # Write all of the limits at once, then wait for them together
+    backend = get_backend()
+    pvs = []
+    values = []
+    for p, lim, high_field, low_field in zip(positioner, limits,
                                              high_fields, low_fields):
         lim1 = max(lim)
         lim2 = min(lim)
-        if not caput(high_field, lim1):
-            raise IOError("Unable to set high limit for {}"
-                          " writing to PV {}.".format(p.name, high_field))
+        pvs.extend([backend.get_pv(high_field), backend.get_pv(low_field)])
+        values.extend([lim1, lim2])
+
         msg += "Upper limit set to {:.{prec}g} for positioner {}\n".format(
                lim1, p.name, prec=FMT_PREC)
-
-        if not caput(low_field, lim2):
-            raise IOError("Unable to set low limit for {}"
-                          " writing to PV {}.".format(p.name, low_field))
         msg += "Lower limit set to {:.{prec}g} for positioner {}\n".format(
                lim2, p.name, prec=FMT_PREC)
 
+    try:
+        status = bulk_put_pvs(pvs, values, use_complete=True)
+    except TimeoutError as ex:
+        raise IOError("Unable to set limits: {}".format(ex))
+
+    try:
+        if not status.wait():
+            raise IOError("Unable to set limits writing to PV(s) {}."
+                          .format(', '.join(status.incomplete)))
+    finally:
+        # Pick up the new limits on the next check
+        for setpoint in setpoints:
+            setpoint.invalidate_ctrl_vars()
+
     print(msg)
     if logbook:
         logbook.log(msg)
@@ -258,8 +274,9 @@ def set_pos(positioner, position):
     offset_pvs = [p._record + ".OFF" for p in positioner]
     dial_pvs = [p._record + ".DRBV" for p in positioner]
 
-    old_offsets = [caget(p) for p in offset_pvs]
-    dial = [caget(p) for p in dial_pvs]
+    backend = get_backend()
+    old_offsets = [backend.caget(p) for p in offset_pvs]
+    dial = [backend.caget(p) for p in dial_pvs]
 
     for v in old_offsets + dial:
         if v is None:
@@ -270,7 +287,7 @@ def set_pos(positioner, position):
 
     msg = ''
     for o, old_o, p in zip(new_offsets, old_offsets, positioner):
-        if caput(p._record + '.OFF', o):
+        if backend.caput(p._record + '.OFF', o):
             msg += 'Motor {0} set to position {1} (Offset = {2} was {3})\n'\
                    .format(p.name, p.position, o, old_o)
         else:
@@ -408,9 +425,7 @@ def log_pos_mov(id=None, dry_run=False, positioners=None, **kwargs):
 
     sys.stdout.flush()
 
-    if len(stat) > 0:
-        while all(s.done for s in stat):
-            time.sleep(0.01)
+    all_of(stat).wait()
 
     print(' Done{}\n'.format(tc.Normal))
 
@@ -519,7 +534,8 @@ def logbook_add_objects(objects, extra_pvs=None):
     if extra_pvs is not None:
         pvs += extra_pvs
         names += ['None' for e in extra_pvs]
-        values += [caget(e) for e in extra_pvs]
+        backend = get_backend()
+        values += [backend.caget(e) for e in extra_pvs]
 
     for a, b, c in zip(pvs, names, values):
         msg += 'PV:{:<40} {:<22} {:<50}\n'.format(a, b, c)
@@ -1,6 +1,5 @@
 from __future__ import print_function
 import numpy as np
-from time import sleep
 import sys
 import collections
 import itertools
@@ -13,6 +12,7 @@ from ..runengine import RunEngine
 from ..session import get_session_manager
 from ..utils import LimitError
 from ..controls import Detector
+from ..controls.status import all_of
 
 session_manager = get_session_manager()
 logger = session_manager._logger
@@ -252,6 +252,7 @@ class Scan(object):
 
             scan_args['settle_time'] = kwargs.pop('settle_time',
                                                   self.settle_time)
+            scan_args['move_timeout'] = kwargs.pop('move_timeout', None)
 
             # let 'custom' be assigned to all remaining kwargs
             scan_args['custom'] = kwargs
@@ -530,8 +531,7 @@ class DScan(AScan):
                   zip(self.positioners, self._start_positions)]
 
         logger.info("Moving positioners back to start positions.......")
-        while any(not stat.done for stat in status):
-            sleep(0.01)
+        all_of(status).wait()
 
         logger.info(tc.Green + " Done.")
 
@@ -0,0 +1,642 @@
+# vi: ts=4 sw=4 sts=4 expandtab
+'''
+:mod:`ophyd.utils.dispatch` - Subscription callback dispatch
+============================================================
+
+.. module:: ophyd.utils.dispatch
+   :synopsis: Running subscription callbacks off of the monitor thread
+'''
+
+from __future__ import print_function
+import collections
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+import epics
+
+from .decorators import cached_retval
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['CallbackExecutor',
+           'CallbackScheduler',
+           'QueuedCallback',
+           'RateLimitedCallback',
+           'DeadbandCallback',
+           'get_callback_scheduler',
+           'unwrap_callback',
+           'OVERFLOW_DROP_OLDEST',
+           'OVERFLOW_DROP_NEWEST',
+           'OVERFLOW_BLOCK',
+           ]
+
+# Overflow policies for a full subscriber queue
+OVERFLOW_DROP_OLDEST = 'drop_oldest'
+OVERFLOW_DROP_NEWEST = 'drop_newest'
+OVERFLOW_BLOCK = 'block'
+
+_overflow_policies = (OVERFLOW_DROP_OLDEST,
+                      OVERFLOW_DROP_NEWEST,
+                      OVERFLOW_BLOCK)
+
+
+def _run_callback(cb, *args, **kwargs):
+    '''Default callback runner: run the callback, logging any exception'''
+    try:
+        cb(*args, **kwargs)
+    except Exception as ex:
+        logger.error('Callback %s failed' % (cb, ), exc_info=ex)
+
+
+def unwrap_callback(cb):
+    '''Get the user-supplied callback from a (possibly nested) wrapper'''
+    while isinstance(cb, CallbackWrapper):
+        cb = cb.callback
+
+    return cb
+
+
+class CallbackWrapper(object):
+    '''Base class for subscription callback wrappers
+
+    Parameters
+    ----------
+    callback : callable
+        The wrapped callback
+    runner : callable, optional
+        Called as runner(callback, *args, **kwargs) to run the wrapped
+        callback.  Defaults to calling it and logging any exceptions.
+
+    Attributes
+    ----------
+    callback : callable
+        The wrapped callback
+    '''
+
+    def __init__(self, callback, runner=None):
+        if runner is None:
+            runner = _run_callback
+
+        self.callback = callback
+        self._runner = runner
+
+    def close(self):
+        '''The wrapper was unsubscribed; release any resources'''
+        if isinstance(self.callback, CallbackWrapper):
+            self.callback.close()
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.callback)
+
+
+class QueuedCallback(CallbackWrapper):
+    '''A subscription callback which is run by a :class:`CallbackExecutor`
+
+    Calling the wrapper only places the arguments on a bounded,
+    per-subscriber queue; the executor runs the callback later from one of
+    its worker threads.  Events for a single subscriber are always delivered
+    in order.
+
+    Parameters
+    ----------
+    callback : callable
+        The wrapped callback
+    executor : CallbackExecutor
+        The executor which runs the callback
+    max_queue : int, optional
+        Maximum number of pending events for this subscriber
+    overflow : {'drop_oldest', 'drop_newest', 'block'}, optional
+        What to do when an event arrives and the queue is full: discard the
+        oldest pending event, discard the new event, or block the calling
+        thread until there is room
+    runner : callable, optional
+        See :class:`CallbackWrapper`
+
+    Attributes
+    ----------
+    received : int
+        Number of events received
+    processed : int
+        Number of events for which the callback was run
+    dropped : int
+        Number of events discarded due to overflow
+    max_depth : int
+        The largest queue depth seen
+    '''
+
+    def __init__(self, callback, executor, max_queue=100,
+                 overflow=OVERFLOW_DROP_OLDEST, runner=None):
+        CallbackWrapper.__init__(self, callback, runner=runner)
+
+        if overflow not in _overflow_policies:
+            raise ValueError('Unknown overflow policy {!r} (choose from {})'
+                             ''.format(overflow, _overflow_policies))
+
+        if max_queue < 1:
+            raise ValueError('max_queue must be at least 1')
+
+        self._executor = executor
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._scheduled = False
+        self._closed = False
+
+        self.max_queue = int(max_queue)
+        self.overflow = overflow
+
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+        executor._add_callback(self)
+
+    @property
+    def depth(self):
+        '''Number of events waiting to be run'''
+        return len(self._queue)
+
+    @property
+    def executor(self):
+        '''The executor running this callback'''
+        return self._executor
+
+    @property
+    def stats(self):
+        '''Queue statistics as a dictionary'''
+        return {'callback': unwrap_callback(self),
+                'depth': self.depth,
+                'max_depth': self.max_depth,
+                'received': self.received,
+                'processed': self.processed,
+                'dropped': self.dropped,
+                }
+
+    def __call__(self, *args, **kwargs):
+        schedule = False
+
+        with self._lock:
+            if self._closed:
+                return
+
+            self.received += 1
+
+            if len(self._queue) >= self.max_queue:
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                elif self.overflow == OVERFLOW_DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while (len(self._queue) >= self.max_queue and
+                           not self._closed and self._executor.running):
+                        self._not_full.wait(0.1)
+
+                    if len(self._queue) >= self.max_queue:
+                        self.dropped += 1
+                        return
+
+            self._queue.append((args, kwargs))
+            self.max_depth = max(self.max_depth, len(self._queue))
+
+            if not self._scheduled:
+                self._scheduled = schedule = True
+
+        if schedule:
+            self._executor._schedule(self)
+
+    def _run_next(self):
+        '''Run the next pending event (called from an executor thread)
+
+        Returns
+        -------
+        pending : bool
+            True if more events are waiting
+        '''
+        with self._lock:
+            if not self._queue:
+                self._scheduled = False
+                return False
+
+            args, kwargs = self._queue.popleft()
+            self._not_full.notify()
+
+        self._runner(self.callback, *args, **kwargs)
+
+        with self._lock:
+            self.processed += 1
+            if self._queue:
+                return True
+
+            self._scheduled = False
+            return False
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            self._not_full.notify_all()
+
+        self._executor._remove_callback(self)
+        CallbackWrapper.close(self)
+
+
+class CallbackExecutor(object):
+    '''A bounded pool of threads which runs queued subscription callbacks
+
+    Callbacks are bound to an executor by way of
+    :meth:`OphydObject.subscribe`. Each subscriber gets its own queue, and
+    the worker threads service subscribers with pending events in a
+    round-robin fashion.  A single-threaded executor acts as a dedicated
+    worker.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        Number of worker threads
+    name : str, optional
+        Base name of the worker threads
+    '''
+
+    def __init__(self, num_threads=1, name='callback_executor'):
+        if num_threads < 1:
+            raise ValueError('num_threads must be at least 1')
+
+        self._name = name
+        self._ready = collections.deque()
+        self._cond = threading.Condition()
+        self._callbacks = []
+        self._running = True
+
+        self._threads = []
+        for i in range(num_threads):
+            # CAThreads, so that callbacks can use channel access
+            thread = epics.ca.CAThread(target=self._worker,
+                                       name='%s_%d' % (name, i))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def __repr__(self):
+        return '{}(num_threads={}, name={!r})'.format(self.__class__.__name__,
+                                                     len(self._threads),
+                                                     self._name)
+
+    @property
+    def running(self):
+        '''Whether or not the executor is accepting callbacks'''
+        return self._running
+
+    @property
+    def num_threads(self):
+        return len(self._threads)
+
+    @property
+    def callbacks(self):
+        '''All queued callbacks bound to this executor'''
+        with self._cond:
+            return list(self._callbacks)
+
+    @property
+    def depth(self):
+        '''Total number of pending events over all subscribers'''
+        return sum(cb.depth for cb in self.callbacks)
+
+    @property
+    def stats(self):
+        '''Per-subscriber queue statistics (see :attr:`QueuedCallback.stats`)'''
+        return [cb.stats for cb in self.callbacks]
+
+    def _add_callback(self, cb):
+        with self._cond:
+            self._callbacks.append(cb)
+
+    def _remove_callback(self, cb):
+        with self._cond:
+            try:
+                self._callbacks.remove(cb)
+            except ValueError:
+                pass
+
+    def _schedule(self, cb):
+        with self._cond:
+            if not self._running:
+                return
+
+            self._ready.append(cb)
+            self._cond.notify()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._running and not self._ready:
+                    self._cond.wait()
+
+                if not self._running:
+                    return
+
+                cb = self._ready.popleft()
+
+            if cb._run_next():
+                # Round-robin with other subscribers; this subscriber stays
+                # scheduled so only one thread ever runs its events
+                with self._cond:
+                    self._ready.append(cb)
+                    self._cond.notify()
+
+    def stop(self, wait=True):
+        '''Stop the worker threads. Pending events are discarded.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Wait for the worker threads to finish their current callbacks
+        '''
+        with self._cond:
+            self._running = False
+            self._ready.clear()
+            self._cond.notify_all()
+
+        if wait:
+            current = threading.current_thread()
+            for thread in self._threads:
+                if thread is not current:
+                    thread.join()
+
+
+class RateLimitedCallback(CallbackWrapper):
+    '''A subscription callback which is run at most `max_rate` times a second
+
+    Parameters
+    ----------
+    callback : callable
+        The wrapped callback
+    max_rate : float
+        Maximum number of deliveries per second
+    coalesce : bool, optional
+        If set, events arriving too soon after the last delivery are merged
+        and the most recent one is delivered once the period is up, so the
+        callback always ends up seeing the latest value. Otherwise, such
+        events are simply dropped.
+    runner : callable, optional
+        See :class:`CallbackWrapper`
+    scheduler : CallbackScheduler, optional
+        Scheduler for delayed (coalesced) deliveries. Defaults to the shared
+        scheduler from :func:`get_callback_scheduler`.
+
+    Attributes
+    ----------
+    received : int
+        Number of events received
+    delivered : int
+        Number of times the callback was run
+    dropped : int
+        Number of events which were never delivered
+    '''
+
+    def __init__(self, callback, max_rate, coalesce=True, runner=None,
+                 scheduler=None):
+        CallbackWrapper.__init__(self, callback, runner=runner)
+
+        if max_rate <= 0:
+            raise ValueError('max_rate must be positive')
+
+        self.max_rate = float(max_rate)
+        self.coalesce = bool(coalesce)
+
+        self._period = 1.0 / self.max_rate
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._last = 0.0
+        self._pending = None
+        self._flush_scheduled = False
+        self._closed = False
+
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def stats(self):
+        '''Delivery statistics as a dictionary'''
+        return {'callback': unwrap_callback(self),
+                'max_rate': self.max_rate,
+                'received': self.received,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                }
+
+    def __call__(self, *args, **kwargs):
+        now = time.time()
+        delay = None
+
+        with self._lock:
+            if self._closed:
+                return
+
+            self.received += 1
+
+            if not self._flush_scheduled and (now - self._last) >= self._period:
+                self._last = now
+                self.delivered += 1
+            elif not self.coalesce:
+                self.dropped += 1
+                return
+            else:
+                if self._pending is not None:
+                    self.dropped += 1
+
+                self._pending = (args, kwargs)
+                if self._flush_scheduled:
+                    return
+
+                self._flush_scheduled = True
+                delay = self._last + self._period - now
+
+        if delay is None:
+            self._runner(self.callback, *args, **kwargs)
+        else:
+            scheduler = self._scheduler
+            if scheduler is None:
+                scheduler = get_callback_scheduler()
+
+            scheduler.call_later(delay, self._flush)
+
+    def _flush(self):
+        '''Deliver the latest coalesced event'''
+        with self._lock:
+            self._flush_scheduled = False
+            pending, self._pending = self._pending, None
+
+            if self._closed or pending is None:
+                return
+
+            self._last = time.time()
+            self.delivered += 1
+
+        args, kwargs = pending
+        self._runner(self.callback, *args, **kwargs)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._pending = None
+
+        CallbackWrapper.close(self)
+
+
+class DeadbandCallback(CallbackWrapper):
+    '''A value callback which only runs when the value has changed enough
+
+    The change is measured from the value the callback last ran with, so
+    slow drifts are still delivered eventually. Events without a value, and
+    values which cannot be compared (e.g., the first one, strings or
+    arrays), are always delivered.
+
+    Parameters
+    ----------
+    callback : callable
+        The wrapped callback
+    deadband : float, optional
+        Run the callback only if the value changed by more than this
+    rel_deadband : float, optional
+        As deadband, relative to the value the callback last ran with (e.g.,
+        0.01 for 1%). If both are set, the larger threshold applies.
+    runner : callable, optional
+        See :class:`CallbackWrapper`
+
+    Attributes
+    ----------
+    received : int
+        Number of events received
+    delivered : int
+        Number of times the callback was run
+    '''
+
+    def __init__(self, callback, deadband=None, rel_deadband=None,
+                 runner=None):
+        CallbackWrapper.__init__(self, callback, runner=runner)
+
+        self.deadband = deadband
+        self.rel_deadband = rel_deadband
+
+        self._lock = threading.Lock()
+        self._last = None
+
+        self.received = 0
+        self.delivered = 0
+
+    @property
+    def stats(self):
+        '''Delivery statistics as a dictionary'''
+        return {'callback': unwrap_callback(self),
+                'deadband': self.deadband,
+                'rel_deadband': self.rel_deadband,
+                'received': self.received,
+                'delivered': self.delivered,
+                }
+
+    def _outside_deadband(self, value):
+        '''The value changed enough since the last delivery'''
+        last = self._last
+
+        try:
+            change = abs(value - last)
+
+            threshold = 0.0
+            if self.deadband is not None:
+                threshold = self.deadband
+            if self.rel_deadband is not None:
+                threshold = max(threshold, self.rel_deadband * abs(last))
+
+            if change <= threshold:
+                return False
+        except (TypeError, ValueError):
+            # No value delivered yet, or values which can't be compared
+            pass
+
+        self._last = value
+        return True
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.received += 1
+
+            if 'value' in kwargs and not self._outside_deadband(
+                    kwargs['value']):
+                return
+
+            self.delivered += 1
+
+        self._runner(self.callback, *args, **kwargs)
+
+
+class CallbackScheduler(object):
+    '''Runs functions after a delay from a single worker thread
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the worker thread
+    '''
+
+    def __init__(self, name='callback_scheduler'):
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._running = True
+
+        self._thread = epics.ca.CAThread(target=self._worker, name=name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def running(self):
+        return self._running
+
+    def call_later(self, delay, fcn):
+        '''Run fcn() after `delay` seconds'''
+        with self._cond:
+            heapq.heappush(self._heap,
+                           (time.time() + max(delay, 0.0),
+                            next(self._counter), fcn))
+            self._cond.notify()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._running:
+                        return
+
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+
+                    wait_time = self._heap[0][0] - time.time()
+                    if wait_time <= 0.0:
+                        fcn = heapq.heappop(self._heap)[-1]
+                        break
+
+                    self._cond.wait(wait_time)
+
+            _run_callback(fcn)
+
+    def stop(self):
+        '''Stop the scheduler; pending calls are discarded'''
+        with self._cond:
+            self._running = False
+            del self._heap[:]
+            self._cond.notify_all()
+
+
+@cached_retval
+def get_callback_scheduler():
+    '''The shared scheduler used for coalesced, rate-limited callbacks'''
+    return CallbackScheduler()
@@ -10,9 +10,11 @@
 from __future__ import print_function
 import ctypes
 import threading
+import time
 import Queue as queue
 import warnings
 
+import numpy as np
 import epics
 
 from . import errors
@@ -24,6 +26,13 @@ __all__ = ['split_record_field',
            'check_alarm',
            'MonitorDispatcher',
            'get_pv_form',
+           'waveform_to_string',
+           'WaveformStringCache',
+           'native_dtype',
+           'read_array',
+           'bulk_get',
+           'bulk_put',
+           'ArrayBufferPool',
            ]
 
 
@@ -191,6 +200,33 @@ class MonitorDispatcher(epics.ca.CAThread):
         return epics.ca._onMonitorEvent(args)
 
 
+def _waveform_bytes(value):
+    '''The raw bytes of a char waveform, or None if value is not one'''
+    if isinstance(value, np.ndarray):
+        if value.ndim > 0 and value.dtype.itemsize == 1:
+            return value.tobytes()
+    elif isinstance(value, (list, tuple)):
+        try:
+            return bytes(bytearray(value))
+        except (TypeError, ValueError):
+            pass
+
+    return None
+
+
+def _bytes_to_string(raw):
+    '''Decode NUL-terminated waveform bytes'''
+    nul = raw.find(b'\0')
+    if nul >= 0:
+        raw = raw[:nul]
+
+    if not isinstance(raw, str):
+        # Python 3: one character per byte, as with chr()
+        raw = raw.decode('latin-1')
+
+    return raw
+
+
 def waveform_to_string(value, type_=str, delim=''):
     '''Convert a waveform that represents a string into an actual Python string
 
@@ -203,6 +239,11 @@ def waveform_to_string(value, type_=str, delim=''):
     delim : str, optional
         delimiter to use when joining string
     '''
+    if type_ is str and not delim:
+        raw = _waveform_bytes(value)
+        if raw is not None:
+            return _bytes_to_string(raw)
+
     try:
         value = delim.join(chr(c) for c in value)
     except TypeError:
@@ -216,6 +257,311 @@ def waveform_to_string(value, type_=str, delim=''):
     return value
 
 
+class WaveformStringCache(object):
+    '''Converts char waveforms to strings like :func:`waveform_to_string`,
+    returning the previous string when the waveform has not changed
+
+    Useful for string signals (file paths, status messages) whose monitor
+    updates mostly repeat the same value.
+    '''
+    __slots__ = ('_last', )
+
+    def __init__(self):
+        self._last = (None, None)
+
+    def decode(self, value):
+        '''Convert a waveform to a string'''
+        raw = _waveform_bytes(value)
+        if raw is None:
+            return waveform_to_string(value)
+
+        last_raw, last_string = self._last
+        if raw == last_raw:
+            return last_string
+
+        string = _bytes_to_string(raw)
+        self._last = (raw, string)
+        return string
+
+
+def native_dtype(pv):
+    '''The numpy dtype of a connected PV's native data type
+
+    Returns
+    -------
+    dtype : np.dtype or None
+        None for strings, unknown types and channels not using channel
+        access
+    '''
+    if getattr(pv, 'chid', None) is None:
+        return None
+
+    ftype = epics.dbr.native_type(epics.ca.field_type(pv.chid))
+    try:
+        return np.dtype(epics.dbr.NP_Map[ftype])
+    except KeyError:
+        return None
+
+
+def read_array(pv, out, timeout=None):
+    '''Read an array PV into a preallocated numpy array
+
+    If the array has the native data type of the PV, libca writes the data
+    directly into it. Otherwise, the array is read with epics.PV.get() and
+    copied (and cast) into out.
+
+    Parameters
+    ----------
+    pv : epics.PV
+        The PV to read
+    out : np.ndarray
+        C-contiguous array to read into. At most out.size elements are read.
+    timeout : float, optional
+        Time to wait for the connection and for the data [sec], defaults to
+        2 seconds
+
+    Returns
+    -------
+    count : int
+        The number of elements read, stored at the start of out.ravel()
+
+    Raises
+    ------
+    ValueError
+        If out is not C-contiguous
+    TimeoutError
+    epics.ca.CASeverityException
+        If channel access reports an error reading the array
+    '''
+    if not out.flags.c_contiguous:
+        raise ValueError('Output array must be C-contiguous')
+
+    if timeout is None:
+        timeout = 2.0
+
+    if not pv.connected and not pv.wait_for_connection(timeout=timeout):
+        raise errors.TimeoutError('Failed to connect to %s' % pv.pvname)
+
+    flat = out.reshape(-1)
+    count = flat.size
+    if getattr(pv, 'chid', None) is not None:
+        count = min(count, epics.ca.element_count(pv.chid))
+
+    # Not compared directly, as np.dtype(None) is float64
+    dtype = native_dtype(pv)
+    if dtype is not None and dtype == out.dtype:
+        ftype = epics.dbr.native_type(epics.ca.field_type(pv.chid))
+        # No argtypes are declared for ca_array_get, so pass explicitly
+        # sized arguments to avoid truncating the chid and pointer
+        ret = epics.ca.libca.ca_array_get(ctypes.c_long(ftype),
+                                          ctypes.c_ulong(count), pv.chid,
+                                          ctypes.c_void_p(flat.ctypes.data))
+        epics.ca.PySEVCHK('ca_array_get', ret)
+
+        ret = epics.ca.pend_io(timeout)
+        if ret == epics.dbr.ECA_TIMEOUT:
+            raise errors.TimeoutError('Failed to read %s' % pv.pvname)
+
+        epics.ca.PySEVCHK('pend_io', ret)
+        return count
+
+    value = pv.get(count=count, timeout=timeout, use_monitor=False)
+    if value is None:
+        raise errors.TimeoutError('Failed to read %s' % pv.pvname)
+
+    value = np.asarray(value).reshape(-1)
+    count = min(count, value.size)
+    flat[:count] = value[:count]
+    return count
+
+
+def bulk_get(pvs, timeout=None, use_monitor=True):
+    '''Get the values of many PVs with a single round trip
+
+    Requests for all of the PVs are queued without waiting, flushed together,
+    and then collected.
+
+    Parameters
+    ----------
+    pvs : sequence of epics.PV
+        The PVs to read
+    timeout : float, optional
+        Time to wait for all of the values [sec], defaults to 2 seconds
+    use_monitor : bool, optional
+        Take the latest monitor value of monitored PVs instead of requesting
+        it
+
+    Returns
+    -------
+    results : list
+        (value, timestamp) for each PV, or None if the PV is not connected or
+        the request timed out. Timestamps are those of the IOC if the PV uses
+        the 'time' form, otherwise they are local.
+    '''
+    ca = epics.ca
+
+    if timeout is None:
+        timeout = 2.0
+
+    # pyepics >= 3.4 returns the timestamp along with the value
+    with_metadata = hasattr(ca, 'get_with_metadata')
+
+    results = [None] * len(pvs)
+    pending = []
+    for i, pv in enumerate(pvs):
+        if not pv.connected:
+            continue
+
+        if use_monitor and pv.auto_monitor:
+            results[i] = (pv.get(), pv.timestamp)
+        elif getattr(pv, 'chid', None) is None:
+            # Not a channel access channel (see ophyd.controls.backend)
+            value = pv.get(use_monitor=False)
+            if value is not None:
+                results[i] = (value, pv.timestamp)
+        elif with_metadata:
+            ca.get_with_metadata(pv.chid, ftype=pv.ftype, wait=False)
+            pending.append(i)
+        else:
+            ca.get(pv.chid, ftype=pv.ftype, wait=False)
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    ca.flush_io()
+
+    t0 = time.time()
+    for i in pending:
+        pv = pvs[i]
+        remaining = max(timeout - (time.time() - t0), 1e-3)
+        if with_metadata:
+            info = ca.get_complete_with_metadata(pv.chid, ftype=pv.ftype,
+                                                 timeout=remaining)
+            if info is not None:
+                results[i] = (info['value'],
+                              info.get('timestamp', time.time()))
+        else:
+            value = ca.get_complete(pv.chid, ftype=pv.ftype,
+                                    timeout=remaining)
+            if value is not None:
+                results[i] = (value, time.time())
+
+    return results
+
+
+def bulk_put(pvs, values, use_complete=False, callback=None, timeout=None):
+    '''Write the values of many PVs without waiting on each of them
+
+    All of the writes are issued before any completion is waited on. Each
+    request is still sent on its own, as epics.PV.put() polls channel access
+    after every put.
+
+    Parameters
+    ----------
+    pvs : sequence of epics.PV
+        The PVs to write
+    values : sequence
+        A value for each PV
+    use_complete : bool or sequence of bool, optional
+        Request put completion notification, for all PVs or for each one
+    callback : callable, optional
+        Called as callback(pvname=pvname) once the put to a PV which uses
+        completion notification has completed
+    timeout : float, optional
+        Time to wait for unconnected PVs to connect [sec], defaults to 2
+        seconds
+
+    Returns
+    -------
+    pending : list of str
+        The names of the PVs whose completion is notified through callback
+
+    Raises
+    ------
+    TimeoutError
+        If a PV fails to connect. No values are written in that case.
+    '''
+    if timeout is None:
+        timeout = 2.0
+
+    if isinstance(use_complete, bool):
+        use_complete = [use_complete] * len(pvs)
+
+    t0 = time.time()
+    for pv in pvs:
+        if not pv.connected:
+            remaining = max(timeout - (time.time() - t0), 1e-3)
+            if not pv.wait_for_connection(timeout=remaining):
+                raise errors.TimeoutError('Failed to connect to %s' %
+                                          pv.pvname)
+
+    def completed(pvname=None, **kwargs):
+        if callback is not None:
+            callback(pvname=pvname)
+
+    pending = []
+    for pv, value, complete in zip(pvs, values, use_complete):
+        if complete:
+            pv.put(value, wait=False, use_complete=True, callback=completed)
+            pending.append(pv.pvname)
+        else:
+            pv.put(value, wait=False)
+
+    return pending
+
+
+class ArrayBufferPool(object):
+    '''A pool of reusable numpy arrays of a single shape and dtype
+
+    Buffers are taken with acquire() and handed back with release() once the
+    data are no longer needed, so that repeated reads of large arrays do not
+    allocate new memory each time.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of the buffers
+    dtype : np.dtype
+        The data type of the buffers
+    size : int, optional
+        Maximum number of idle buffers kept in the pool
+
+    Attributes
+    ----------
+    allocated : int
+        The number of buffers allocated by the pool
+    '''
+
+    def __init__(self, shape, dtype, size=4):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.size = int(size)
+        self.allocated = 0
+
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        '''Get a buffer, allocating one if none are idle'''
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+
+            self.allocated += 1
+
+        return np.empty(self.shape, dtype=self.dtype)
+
+    def release(self, buf):
+        '''Return a buffer to the pool'''
+        if buf.shape != self.shape or buf.dtype != self.dtype:
+            raise ValueError('Buffer does not belong to this pool')
+
+        with self._lock:
+            if len(self._free) < self.size:
+                self._free.append(buf)
+
+
 @cached_retval
 def get_pv_form():
     '''Get the PV form that should be used for pyepics
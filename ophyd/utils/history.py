@@ -0,0 +1,224 @@
+# vi: ts=4 sw=4 sts=4 expandtab
+'''
+:mod:`ophyd.utils.history` - Value history
+==========================================
+
+.. module:: ophyd.utils.history
+   :synopsis: Fixed-size (timestamp, value) history buffers
+'''
+
+from __future__ import print_function
+import threading
+import time
+
+import numpy as np
+
+
+__all__ = ['History',
+           ]
+
+
+class History(object):
+    '''A fixed-capacity history of (timestamp, value) samples
+
+    Samples are stored in preallocated numpy arrays, so that appending does
+    not allocate any memory. Each sample is written twice, once in each
+    half of an array of twice the capacity. This way, the most recent
+    samples are always contiguous and are returned as views rather than
+    copies.
+
+    .. note:: The views returned are overwritten as new samples come in.
+        Copy them to keep them.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Number of samples kept
+    dtype : np.dtype, optional
+        Data type of the values
+
+    Attributes
+    ----------
+    count : int
+        Total number of samples appended
+    '''
+
+    def __init__(self, capacity=1000, dtype=float):
+        capacity = int(capacity)
+        if capacity < 1:
+            raise ValueError('Capacity must be positive')
+
+        self._capacity = capacity
+        self._timestamps = np.zeros(2 * capacity)
+        self._values = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        '''Number of samples kept'''
+        return self._capacity
+
+    @property
+    def dtype(self):
+        '''Data type of the values'''
+        return self._values.dtype
+
+    def __len__(self):
+        return min(self.count, self._capacity)
+
+    def append(self, timestamp, value):
+        '''Add a sample'''
+        with self._lock:
+            head = self._head
+            self._values[head] = value
+            self._values[head + self._capacity] = value
+            self._timestamps[head] = timestamp
+            self._timestamps[head + self._capacity] = timestamp
+
+            head += 1
+            self._head = 0 if head == self._capacity else head
+            self.count += 1
+
+    def clear(self):
+        '''Remove all samples'''
+        with self._lock:
+            self._head = 0
+            self.count = 0
+
+    def last(self, n=None):
+        '''The most recent samples, oldest first
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of samples. Defaults to all samples kept.
+
+        Returns
+        -------
+        timestamps : np.ndarray
+        values : np.ndarray
+        '''
+        with self._lock:
+            count = min(self.count, self._capacity)
+            if n is not None:
+                count = max(min(int(n), count), 0)
+
+            stop = self._head + self._capacity
+            start = stop - count
+
+        return self._timestamps[start:stop], self._values[start:stop]
+
+    def snapshot(self, n=None):
+        '''Copies of the most recent samples, oldest first
+
+        Unlike :meth:`last`, the samples are copied while holding the lock,
+        so they are consistent even while samples are being appended from
+        another thread.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of samples. Defaults to all samples kept.
+
+        Returns
+        -------
+        timestamps : np.ndarray
+        values : np.ndarray
+        '''
+        with self._lock:
+            count = min(self.count, self._capacity)
+            if n is not None:
+                count = max(min(int(n), count), 0)
+
+            stop = self._head + self._capacity
+            start = stop - count
+            return (self._timestamps[start:stop].copy(),
+                    self._values[start:stop].copy())
+
+    def window(self, start=None, stop=None):
+        '''The samples in the time range [start, stop)
+
+        Timestamps are expected to be increasing.
+
+        Parameters
+        ----------
+        start : float, optional
+            Start time. Defaults to the oldest sample.
+        stop : float, optional
+            Stop time. Defaults to including the latest sample.
+
+        Returns
+        -------
+        timestamps : np.ndarray
+        values : np.ndarray
+        '''
+        timestamps, values = self.last()
+
+        i0 = 0
+        i1 = len(timestamps)
+        if start is not None:
+            i0 = np.searchsorted(timestamps, start, side='left')
+        if stop is not None:
+            i1 = np.searchsorted(timestamps, stop, side='left')
+
+        return timestamps[i0:i1], values[i0:i1]
+
+    def since(self, seconds):
+        '''The samples of the last `seconds` seconds'''
+        return self.window(start=time.time() - seconds)
+
+    @property
+    def timestamps(self):
+        '''The timestamps of all samples kept, oldest first'''
+        return self.last()[0]
+
+    @property
+    def values(self):
+        '''The values of all samples kept, oldest first'''
+        return self.last()[1]
+
+    def stats(self, n=None, start=None, stop=None):
+        '''Summary statistics of the values
+
+        Parameters
+        ----------
+        n : int, optional
+            Only the last n samples
+        start : float, optional
+            Only samples since this time
+        stop : float, optional
+            Only samples before this time
+
+        Returns
+        -------
+        stats : dict
+            count, mean, std, min and max. All but count are None if there
+            are no samples.
+        '''
+        if start is not None or stop is not None:
+            timestamps, values = self.window(start=start, stop=stop)
+            if n is not None:
+                values = values[-n:] if n > 0 else values[:0]
+        else:
+            timestamps, values = self.last(n)
+
+        if not len(values):
+            return {'count': 0,
+                    'mean': None,
+                    'std': None,
+                    'min': None,
+                    'max': None,
+                    }
+
+        return {'count': len(values),
+                'mean': float(values.mean()),
+                'std': float(values.std()),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                }
+
+    def __repr__(self):
+        return ('{0}(capacity={1.capacity}, dtype={1.dtype}, '
+                'count={1.count})'.format(self.__class__.__name__, self))
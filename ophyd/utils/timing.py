@@ -0,0 +1,272 @@
+# vi: ts=4 sw=4 sts=4 expandtab
+'''
+:mod:`ophyd.utils.timing` - Callback latency instrumentation
+============================================================
+
+.. module:: ophyd.utils.timing
+   :synopsis: Timing statistics of subscription callbacks
+'''
+
+from __future__ import print_function
+import functools
+import logging
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .dispatch import CallbackWrapper
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['LatencyHistogram',
+           'CallbackTimer',
+           ]
+
+
+class LatencyHistogram(object):
+    '''Rolling statistics of callback run times
+
+    Parameters
+    ----------
+    window : int, optional
+        Number of most recent samples the percentiles are calculated over
+
+    Attributes
+    ----------
+    count : int
+        Total number of samples
+    total : float
+        Total time over all samples [sec]
+    max : float
+        Longest time over all samples [sec]
+    '''
+
+    def __init__(self, window=1000):
+        self._samples = np.zeros(int(window))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed):
+        '''Add a single sample [sec]'''
+        self._samples[self.count % len(self._samples)] = elapsed
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def samples(self):
+        '''The samples in the window (not in order)'''
+        return self._samples[:min(self.count, len(self._samples))]
+
+    def percentile(self, q):
+        '''Percentile q (0-100) of the samples in the window'''
+        samples = self.samples
+        if not len(samples):
+            return None
+
+        return float(np.percentile(samples, q))
+
+    @property
+    def p50(self):
+        return self.percentile(50)
+
+    @property
+    def p99(self):
+        return self.percentile(99)
+
+    @property
+    def summary(self):
+        '''Statistics as a dictionary
+
+        count, total and max are over all samples, the percentiles are over
+        the window
+        '''
+        samples = self.samples
+        if len(samples):
+            p50, p99 = [float(p) for p in np.percentile(samples, [50, 99])]
+        else:
+            p50 = p99 = None
+
+        return {'count': self.count,
+                'total': self.total,
+                'max': self.max,
+                'p50': p50,
+                'p99': p99,
+                }
+
+
+def _object_name(obj):
+    '''Stable name of the object a callback was run for'''
+    name = getattr(obj, 'name', None)
+    if name:
+        return name
+
+    return type(obj).__name__
+
+
+def _callback_name(cb):
+    '''Stable name of a callback
+
+    Wrappers (partials, callback wrappers, decorators) are looked through and
+    bound methods are reduced to their function, so that e.g. the bound
+    method of a new status object on every move maps to the same name.
+    '''
+    while True:
+        if isinstance(cb, functools.partial):
+            cb = cb.func
+        elif hasattr(cb, '__wrapped__'):
+            cb = cb.__wrapped__
+        elif isinstance(cb, CallbackWrapper):
+            cb = cb.callback
+        else:
+            break
+
+    cb = getattr(cb, '__func__', cb)
+    name = getattr(cb, '__qualname__', None)
+    if name is None:
+        name = getattr(cb, '__name__', None)
+    if name is None:
+        name = type(cb).__name__
+
+    module = getattr(cb, '__module__', None)
+    if module:
+        return '.'.join((module, name))
+
+    return name
+
+
+class CallbackTimer(object):
+    '''Records how long subscription callbacks take to run
+
+    Statistics are kept per (object name, subscription type, callback name).
+    Only names are kept, so no references to objects or callbacks are held,
+    and callbacks that are created anew for every move (e.g., bound methods
+    of status objects) share a single entry.
+
+    Parameters
+    ----------
+    window : int, optional
+        Window size of each :class:`LatencyHistogram`
+    slow_threshold : float, optional
+        Log a warning for any callback taking at least this long [sec]
+    logger : logging.Logger, optional
+        Logger for slow callback warnings
+    max_entries : int, optional
+        Maximum number of entries kept. When exceeded, the least recently
+        updated entry is dropped.
+    '''
+
+    def __init__(self, window=1000, slow_threshold=None, logger=None,
+                 max_entries=1000):
+        if logger is None:
+            logger = globals()['logger']
+
+        self.window = int(window)
+        self.slow_threshold = slow_threshold
+        self.logger = logger
+        self.max_entries = int(max_entries)
+
+        self._stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, obj, sub_type, cb, elapsed):
+        '''Record a single callback run time [sec]'''
+        key = (_object_name(obj), sub_type, _callback_name(cb))
+
+        with self._lock:
+            try:
+                # move to the end: most recently updated
+                hist = self._stats.pop(key)
+            except KeyError:
+                hist = LatencyHistogram(self.window)
+                while len(self._stats) >= self.max_entries:
+                    self._stats.popitem(last=False)
+
+            self._stats[key] = hist
+            hist.add(elapsed)
+
+        if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+            self.logger.warning('Slow %s callback on %s: %s took %.1f ms' %
+                                (sub_type, key[0], key[2], 1e3 * elapsed))
+
+    def reset(self):
+        '''Clear all statistics'''
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self, obj=None, sub_type=None, sort_key='total'):
+        '''Get callback statistics
+
+        Parameters
+        ----------
+        obj : OphydObject or str, optional
+            Only include callbacks of this object (or object name)
+        sub_type : str, optional
+            Only include this subscription type
+        sort_key : str, optional
+            Sort, largest first, by this statistic (see
+            :attr:`LatencyHistogram.summary`)
+
+        Returns
+        -------
+        stats : list of dict
+            With the keys obj, sub_type and callback (the object and callback
+            names) in addition to the statistics
+        '''
+        if obj is not None and not isinstance(obj, str):
+            obj = _object_name(obj)
+
+        with self._lock:
+            items = list(self._stats.items())
+
+        ret = []
+        for (obj_, sub_type_, cb), hist in items:
+            if obj is not None and obj_ != obj:
+                continue
+            if sub_type is not None and sub_type_ != sub_type:
+                continue
+
+            info = hist.summary
+            info.update(obj=obj_, sub_type=sub_type_, callback=cb)
+            ret.append(info)
+
+        # Percentiles are None for empty histograms; sort those last
+        ret.sort(key=lambda info: (info[sort_key] is not None,
+                                   info[sort_key]),
+                 reverse=True)
+        return ret
+
+    def report(self, count=20, file=None, **kwargs):
+        '''Print a table of the slowest callbacks
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of callbacks to list
+        file : file-like, optional
+            Where to print the table (defaults to sys.stdout)
+
+        Other keyword arguments are passed on to :meth:`summary`
+        '''
+        if file is None:
+            file = sys.stdout
+
+        def ms(value):
+            return float('nan') if value is None else 1e3 * value
+
+        print('{:<24} {:<12} {:>8} {:>10} {:>10} {:>10}  {}'
+              ''.format('Object', 'Sub type', 'Count', 'p50 [ms]', 'p99 [ms]',
+                        'Max [ms]', 'Callback'), file=file)
+
+        for info in self.summary(**kwargs)[:count]:
+            name = info['obj']
+            print('{:<24} {:<12} {:>8} {:>10.3f} {:>10.3f} {:>10.3f}  {}'
+                  ''.format(name[:24], str(info['sub_type'])[:12],
+                            info['count'], ms(info['p50']),
+                            ms(info['p99']), ms(info['max']),
+                            info['callback']), file=file)
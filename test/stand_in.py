@@ -0,0 +1,69 @@
+'''
+A stand-in for epics.PV, for testing EPICS signals without an IOC
+'''
+
+from __future__ import print_function
+
+import threading
+
+
+class StandInPV(object):
+    '''A connected, monitored epics.PV stand-in
+
+    Parameters
+    ----------
+    pvname : str
+    value : any, optional
+    put_delay : float, optional
+        Notify put completion this long after a put requesting it. By
+        default, completion is never notified.
+
+    Attributes
+    ----------
+    gets : int
+        Number of value requests
+    ctrl_requests : int
+        Number of control value requests
+    '''
+    connected = True
+    auto_monitor = True
+
+    def __init__(self, pvname, value=None, put_delay=None):
+        self.pvname = pvname
+        self.value = value
+        self.timestamp = 1.0
+        self.put_delay = put_delay
+        self.gets = 0
+        self.ctrl_requests = 0
+
+    def get(self, **kwargs):
+        self.gets += 1
+        return self.value
+
+    def get_ctrlvars(self):
+        self.ctrl_requests += 1
+        return {'lower_ctrl_limit': -10.0,
+                'upper_ctrl_limit': 10.0,
+                'precision': 3}
+
+    def put(self, value, wait=False, use_complete=False, callback=None,
+            **kwargs):
+        self.value = value
+        if use_complete and self.put_delay is not None:
+            timer = threading.Timer(self.put_delay, callback,
+                                    kwargs={'pvname': self.pvname})
+            timer.start()
+
+
+def stand_in(signal, *args, **kwargs):
+    '''Use a StandInPV for the channels of a lazy EpicsSignal
+
+    Arguments are passed on to StandInPV, after the PV name of the signal.
+
+    Returns
+    -------
+    pv : StandInPV
+    '''
+    pv = StandInPV(signal.pvname, *args, **kwargs)
+    signal._read_pv_obj = signal._write_pv_obj = pv
+    return pv
@@ -0,0 +1,118 @@
+from __future__ import print_function
+
+import sys
+import threading
+import time
+import unittest
+from StringIO import StringIO
+
+from ophyd.controls import use_backend
+from ophyd.controls.area_detector import AreaDetector
+from ophyd.controls.scaler import EpicsScaler
+from ophyd.controls.sim import SimBackend
+from ophyd.controls.connection import (ConnectionManager,
+                                       get_connection_manager,
+                                       run_when_connected)
+from ophyd.utils import TimeoutError
+
+
+class FakePV(object):
+    '''Stands in for epics.PV, connecting after a delay'''
+    def __init__(self, pvname, delay=None):
+        self.pvname = pvname
+        self.connected = False
+        self.connection_callbacks = []
+        if delay is not None:
+            threading.Timer(delay, self._connect).start()
+
+    def _connect(self):
+        self.connected = True
+        for cb in self.connection_callbacks:
+            cb(pvname=self.pvname, conn=True, pv=self)
+
+    def wait_for_connection(self, timeout=None):
+        event = threading.Event()
+        self.connection_callbacks.append(lambda **kwargs: event.set())
+        if not self.connected:
+            event.wait(timeout)
+        return self.connected
+
+
+class ConnectionTests(unittest.TestCase):
+    def test_bulk(self):
+        calls = []
+        dev1, dev2 = object(), object()
+
+        with ConnectionManager(timeout=0.5) as conn:
+            self.assertIs(get_connection_manager(), conn)
+            for i in range(10):
+                conn.add_pv(FakePV('dev1:%d' % i, delay=0.1), dev1)
+            conn.add_pv(FakePV('dev2:ok', delay=0.1), dev2)
+            conn.add_pv(FakePV('dev2:missing'), dev2)
+
+            run_when_connected(dev1, calls.append, 1)
+            run_when_connected(dev2, calls.append, 2)
+            self.assertEqual(calls, [])
+
+        self.assertIs(get_connection_manager(), None)
+
+        # deferred calls of devices with unconnected channels are skipped
+        self.assertEqual(calls, [1])
+        self.assertEqual(list(conn.failed.items()), [(dev2, ['dev2:missing'])])
+
+        times = conn.connection_times
+        self.assertIs(times[dev2], None)
+        # the channels were waited on together, not one after the other
+        self.assertGreaterEqual(times[dev1], 0.1)
+        self.assertLess(times[dev1], 0.4)
+
+    def test_devices(self):
+        # channels which never connect
+        sim = SimBackend(auto_create=False)
+
+        with use_backend(sim):
+            t0 = time.time()
+            with ConnectionManager(timeout=0.5) as conn:
+                scaler = EpicsScaler('SIM:conn_sc', name='sc')
+                det = AreaDetector('SIM:conn_ad:', name='ad')
+                # construction does not wait on any of the channels
+                self.assertLess(time.time() - t0, 0.25)
+
+        self.assertEqual(list(conn.failed.keys()), [scaler, det])
+        self.assertLess(time.time() - t0, 1.0)
+
+        stdout = sys.stdout
+        sys.stdout = out = StringIO()
+        try:
+            conn.report()
+        finally:
+            sys.stdout = stdout
+
+        self.assertIn('sc ', out.getvalue())
+        self.assertIn('FAILED: SIM:conn_sc.CNT', out.getvalue())
+
+    def test_no_manager(self):
+        calls = []
+        run_when_connected(None, calls.append, 1)
+        self.assertEqual(calls, [1])
+
+    def test_raise(self):
+        conn = ConnectionManager(timeout=0.05, raise_on_failure=True)
+        conn.add_pv(FakePV('missing'), None)
+        self.assertRaises(TimeoutError, conn.wait)
+
+    def test_claim(self):
+        sig1, sig2, dev = object(), object(), object()
+
+        conn = ConnectionManager(timeout=0.05)
+        conn.add_pv(FakePV('sig1:a'), sig1)
+        conn.add_pv(FakePV('sig1:b'), sig1)
+        conn.add_pv(FakePV('sig2'), sig2)
+
+        conn.claim(sig1, dev)
+        # claiming again, or a signal without channels, is a no-op
+        conn.claim(sig1, dev)
+        conn.claim(object(), dev)
+
+        self.assertEqual(conn.owners, [dev, sig2])
+        self.assertEqual(conn.failed[dev], ['sig1:a', 'sig1:b'])
@@ -0,0 +1,101 @@
+from __future__ import print_function
+
+import unittest
+
+from ophyd.controls.signal import (Signal, EpicsSignal, SignalGroup)
+from ophyd.controls.derived import DerivedSignal
+from ophyd.controls import use_backend
+from ophyd.controls.sim import SimBackend
+from ophyd.utils import ReadOnlyError
+
+
+class DerivedTests(unittest.TestCase):
+    def test_derived(self):
+        calls = []
+
+        def ratio(det, i0):
+            calls.append(1)
+            return det / i0
+
+        det = Signal(name='det', value=10.0)
+        i0 = Signal(name='i0', value=2.0)
+        norm = DerivedSignal([det, i0], ratio, name='norm')
+
+        self.assertEqual(norm.get(), 5.0)
+        for i in range(10):
+            norm.read()
+        self.assertEqual(len(calls), 1)
+
+        i0._set_readback(4.0, timestamp=3.0)
+        self.assertEqual(norm.read(), {'norm': {'value': 2.5,
+                                                'timestamp': 3.0}})
+        self.assertEqual(len(calls), 2)
+        self.assertRaises(ReadOnlyError, norm.put, 1.0)
+
+        group = SignalGroup(name='group')
+        group.add_signal(det)
+        group.add_signal(norm)
+        self.assertEqual(group.read()['norm']['value'], 2.5)
+
+        # subscribers are updated as the sources change
+        values = []
+        norm.subscribe(lambda value=None, **kwargs: values.append(value),
+                       run=False)
+        det._set_readback(8.0)
+        self.assertEqual(values, [2.0])
+
+    def test_lazy_source(self):
+        sim = SimBackend()
+        sim.add_record('SIM:derived_src', 2.0)
+
+        with use_backend(sim):
+            src = EpicsSignal('SIM:derived_src', lazy=True)
+
+        double = DerivedSignal([src], lambda value: 2 * value)
+        self.assertTrue(double._polled())
+        # neither creating the derived signal nor polling opens channels
+        self.assertIs(src._read_pv_obj, None)
+
+        self.assertEqual(double.get(), 4.0)
+        self.assertIsNot(src._read_pv_obj, None)
+
+    def test_nested_polled_source(self):
+        sim = SimBackend()
+        sim.add_record('SIM:derived_nested', 2.0)
+
+        with use_backend(sim):
+            src = EpicsSignal('SIM:derived_nested', auto_monitor=False)
+
+        double = DerivedSignal([src], lambda value: 2 * value)
+        quad = DerivedSignal([double], lambda value: 2 * value)
+        self.assertTrue(quad._polled())
+        self.assertEqual(quad.get(), 8.0)
+
+        sim.records['SIM:derived_nested'].update(3.0)
+        self.assertEqual(quad.get(), 12.0)
+
+    def test_source_deadband(self):
+        src = Signal(name='src', value=1.0)
+        src.subscribe(lambda **kwargs: None, run=False, deadband=10.0)
+        double = DerivedSignal([src], lambda value: 2 * value)
+        self.assertEqual(double.get(), 2.0)
+
+        # a deadband of another subscriber does not hold back the update
+        src._set_readback(1.5)
+        self.assertEqual(double.get(), 3.0)
+
+    def test_history(self):
+        det = Signal(name='det')
+        i0 = Signal(name='i0')
+        det.enable_history()
+        i0.enable_history()
+        norm = DerivedSignal([det, i0], lambda det, i0: det / i0)
+
+        i0._set_readback(2.0, timestamp=0.5)
+        for i in range(5):
+            det._set_readback(float(i), timestamp=float(i))
+        i0._set_readback(4.0, timestamp=2.5)
+
+        timestamps, values = norm.from_history()
+        self.assertEqual(list(timestamps), [1, 2, 3, 4])
+        self.assertEqual(list(values), [0.5, 1.0, 0.75, 1.0])
@@ -0,0 +1,49 @@
+from __future__ import print_function
+
+import unittest
+
+from ophyd.controls.signal import Signal
+
+
+class DeadbandTests(unittest.TestCase):
+    def test_deadband(self):
+        values = []
+        all_values = []
+
+        def cb(value=None, **kwargs):
+            values.append(value)
+
+        sig = Signal(name='sig', value=0.0)
+        sig.subscribe(cb, run=False, deadband=0.5)
+        sig.subscribe(lambda value=None, **kwargs: all_values.append(value),
+                      run=False)
+
+        readbacks = [0.1, 0.4, 0.6, 0.7, 1.2, 1.0]
+        for value in readbacks:
+            sig._set_readback(value)
+
+        # changes are measured from the last value reported
+        self.assertEqual(values, [0.1, 0.7])
+        self.assertEqual(sig.get(), 1.0)
+
+        # other subscribers see every value
+        self.assertEqual(all_values, readbacks)
+
+        sig.clear_sub(cb)
+        del values[:]
+        sig.subscribe(cb, run=False, rel_deadband=0.1)
+        for value in [100.0, 105.0, 111.0, 'abc']:
+            sig._set_readback(value)
+
+        self.assertEqual(values, [100.0, 111.0, 'abc'])
+
+    def test_deadband_rate_limited(self):
+        values = []
+        sig = Signal(name='sig', value=0.0)
+        sig.subscribe(lambda value=None, **kwargs: values.append(value),
+                      run=False, deadband=0.5, max_rate=1e6)
+
+        for value in [1.0, 1.1, 2.0]:
+            sig._set_readback(value)
+
+        self.assertEqual(values, [1.0, 2.0])
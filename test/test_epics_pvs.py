@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import unittest
+
+import numpy as np
+
+from ophyd.utils.epics_pvs import (ArrayBufferPool, read_array,
+                                   waveform_to_string, WaveformStringCache)
+
+
+class BufferPoolTests(unittest.TestCase):
+    def test_reuse(self):
+        pool = ArrayBufferPool((4, 3), np.uint16, size=1)
+        buf1 = pool.acquire()
+        self.assertEqual(buf1.shape, (4, 3))
+        self.assertEqual(buf1.dtype, np.uint16)
+
+        pool.release(buf1)
+        self.assertIs(pool.acquire(), buf1)
+
+        buf2 = pool.acquire()
+        pool.release(buf1)
+        pool.release(buf2)
+        self.assertEqual(pool.allocated, 2)
+        # only one idle buffer is kept
+        self.assertIs(pool.acquire(), buf1)
+        self.assertIsNot(pool.acquire(), buf2)
+
+        self.assertRaises(ValueError, pool.release, np.zeros((3, 4)))
+
+    def test_contiguous(self):
+        out = np.zeros((4, 4))[:, ::2]
+        self.assertRaises(ValueError, read_array, None, out)
+
+
+class WaveformStringTests(unittest.TestCase):
+    def test_convert(self):
+        value = np.zeros(16, dtype=np.uint8)
+        value[:5] = [ord(c) for c in 'hello']
+
+        self.assertEqual(waveform_to_string(value), 'hello')
+        self.assertEqual(waveform_to_string(list(value)), 'hello')
+        self.assertEqual(waveform_to_string(value[:5]), 'hello')
+        self.assertEqual(waveform_to_string(value[:0]), '')
+        self.assertEqual(waveform_to_string('hello\0world'), 'hello')
+        # non-char arrays are converted character by character
+        self.assertEqual(waveform_to_string(value.astype(np.int32)), 'hello')
+
+    def test_cache(self):
+        cache = WaveformStringCache()
+        value = np.zeros(16, dtype=np.uint8)
+        value[:3] = [ord(c) for c in 'abc']
+
+        first = cache.decode(value)
+        self.assertEqual(first, 'abc')
+        self.assertIs(cache.decode(value.copy()), first)
+
+        value[3] = ord('d')
+        self.assertEqual(cache.decode(value), 'abcd')
+        self.assertEqual(cache.decode('xyz'), 'xyz')
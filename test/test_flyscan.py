@@ -0,0 +1,128 @@
+from __future__ import print_function
+
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from ophyd.controls import (EpicsMotor, EpicsSignal, use_backend)
+from ophyd.controls.flyscan import FlyScan
+from ophyd.controls.sim import (SimBackend, SimMotor)
+
+
+class FlyScanTests(unittest.TestCase):
+    def setUp(self):
+        self.sim = SimBackend(latency=1e-3)
+        SimMotor(self.sim, 'SIM:fly', velocity=1.0, update_rate=100.0)
+        self.det = self.sim.add_record('SIM:fly_det', 0.0)
+
+        with use_backend(self.sim):
+            self.motor = EpicsMotor('SIM:fly', name='fly')
+            self.signal = EpicsSignal('SIM:fly_det', name='det')
+
+    def test_bin(self):
+        scan = FlyScan(self.motor, 0.0, 1.0, detectors=[self.signal])
+
+        # moving at 1 unit/s, with the detector counting 10 per second
+        ts = np.linspace(100.0, 101.0, 101)
+        for t in ts:
+            scan.readbacks.append(t, t - 100.0)
+        for t in ts[::5]:
+            scan.data['det'].append(t, 10 * (t - 100.0))
+
+        np.testing.assert_allclose(scan.edge_times([0.25, 0.5, 2.0]),
+                                   [100.25, 100.5, np.nan])
+
+        events = scan.bin(4)
+        self.assertEqual(len(events), 4)
+        np.testing.assert_allclose([ev['fly']['value'] for ev in events],
+                                   [0.125, 0.375, 0.625, 0.875])
+        np.testing.assert_allclose([ev['fly']['timestamp'] for ev in events],
+                                   [100.125, 100.375, 100.625, 100.875])
+
+        # bins of 0.25 s hold 5 samples, 0.05 s apart
+        np.testing.assert_allclose([ev['det']['value'] for ev in events],
+                                   [1.0, 3.5, 6.0, 8.5])
+
+    def test_bin_partial(self):
+        scan = FlyScan(self.motor, 1.0, 0.0, detectors=[self.signal])
+
+        # moving down, stopped half way
+        for t, pos in zip([0.0, 1.0], [1.0, 0.5]):
+            scan.readbacks.append(t, pos)
+        scan.data['det'].append(0.0, 3.0)
+
+        events = scan.bin(edges=[1.0, 0.75, 0.5, 0.25, 0.0])
+        self.assertEqual(len(events), 2)
+
+        # no samples in the second bin: the last value is held
+        self.assertEqual([ev['det']['value'] for ev in events], [3.0, 3.0])
+
+    def test_run(self):
+        rbv = self.sim.records['SIM:fly.RBV']
+
+        def follow():
+            self.det.update(10 * rbv.value)
+            self.sim.schedule(0.005, follow)
+
+        self.sim.schedule(0.0, follow)
+
+        scan = self.motor.fly(0.0, 1.0, velocity=5.0,
+                              detectors=[self.signal], bins=5, timeout=5.0)
+        events = scan.events
+
+        self.assertEqual(len(events), 5)
+        np.testing.assert_allclose(scan.edges, np.linspace(0.0, 1.0, 6))
+        centers = np.array([ev['fly']['value'] for ev in events])
+        values = np.array([ev['det']['value'] for ev in events])
+        np.testing.assert_allclose(centers, [0.1, 0.3, 0.5, 0.7, 0.9])
+        np.testing.assert_allclose(values, 10 * centers, atol=1.0)
+
+        # the speed is restored after the scan
+        t0 = time.time()
+        while self.motor._velocity.get() != 1.0 and time.time() - t0 < 1.0:
+            time.sleep(0.01)
+
+        self.assertEqual(self.motor._velocity.get(), 1.0)
+
+    def test_run_stopped(self):
+        # stopping the motor half way is a failed scan, not a partial one
+        stopper = threading.Timer(0.2, self.motor.stop)
+        stopper.start()
+        try:
+            self.assertRaises(RuntimeError, self.motor.fly, 0.0, 1.0,
+                              velocity=2.0, detectors=[self.signal], bins=5,
+                              timeout=5.0)
+        finally:
+            stopper.cancel()
+
+    def test_run_interrupted(self):
+        scan = FlyScan(self.motor, 0.0, 1.0, velocity=2.0,
+                       detectors=[self.signal])
+
+        # Ctrl-C while waiting for the scan stops the motor and restores the
+        # scan parameters
+        def start_scan():
+            status = FlyScan.start_scan(scan)
+
+            def interrupt(timeout=None):
+                del status.wait
+                raise KeyboardInterrupt()
+
+            status.wait = interrupt
+            return status
+
+        scan.start_scan = start_scan
+        self.assertRaises(KeyboardInterrupt, scan.run, timeout=5.0)
+        self.assertFalse(scan._restore)
+        self.assertFalse(scan._subscriptions)
+
+        t0 = time.time()
+        while self.motor._velocity.get() != 1.0 and time.time() - t0 < 1.0:
+            time.sleep(0.01)
+
+        self.assertEqual(self.motor._velocity.get(), 1.0)
+        scan.status.wait(5.0)
+        self.assertTrue(scan.status.done)
+        self.assertFalse(scan.status.success)
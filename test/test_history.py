@@ -0,0 +1,45 @@
+from __future__ import print_function
+
+import unittest
+
+from ophyd.utils.history import History
+
+
+class HistoryTests(unittest.TestCase):
+    def test_history(self):
+        hist = History(4)
+        self.assertEqual(len(hist.last()[0]), 0)
+        self.assertIs(hist.stats()['mean'], None)
+
+        for i in range(10):
+            hist.append(float(i), i * 10)
+
+        self.assertEqual(len(hist), 4)
+        self.assertEqual(hist.count, 10)
+        self.assertEqual(list(hist.timestamps), [6, 7, 8, 9])
+        self.assertEqual(list(hist.values), [60, 70, 80, 90])
+
+        timestamps, values = hist.last(2)
+        self.assertEqual(list(values), [80, 90])
+        # views, not copies
+        self.assertIsNotNone(values.base)
+
+        self.assertEqual(list(hist.window(7, 9)[1]), [70, 80])
+        self.assertEqual(list(hist.window(start=8.5)[1]), [90])
+
+        stats = hist.stats()
+        self.assertEqual(stats['count'], 4)
+        self.assertEqual(stats['mean'], 75.0)
+        self.assertEqual(stats['min'], 60.0)
+        self.assertEqual(stats['max'], 90.0)
+        self.assertEqual(hist.stats(n=2)['mean'], 85.0)
+
+        # copies, unaffected by later samples
+        timestamps, values = hist.snapshot()
+        hist.append(10.0, 100)
+        self.assertEqual(list(timestamps), [6, 7, 8, 9])
+        self.assertEqual(list(values), [60, 70, 80, 90])
+        self.assertEqual(list(hist.snapshot(1)[1]), [100])
+
+        hist.clear()
+        self.assertEqual(len(hist), 0)
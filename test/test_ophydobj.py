@@ -0,0 +1,307 @@
+from __future__ import print_function
+
+import sys
+import threading
+import time
+import unittest
+from StringIO import StringIO
+
+from ophyd.controls.ophydobj import OphydObject
+from ophyd.controls.signal import (Signal, EpicsSignal)
+from ophyd.utils.dispatch import (CallbackExecutor, OVERFLOW_DROP_NEWEST,
+                                  OVERFLOW_DROP_OLDEST)
+from ophyd.utils.timing import (CallbackTimer, LatencyHistogram)
+
+
+def wait_until(predicate, timeout=2.0):
+    t0 = time.time()
+    while not predicate():
+        if (time.time() - t0) > timeout:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+class DispatchTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = CallbackExecutor(num_threads=2, name='test_exec')
+
+    def tearDown(self):
+        self.executor.stop()
+
+    def test_off_thread(self):
+        sig = Signal(name='dispatch_sig', value=0)
+        threads = []
+
+        def cb(value=None, **kwargs):
+            threads.append(threading.current_thread())
+
+        sig.subscribe(cb, run=False, executor=self.executor)
+        sig.put(1)
+
+        self.assertTrue(wait_until(lambda: threads))
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_slow_subscriber(self):
+        sig = Signal(name='dispatch_slow', value=0)
+        release = threading.Event()
+        fast = []
+        slow = []
+
+        def slow_cb(value=None, **kwargs):
+            release.wait(2.0)
+            slow.append(value)
+
+        def fast_cb(value=None, **kwargs):
+            fast.append(value)
+
+        sig.subscribe(slow_cb, run=False, executor=self.executor)
+        sig.subscribe(fast_cb, run=False)
+
+        for i in range(5):
+            sig.put(i)
+
+        # The fast, inline callback is not held up
+        self.assertEqual(fast, list(range(5)))
+        release.set()
+
+        # and the slow one sees every event, in order
+        self.assertTrue(wait_until(lambda: len(slow) == 5))
+        self.assertEqual(slow, list(range(5)))
+
+    def test_overflow(self):
+        for overflow, expected in [(OVERFLOW_DROP_OLDEST, [0, 8, 9]),
+                                   (OVERFLOW_DROP_NEWEST, [0, 1, 2])]:
+            sig = Signal(name='dispatch_overflow', value=0)
+            release = threading.Event()
+            values = []
+
+            def cb(value=None, **kwargs):
+                release.wait(2.0)
+                values.append(value)
+
+            sig.subscribe(cb, run=False, executor=self.executor,
+                          max_queue=2, overflow=overflow)
+            sig.put(0)
+            # wait for the first event to be picked up by a worker
+            wait_until(lambda: self.executor.depth == 0)
+
+            for i in range(1, 10):
+                sig.put(i)
+
+            stats = self.executor.stats[-1]
+            self.assertEqual(stats['dropped'], 7)
+            self.assertEqual(stats['max_depth'], 2)
+
+            release.set()
+            self.assertTrue(wait_until(lambda: len(values) == 3))
+            self.assertEqual(values, expected)
+            sig.clear_sub(cb)
+
+    def test_clear_sub(self):
+        sig = Signal(name='dispatch_clear', value=0)
+        values = []
+
+        def cb(value=None, **kwargs):
+            values.append(value)
+
+        sig.subscribe(cb, run=False, executor=self.executor)
+        self.assertEqual(len(self.executor.callbacks), 1)
+
+        sig.clear_sub(cb)
+        self.assertEqual(len(self.executor.callbacks), 0)
+
+        sig.put(1)
+        time.sleep(0.05)
+        self.assertEqual(values, [])
+
+
+class RateLimitTests(unittest.TestCase):
+    def test_coalesce(self):
+        sig = Signal(name='rate_sig', value=0)
+        values = []
+
+        def cb(value=None, **kwargs):
+            values.append(value)
+
+        sig.subscribe(cb, run=False, max_rate=10)
+        for i in range(100):
+            sig.put(i)
+
+        # The first event goes straight through, the rest are coalesced
+        self.assertEqual(values, [0])
+
+        # and the latest value shows up after the period
+        self.assertTrue(wait_until(lambda: len(values) == 2))
+        self.assertEqual(values, [0, 99])
+
+        time.sleep(0.15)
+        self.assertEqual(values, [0, 99])
+
+    def test_no_coalesce(self):
+        sig = Signal(name='rate_sig2', value=0)
+        values = []
+
+        def cb(value=None, **kwargs):
+            values.append(value)
+
+        sig.subscribe(cb, run=False, max_rate=10, coalesce=False)
+        for i in range(100):
+            sig.put(i)
+
+        time.sleep(0.15)
+        self.assertEqual(values, [0])
+
+        sig.put(100)
+        self.assertEqual(values, [0, 100])
+
+        sig.clear_sub(cb)
+        time.sleep(0.15)
+        sig.put(101)
+        self.assertEqual(values, [0, 100])
+
+
+class SlotsTests(unittest.TestCase):
+    def test_slots(self):
+        for sig in (Signal(name='slotted', value=1),
+                    EpicsSignal('OPHYD_TEST:slots', lazy=True)):
+            self.assertIn('_readback', Signal.__slots__)
+            self.assertNotIn('_readback', sig.__dict__)
+
+            # other attributes can still be set
+            sig.foo = 1
+            sig.__doc__ = 'Docs'
+            self.assertEqual(sig.foo, 1)
+            self.assertEqual(sig.__doc__, 'Docs')
+
+    def test_lazy_subs(self):
+        sig = Signal(name='lazy_subs', value=1)
+        self.assertIs(sig._subs, None)
+
+        sig.put(2)
+        self.assertIs(sig._subs, None)
+
+        values = []
+
+        def cb(value=None, **kwargs):
+            values.append(value)
+
+        # the last event is still replayed for a new subscriber
+        sig.subscribe(cb)
+        self.assertEqual(values, [2])
+
+        sig.put(3)
+        self.assertEqual(values, [2, 3])
+
+        self.assertRaises(KeyError, sig.subscribe, cb, 'unknown')
+
+
+class TimingTests(unittest.TestCase):
+    def tearDown(self):
+        OphydObject._callback_timer = None
+
+    def test_timing(self):
+        sig = Signal(name='timed', value=0)
+        timer = CallbackTimer(window=10, slow_threshold=0.01)
+        OphydObject._callback_timer = timer
+
+        def fast_cb(**kwargs):
+            pass
+
+        def slow_cb(**kwargs):
+            time.sleep(0.02)
+
+        sig.subscribe(fast_cb, run=False)
+        sig.subscribe(slow_cb, run=False)
+        for i in range(20):
+            sig.put(i)
+
+        stats = timer.summary(obj=sig, sub_type=sig.SUB_VALUE)
+        self.assertEqual(len(stats), 2)
+        # sorted by total time, slowest first
+        self.assertTrue(stats[0]['callback'].endswith('slow_cb'))
+        self.assertEqual(stats[0]['obj'], 'timed')
+        self.assertEqual(stats[0]['count'], 20)
+        self.assertGreaterEqual(stats[0]['p50'], 0.02)
+        self.assertGreaterEqual(stats[0]['max'], stats[0]['p99'])
+        self.assertLess(stats[1]['p99'], 0.02)
+
+        timer.reset()
+        self.assertEqual(timer.summary(), [])
+
+    def test_timing_wrapped(self):
+        sig = Signal(name='timed', value=0)
+        timer = CallbackTimer(window=10)
+        OphydObject._callback_timer = timer
+        executor = CallbackExecutor(num_threads=1, name='timing_exec')
+        self.addCleanup(executor.stop)
+
+        def slow_cb(**kwargs):
+            time.sleep(0.02)
+
+        sig.subscribe(slow_cb, run=False, executor=executor)
+        puts = 5
+        for i in range(puts):
+            sig.put(i)
+
+        self.assertTrue(wait_until(lambda: executor.depth == 0 and
+                                   timer.summary() and
+                                   timer.summary()[0]['count'] == puts))
+
+        # only the callback run itself is timed, not the enqueueing
+        stats = timer.summary()
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['count'], puts)
+        self.assertGreaterEqual(stats[0]['p50'], 0.02)
+
+    def test_timing_stable_keys(self):
+        sig = Signal(name='timed', value=0)
+        timer = CallbackTimer(window=10, max_entries=2)
+        OphydObject._callback_timer = timer
+
+        class Status(object):
+            def finished(self, **kwargs):
+                pass
+
+        # a new bound method (and status) for every put shares one entry
+        for i in range(5):
+            cb = Status().finished
+            sig.subscribe(cb, run=False)
+            sig.put(i)
+            sig.clear_sub(cb)
+
+        stats = timer.summary()
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['count'], 5)
+
+        # least recently updated entries are evicted
+        for name in ('a', 'b', 'c'):
+            timer.record(sig, name, Status().finished, 0.0)
+
+        self.assertEqual(sorted(info['sub_type'] for info in timer.summary()),
+                         ['b', 'c'])
+
+    def test_timing_report(self):
+        sig = Signal(name='timed', value=0)
+        timer = CallbackTimer(window=10)
+
+        def cb(**kwargs):
+            pass
+
+        timer.record(sig, sig.SUB_VALUE, cb, 0.001)
+        # an entry without samples has no percentiles
+        timer._stats[('empty', sig.SUB_VALUE, 'cb')] = LatencyHistogram(10)
+
+        stats = timer.summary(sort_key='p50')
+        self.assertEqual([info['obj'] for info in stats], ['timed', 'empty'])
+
+        # stdout is looked up when reporting, so redirection is honored
+        stdout, sys.stdout = sys.stdout, StringIO()
+        try:
+            timer.report(sort_key='p99')
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+
+        self.assertIn('timed', output)
+        self.assertIn('empty', output)
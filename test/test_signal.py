@@ -0,0 +1,260 @@
+from __future__ import print_function
+
+import time
+import unittest
+
+import numpy as np
+
+from ophyd.controls.signal import (Signal, EpicsSignal, SignalGroup,
+                                   bulk_read)
+from ophyd.controls import (EpicsMotor, use_backend)
+from ophyd.controls.sim import (SimBackend, SimMotor)
+from ophyd.controls.areadetector.plugins import ImagePlugin
+from ophyd.utils import TimeoutError
+
+from .stand_in import stand_in
+
+
+class LazyTests(unittest.TestCase):
+    def tearDown(self):
+        EpicsSignal._lazy_default = False
+
+    def test_lazy(self):
+        sig = EpicsSignal('OPHYD_TEST:lazy', write_pv='OPHYD_TEST:lazy_sp',
+                          lazy=True)
+        self.assertIs(sig._read_pv_obj, None)
+
+        # names are available without creating the channels
+        self.assertEqual(sig.pvname, 'OPHYD_TEST:lazy')
+        self.assertEqual(sig.setpoint_pvname, 'OPHYD_TEST:lazy_sp')
+        repr(sig)
+        sig.describe()
+        self.assertIs(sig._read_pv_obj, None)
+        self.assertFalse(sig.connected)
+
+        sig.subscribe(lambda **kwargs: None, run=False)
+        self.assertEqual(sig._read_pv.pvname, 'OPHYD_TEST:lazy')
+        self.assertEqual(sig._write_pv.pvname, 'OPHYD_TEST:lazy_sp')
+
+    def test_read_only(self):
+        sig = EpicsSignal('OPHYD_TEST:lazy_ro', rw=False, lazy=True)
+        self.assertIs(sig.setpoint_pvname, None)
+        self.assertIs(sig._write_pv, None)
+        self.assertIsNot(sig._read_pv_obj, None)
+
+    def test_default(self):
+        EpicsSignal._lazy_default = True
+        sig = EpicsSignal('OPHYD_TEST:lazy_default')
+        self.assertIs(sig._read_pv_obj, None)
+
+        sig = EpicsSignal('OPHYD_TEST:not_lazy', lazy=False)
+        self.assertIsNot(sig._read_pv_obj, None)
+        self.assertIs(sig._write_pv, sig._read_pv)
+
+    def test_stop_not_lazy(self):
+        EpicsSignal._lazy_default = True
+        sim = SimBackend()
+        SimMotor(sim, 'SIM:lazy_mtr')
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:lazy_mtr', name='lazy_mtr')
+
+        # the stop channel is ready before the first stop()
+        self.assertIsNot(motor._stop._read_pv_obj, None)
+        self.assertIs(motor._egu._read_pv_obj, None)
+
+
+class CtrlCacheTests(unittest.TestCase):
+    def test_cached_limits(self):
+        sig = EpicsSignal('OPHYD_TEST:limits', limits=True, lazy=True)
+        pv = stand_in(sig)
+
+        for i in range(1000):
+            sig.check_value(i % 10)
+
+        self.assertEqual(sig.limits, (-10.0, 10.0))
+        self.assertEqual(sig.precision, 3)
+        self.assertEqual(pv.ctrl_requests, 1)
+
+        self.assertRaises(ValueError, sig.check_value, 11)
+
+        sig.invalidate_ctrl_vars()
+        sig.check_value(0)
+        self.assertEqual(pv.ctrl_requests, 2)
+
+        # reconnection invalidates the cache as well
+        sig._connected(pvname=sig.pvname, conn=True)
+        self.assertEqual(sig.high_limit, 10.0)
+        self.assertEqual(pv.ctrl_requests, 3)
+
+
+class ArrayTests(unittest.TestCase):
+    def test_short_read(self):
+        sim = SimBackend()
+        sim.add_record('SIM:array', np.arange(6.0))
+
+        with use_backend(sim):
+            sig = EpicsSignal('SIM:array', auto_monitor=False)
+
+        out = np.zeros((2, 3))
+        self.assertIs(sig.get(out=out), out)
+        np.testing.assert_array_equal(out, [[0, 1, 2], [3, 4, 5]])
+
+        # only the elements read are returned
+        out = np.zeros((2, 4))
+        ret = sig.get(out=out)
+        np.testing.assert_array_equal(ret, np.arange(6.0))
+
+    def test_image_monitor(self):
+        sim = SimBackend()
+
+        with use_backend(sim):
+            monitored = ImagePlugin('SIM:', suffix='image1:')
+            on_request = ImagePlugin('SIM:', suffix='image2:',
+                                     monitor_array=False)
+            self.assertTrue(monitored.array_data._read_pv.auto_monitor)
+            self.assertFalse(on_request.array_data._read_pv.auto_monitor)
+
+
+class ReadTests(unittest.TestCase):
+    def test_read(self):
+        sig = EpicsSignal('OPHYD_TEST:read', name='sig', lazy=True)
+        stand_in(sig, 1.2345)
+
+        self.assertEqual(sig.read(), {'sig': {'value': 1.2345,
+                                              'timestamp': 1.0}})
+
+        sig.num_decimals = 2
+        self.assertEqual(sig.read()['sig']['value'], 1.23)
+
+        sig.dtype = int
+        self.assertEqual(sig.read()['sig']['value'], 1)
+        self.assertEqual(sig.describe()['sig']['dtype'], int)
+
+        sig.num_decimals = None
+        self.assertEqual(sig.num_decimals, 'all')
+        self.assertRaises(ValueError, setattr, sig, 'dtype', list)
+
+    def test_bulk_read(self):
+        group = SignalGroup(name='group')
+        for i in range(3):
+            sig = EpicsSignal('OPHYD_TEST:bulk%d' % i, name='sig%d' % i,
+                              lazy=True, recordable=(i != 2))
+            stand_in(sig, i)
+            group.add_signal(sig)
+
+        values = bulk_read([group])
+
+        # only recordable signals are read
+        self.assertEqual(sorted(values), ['sig0', 'sig1'])
+        self.assertEqual(values['sig1'], {'value': 1.0, 'timestamp': 1.0})
+
+        self.assertEqual(group.read(), bulk_read([group]))
+        self.assertEqual(group.get(), [0, 1, 2])
+
+
+class BulkPutTests(unittest.TestCase):
+    def _group(self, delays):
+        group = SignalGroup(name='group')
+        for i, delay in enumerate(delays):
+            sig = EpicsSignal('OPHYD_TEST:put%d' % i, name='sig%d' % i,
+                              lazy=True)
+            stand_in(sig, 0, put_delay=delay)
+            group.add_signal(sig)
+        return group
+
+    def test_put(self):
+        group = self._group([0.1] * 5)
+
+        status = group.bulk_put(range(5), use_complete=True, timeout=1.0)
+        self.assertFalse(status.done)
+        self.assertEqual(group.setpoint, list(range(5)))
+        self.assertEqual([sig._write_pv.value for sig in group.signals],
+                         list(range(5)))
+
+        self.assertTrue(status.wait(1.0))
+        # completion was waited on for all puts together
+        self.assertLess(status.elapsed, 0.4)
+        self.assertEqual(status.pending, set())
+
+        # without completion tracking, the status is done right away
+        self.assertTrue(group.bulk_put(range(5)).done)
+
+        # put() writes one signal at a time, as before
+        self.assertEqual(group.put(range(5, 10)), [None] * 5)
+        self.assertEqual([sig._write_pv.value for sig in group.signals],
+                         list(range(5, 10)))
+
+    def test_timeout(self):
+        group = self._group([0.05, None])
+        status = group.bulk_put([1, 2], use_complete=True, timeout=0.2)
+        self.assertFalse(status.wait(1.0))
+        self.assertTrue(status.done)
+        self.assertEqual(status.pending, set(['OPHYD_TEST:put1']))
+
+        self.assertRaises(TimeoutError, group.bulk_put, [1, 2], wait=True,
+                          timeout=0.2)
+
+
+class SnapshotTests(unittest.TestCase):
+    def test_snapshot(self):
+        group = SignalGroup(name='group', snapshot=True)
+        pvs = []
+        for i in range(3):
+            sig = EpicsSignal('OPHYD_TEST:snap%d' % i, name='sig%d' % i,
+                              lazy=True)
+            pvs.append(stand_in(sig, i))
+            group.add_signal(sig)
+
+        # no monitor updates yet: read live
+        self.assertEqual(group.read()['sig2'], {'value': 2.0,
+                                                'timestamp': 1.0})
+        self.assertEqual([counting.gets for counting in pvs], [1, 1, 1])
+
+        for sig, pv in zip(group.signals, pvs):
+            pv.value, pv.timestamp = 10, 2.0
+            sig._read_changed(value=pv.value, timestamp=pv.timestamp)
+
+        gets = [counting.gets for counting in pvs]
+        for i in range(10):
+            values = group.read()
+        self.assertEqual([counting.gets for counting in pvs], gets)
+        self.assertEqual(values['sig0'], {'value': 10.0, 'timestamp': 2.0})
+        self.assertEqual(bulk_read([group]), values)
+
+        # puts do not update the snapshot
+        group.signals[0]._set_readback(20)
+        self.assertEqual(group.read()['sig0']['value'], 10.0)
+
+        # stale values are read again
+        group.max_age = 0.05
+        time.sleep(0.1)
+        pvs[1].value = 11
+        self.assertEqual(group.read()['sig1']['value'], 11.0)
+        self.assertEqual(pvs[1].gets, gets[1] + 1)
+        group.read()
+        self.assertEqual(pvs[1].gets, gets[1] + 1)
+
+        group.snapshot = False
+        self.assertFalse(group.signals[0]._subs[EpicsSignal.SUB_VALUE])
+        group.read()
+        self.assertEqual(pvs[1].gets, gets[1] + 2)
+
+
+class HistoryTests(unittest.TestCase):
+    def test_signal(self):
+        sig = Signal(name='sig', separate_readback=True)
+        self.assertIs(sig.history, None)
+
+        sig.enable_history(capacity=100, setpoint=True)
+        for i in range(5):
+            sig._set_readback(i, timestamp=float(i))
+        sig.put(3.0, timestamp=10.0)
+        # values which do not fit the dtype are skipped
+        sig._set_readback('abc')
+
+        self.assertEqual(list(sig.history.values), [0, 1, 2, 3, 4])
+        self.assertEqual(list(sig.setpoint_history.timestamps), [10.0])
+
+        sig.disable_history()
+        self.assertIs(sig.history, None)
@@ -0,0 +1,260 @@
+from __future__ import print_function
+
+import threading
+import time
+import unittest
+
+from ophyd.controls import (EpicsMotor, EpicsScaler, EpicsSignal,
+                            get_backend, use_backend)
+from ophyd.controls.backend import EpicsBackend
+from ophyd.controls.positioner import (Positioner, PVPositioner)
+from ophyd.controls.area_detector import AreaDetector
+from ophyd.controls.signal import bulk_write
+from ophyd.controls.sim import (SimBackend, SimMotor, SimScaler)
+from ophyd.utils import TimeoutError
+
+
+class BackendTests(unittest.TestCase):
+    def test_use_backend(self):
+        sim = SimBackend()
+        with use_backend(sim):
+            self.assertIs(get_backend(), sim)
+            sig = EpicsSignal('SIM:backend', name='sig')
+
+        self.assertIsInstance(get_backend(), EpicsBackend)
+        self.assertNotIsInstance(get_backend(), SimBackend)
+        self.assertIs(sig._backend, sim)
+
+
+class SimSignalTests(unittest.TestCase):
+    def setUp(self):
+        self.sim = SimBackend(latency=1e-3, jitter=1e-3, seed=0)
+        self.sim.add_record('SIM:val', 1.5, lower_ctrl_limit=-10.0,
+                            upper_ctrl_limit=10.0, precision=2, units='mm')
+        self.sim.add_record('SIM:val_RBV', 1.5, precision=2)
+
+        with use_backend(self.sim):
+            self.sig = EpicsSignal('SIM:val_RBV', write_pv='SIM:val',
+                                   name='sig')
+
+    def test_get_put(self):
+        self.assertEqual(self.sig.get(), 1.5)
+        self.assertEqual(self.sig.precision, 2)
+        self.assertEqual(self.sig.low_limit, -10.0)
+        self.assertEqual(self.sig.high_limit, 10.0)
+
+        self.sig.put(3.0, wait=True)
+        self.assertEqual(self.sim.records['SIM:val'].value, 3.0)
+
+        # the readback follows the setpoint
+        self.assertEqual(self.sig.get(), 3.0)
+
+    def test_monitor(self):
+        updated = threading.Event()
+        values = []
+
+        def changed(value=None, **kwargs):
+            values.append(value)
+            updated.set()
+
+        self.sig.get()
+        self.sig.subscribe(changed, run=False)
+        self.sim.records['SIM:val_RBV'].update(7.0)
+
+        self.assertTrue(updated.wait(1.0))
+        self.assertEqual(values, [7.0])
+
+    def test_put_complete(self):
+        # processing takes a while before the put completes
+        def process(record, value, done):
+            record.update(value)
+            self.sim.schedule(0.05, done)
+
+        self.sim.records['SIM:val'].on_put = process
+        self.sig.get()
+
+        done = threading.Event()
+        self.sig.put(2.0, callback=lambda **kwargs: done.set())
+
+        self.assertFalse(done.is_set())
+        self.assertTrue(done.wait(1.0))
+
+    def test_bulk_write(self):
+        with use_backend(self.sim):
+            signals = [EpicsSignal('SIM:bulk%d' % i, name='bulk%d' % i)
+                       for i in range(5)]
+
+        status = bulk_write(signals, range(5), use_complete=True)
+        self.assertTrue(status.wait(1.0))
+        self.assertEqual([self.sim.records['SIM:bulk%d' % i].value
+                          for i in range(5)], list(range(5)))
+
+    def test_write_plugins(self):
+        # one of the puts never completes
+        self.sim.add_record('SIM:ad:Proc1:NumFilter',
+                            on_put=lambda record, value, done: None)
+
+        with use_backend(self.sim):
+            det = AreaDetector('SIM:ad:', stats=[], name='ad')
+            writes = [('EnableFilter', 1, 'Proc1:'),
+                      ('NumFilter', 10, 'Proc1:'),
+                      ('FilterType', 2, 'Proc1:'),
+                      ]
+
+            t0 = time.time()
+            try:
+                det._write_plugins(writes, timeout=0.2)
+            except TimeoutError as ex:
+                message = str(ex)
+            else:
+                self.fail('TimeoutError not raised')
+
+        # only the put which did not complete is reported
+        self.assertEqual(message,
+                         'Puts to SIM:ad:Proc1:NumFilter did not complete')
+        self.assertLess(time.time() - t0, 1.0)
+        self.assertEqual(self.sim.records['SIM:ad:Proc1:FilterType'].value,
+                         2)
+
+    def test_unknown(self):
+        sim = SimBackend(auto_create=False, connection_timeout=0.05)
+        pv = sim.create_pv('SIM:unknown')
+        self.assertFalse(pv.wait_for_connection())
+        self.assertIs(pv.get(), None)
+
+
+class SimDeviceTests(unittest.TestCase):
+    def setUp(self):
+        self.sim = SimBackend(latency=1e-3, seed=0)
+
+    def test_motor(self):
+        sim_motor = SimMotor(self.sim, 'SIM:m1', velocity=20.0,
+                             limits=(-5.0, 5.0))
+
+        with use_backend(self.sim):
+            m1 = EpicsMotor('SIM:m1', name='m1')
+
+        self.assertEqual(m1.position, 0.0)
+        self.assertEqual(m1.egu, 'mm')
+
+        t0 = time.time()
+        m1.move(1.0, wait=True)
+        self.assertGreaterEqual(time.time() - t0, 0.05)
+        self.assertEqual(sim_motor.position, 1.0)
+        self.assertEqual(m1.position, 1.0)
+        self.assertFalse(m1.moving)
+
+        # outside of the soft limits
+        self.assertRaises(ValueError, m1.move, 6.0)
+
+    def test_scaler(self):
+        SimScaler(self.sim, 'SIM:scaler1', numchan=4,
+                  rates=[1e6, 10.0, 20.0, 30.0])
+
+        with use_backend(self.sim):
+            scaler = EpicsScaler('SIM:scaler1', name='scaler1', numchan=4)
+
+        scaler.preset_time = 0.1
+        status = scaler.acquire()
+
+        t0 = time.time()
+        while not status.done and time.time() - t0 < 2.0:
+            time.sleep(0.01)
+
+        self.assertTrue(status.done)
+
+        values = scaler.read()
+        self.assertAlmostEqual(values['scaler1_time']['value'], 0.1)
+        self.assertEqual(values['scaler1_chan1']['value'], 100000)
+        self.assertEqual(values['scaler1_chan4']['value'], 3)
+
+
+class MoveWaitTests(unittest.TestCase):
+    def test_latency(self):
+        sim = SimBackend(latency=1e-3)
+        sim_motor = SimMotor(sim, 'SIM:m2', velocity=10.0)
+
+        with use_backend(sim):
+            m2 = EpicsMotor('SIM:m2', name='m2')
+
+        m2.move(0.2, wait=True)
+        self.assertEqual(m2.position, 0.2)
+
+        # returns on the DMOV monitor, not on the next poll
+        self.assertLess(time.time() - sim_motor._dmov.timestamp, 0.02)
+
+    def test_timeout(self):
+        positioner = Positioner(name='soft')
+
+        t0 = time.time()
+        self.assertRaises(TimeoutError, positioner.move, 1.0, wait=True,
+                          timeout=0.1)
+        self.assertLess(time.time() - t0, 1.0)
+
+    def test_wakeup(self):
+        positioner = Positioner(name='soft')
+        positioner._move_poll_interval = 10.0
+
+        def start_and_stop():
+            positioner._started_moving = True
+            positioner._moving = True
+            positioner._motion_changed()
+            time.sleep(0.05)
+            positioner._moving = False
+            positioner._done_moving()
+
+        thread = threading.Timer(0.05, start_and_stop)
+        thread.start()
+
+        t0 = time.time()
+        positioner.move(1.0, wait=True, timeout=5.0)
+        self.assertLess(time.time() - t0, 1.0)
+        thread.join()
+
+    def test_moving(self):
+        sim = SimBackend(latency=0.05)
+        SimMotor(sim, 'SIM:m3', velocity=1.0)
+
+        with use_backend(sim):
+            m3 = EpicsMotor('SIM:m3', name='m3')
+
+        self.assertFalse(m3.is_moving(verify=True))
+
+        status = m3.move(0.3, wait=False)
+        time.sleep(0.2)
+
+        # the monitored state needs no round trip
+        t0 = time.time()
+        self.assertTrue(m3.moving)
+        self.assertLess(time.time() - t0, 0.05)
+
+        t0 = time.time()
+        self.assertTrue(m3.is_moving(verify=True))
+        self.assertGreaterEqual(time.time() - t0, 0.1)
+
+        self.assertTrue(status.wait(2.0))
+        self.assertFalse(m3.moving)
+
+    def test_pv_positioner_moving(self):
+        sim = SimBackend(latency=0.05)
+        sim.add_record('SIM:pvp:sp', 0.0)
+        sim.add_record('SIM:pvp:rbv', 0.0)
+        done = sim.add_record('SIM:pvp:done', 1)
+
+        with use_backend(sim):
+            pos = PVPositioner('SIM:pvp:sp', readback='SIM:pvp:rbv',
+                               done='SIM:pvp:done', name='pvp')
+
+        self.assertFalse(pos.is_moving(verify=True))
+
+        done.update(0)
+        time.sleep(0.2)
+
+        # the monitored state needs no round trip
+        t0 = time.time()
+        self.assertTrue(pos.moving)
+        self.assertLess(time.time() - t0, 0.05)
+
+        t0 = time.time()
+        self.assertTrue(pos.is_moving(verify=True))
+        self.assertGreaterEqual(time.time() - t0, 0.1)
@@ -0,0 +1,128 @@
+from __future__ import print_function
+
+import threading
+import unittest
+
+from ophyd.controls.status import (StatusBase, AndStatus, all_of, any_of)
+from ophyd.controls.positioner import (Positioner, MoveStatus)
+from ophyd.controls.detector import (Detector, DetectorStatus)
+from ophyd.utils import TimeoutError
+
+
+def finish_later(status, delay, **kwargs):
+    timer = threading.Timer(delay, status._finished, kwargs=kwargs)
+    timer.start()
+    return timer
+
+
+class StatusTests(unittest.TestCase):
+    def test_wait(self):
+        status = StatusBase()
+        self.assertFalse(status.wait(0.01))
+        self.assertFalse(status.done)
+
+        finish_later(status, 0.05)
+        self.assertTrue(status.wait(1.0))
+        self.assertTrue(status.done)
+        self.assertGreater(status.elapsed, 0.0)
+
+    def test_callbacks(self):
+        status = StatusBase()
+        called = []
+        status.add_callback(called.append)
+        self.assertEqual(called, [])
+
+        status._finished(success=True)
+        self.assertEqual(called, [status])
+
+        # only the first call counts
+        status._finished(success=False)
+        self.assertTrue(status.success)
+
+        # already finished: called right away
+        status.add_callback(called.append)
+        self.assertEqual(called, [status, status])
+
+    def test_exception(self):
+        status = StatusBase()
+        ex = ValueError('failed')
+        status.set_exception(ex)
+        self.assertTrue(status.done)
+        self.assertFalse(status.success)
+        self.assertIs(status.exception, ex)
+
+    def test_timeout(self):
+        status = StatusBase(timeout=0.05)
+        self.assertFalse(status.wait(1.0))
+        self.assertTrue(status.done)
+        self.assertIsInstance(status.exception, TimeoutError)
+
+    def test_timeout_shared_thread(self):
+        StatusBase(timeout=0.05)
+        threads = threading.active_count()
+        statuses = [StatusBase(timeout=0.05) for i in range(20)]
+        self.assertEqual(threading.active_count(), threads)
+
+        self.assertFalse(all_of(statuses).wait(1.0))
+        self.assertTrue(all(status.done for status in statuses))
+
+    def test_all_of(self):
+        statuses = [StatusBase() for i in range(3)]
+        combined = all_of(statuses)
+        self.assertIsInstance(combined, AndStatus)
+
+        for i, status in enumerate(statuses):
+            finish_later(status, 0.01 * (i + 1))
+
+        self.assertTrue(combined.wait(1.0))
+        self.assertTrue(all(status.done for status in statuses))
+
+        self.assertTrue(all_of([]).done)
+
+    def test_all_of_failure(self):
+        first, second = StatusBase(), StatusBase()
+        combined = first & second
+
+        ex = RuntimeError('failed')
+        first.set_exception(ex)
+        self.assertFalse(combined.done)
+
+        second._finished(success=True)
+        self.assertTrue(combined.done)
+        self.assertFalse(combined.success)
+        self.assertIs(combined.exception, ex)
+
+    def test_any_of(self):
+        slow, fast = StatusBase(), StatusBase()
+        combined = any_of([slow, fast])
+
+        finish_later(fast, 0.01)
+        self.assertTrue(combined.wait(1.0))
+        self.assertFalse(slow.done)
+        self.assertIs(combined.first, fast)
+
+        self.assertFalse((StatusBase() | StatusBase()).wait(0.01))
+
+
+class StatusSubclassTests(unittest.TestCase):
+    def test_move_status(self):
+        positioner = Positioner(name='soft')
+        positioner._position = 1.0
+
+        status = positioner.move(2.0, wait=False)
+        self.assertIsInstance(status, MoveStatus)
+        self.assertFalse(status.done)
+
+        positioner._position = 2.0
+        finish = threading.Timer(0.02, positioner._done_moving)
+        finish.start()
+
+        self.assertTrue(status.wait(1.0))
+        self.assertEqual(status.finish_pos, 2.0)
+        self.assertEqual(status.error, 0.0)
+
+    def test_detector_status(self):
+        status = Detector().acquire()
+        self.assertIsInstance(status, DetectorStatus)
+        self.assertTrue(status.done)
+        self.assertTrue(status.wait(0))
@@ -0,0 +1,241 @@
+from __future__ import print_function
+
+import time
+import unittest
+
+import numpy as np
+
+from ophyd.controls import (EpicsMotor, use_backend)
+from ophyd.controls.positioner import Positioner
+from ophyd.controls.sim import (SimBackend, SimMotor)
+from ophyd.controls.trajectory import Trajectory
+
+
+class TrajectoryTests(unittest.TestCase):
+    def test_cursor(self):
+        traj = Trajectory(np.linspace(0, 1, 5))
+        self.assertEqual(len(traj), 5)
+        self.assertEqual(traj.progress, 0.0)
+
+        self.assertEqual(list(traj)[:2], [0.0, 0.25])
+        self.assertTrue(traj.done)
+        self.assertEqual(traj.remaining, 0)
+        self.assertEqual(traj.progress, 1.0)
+        self.assertRaises(StopIteration, next, traj)
+
+        traj.reset()
+        self.assertEqual(traj.index, 0)
+        self.assertEqual(next(traj), 0.0)
+
+    def test_record(self):
+        traj = Trajectory([0.0, 1.0, 2.0])
+        for i, pos in enumerate(traj):
+            traj.record(i, pos + 0.1 * i, timestamp=float(i))
+
+            # only the points started so far
+            self.assertEqual(len(traj.commanded), i + 1)
+
+        np.testing.assert_allclose(traj.readbacks, [0.0, 1.1, 2.2])
+        np.testing.assert_allclose(traj.following_error, [0.0, 0.1, 0.2])
+        np.testing.assert_allclose(traj.timestamps, [0.0, 1.0, 2.0])
+
+    def test_multiple_axes(self):
+        traj = Trajectory([[0.0, 1.0], [2.0, 3.0]])
+        np.testing.assert_equal(next(traj), [0.0, 1.0])
+        traj.record(0, [0.5, 1.0])
+        np.testing.assert_allclose(traj.following_error, [[0.5, 0.0]])
+
+        # readbacks which do not fit are left out
+        traj.record(0, 'abc')
+        np.testing.assert_allclose(traj.readbacks, [[0.5, 1.0]])
+
+
+class FollowTests(unittest.TestCase):
+    def test_iterable(self):
+        positioner = Positioner(name='soft')
+        positioner.set_trajectory(x for x in range(3))
+
+        traj = positioner.trajectory
+        self.assertIsInstance(traj, Trajectory)
+        self.assertIs(traj.remaining, None)
+
+        # points are taken from the generator as they are followed
+        self.assertEqual(positioner.next_pos, 0)
+        self.assertEqual(len(traj), 1)
+        traj.record(0, 0.5)
+
+        self.assertEqual([positioner.next_pos for i in range(3)],
+                         [1, 2, None])
+        self.assertTrue(traj.done)
+        self.assertEqual(traj.remaining, 0)
+        np.testing.assert_allclose(traj.positions, [0, 1, 2])
+        np.testing.assert_allclose(traj.readbacks, [0.5, np.nan, np.nan])
+
+    def test_infinite(self):
+        def forever():
+            i = 0
+            while True:
+                yield [i, -i]
+                i += 1
+
+        traj = Trajectory(forever())
+        for i in range(200):
+            next(traj)
+            traj.record(i, [i, -i])
+
+        self.assertEqual(len(traj), 200)
+        self.assertFalse(traj.done)
+        self.assertIs(traj.progress, None)
+        np.testing.assert_allclose(traj.following_error,
+                                   np.zeros((200, 2)))
+
+        traj.reset()
+        np.testing.assert_equal(next(traj), [0, 0])
+
+    def test_move_next(self):
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'SIM:traj', velocity=100.0)
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:traj', name='traj')
+
+        motor.set_trajectory([0.1, 0.2, 0.3])
+
+        motor.move_next(wait=True)
+        pos, status = motor.move_next(wait=False)
+        self.assertEqual(pos, 0.2)
+        self.assertTrue(status.wait(2.0))
+
+        self.assertEqual(motor.trajectory.index, 2)
+        np.testing.assert_allclose(motor.trajectory.readbacks, [0.1, 0.2])
+        self.assertFalse(np.isnan(motor.trajectory.timestamps).any())
+
+        motor.move_next(wait=True)
+        self.assertRaises(StopIteration, motor.move_next)
+        np.testing.assert_allclose(motor.trajectory.following_error,
+                                   [0.0, 0.0, 0.0])
+
+    def test_move_next_interrupted(self):
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'SIM:traj_int', velocity=1.0)
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:traj_int', name='traj_int')
+
+        motor.set_trajectory([10.0, 0.0])
+
+        pos, status = motor.move_next(wait=False)
+        # the next move interrupts the first, which never reached 10
+        pos, status2 = motor.move_next(wait=False)
+        self.assertTrue(status.done)
+        self.assertFalse(status.success)
+        self.assertTrue(status2.wait(20.0))
+
+        readbacks = motor.trajectory.readbacks
+        self.assertTrue(np.isnan(readbacks[0]))
+        np.testing.assert_allclose(readbacks[1:], [0.0])
+
+
+class PositionHistoryTests(unittest.TestCase):
+    def test_positions_at(self):
+        positioner = Positioner(name='soft')
+        self.assertRaises(ValueError, positioner.position_at, 0.0)
+
+        positioner.enable_history(capacity=10)
+        self.assertTrue(np.isnan(positioner.position_at(0.0)))
+
+        for t in range(5):
+            positioner._set_position(2.0 * t, timestamp=100.0 + t)
+
+        # out of order positions are left out
+        positioner._set_position(-1.0, timestamp=99.0)
+        self.assertEqual(len(positioner.history), 5)
+
+        self.assertEqual(positioner.position_at(101.5), 3.0)
+        np.testing.assert_allclose(
+            positioner.positions_at([99.0, 100.0, 102.25, 110.0]),
+            [np.nan, 0.0, 4.5, 8.0])
+
+        # bounded memory
+        for t in range(5, 20):
+            positioner._set_position(2.0 * t, timestamp=100.0 + t)
+
+        self.assertEqual(len(positioner.history), 10)
+        self.assertTrue(np.isnan(positioner.position_at(105.0)))
+        self.assertEqual(positioner.position_at(110.5), 21.0)
+
+        positioner.disable_history()
+        self.assertIs(positioner.history, None)
+
+    def test_motor(self):
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'SIM:hist', velocity=10.0, update_rate=100.0)
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:hist', name='hist')
+
+        motor.position
+        motor.enable_history()
+        motor.move(0.5, wait=True)
+
+        ts, positions = motor.history.last()
+        self.assertGreater(len(ts), 2)
+        self.assertEqual(positions[-1], 0.5)
+
+        # readbacks carry the timestamps of the (simulated) IOC
+        self.assertEqual(ts[-1], sim.records['SIM:hist.RBV'].timestamp)
+
+        mid = (ts[0] + ts[-1]) / 2.
+        self.assertTrue(0.0 < motor.position_at(mid) < 0.5)
+
+    def test_motor_readback_local_time(self):
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'SIM:hist_ts')
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:hist_ts', name='hist_ts')
+
+        motor.position
+        motor.enable_history()
+
+        readbacks = []
+
+        def readback(value=None, timestamp=None, **kwargs):
+            readbacks.append((value, timestamp))
+
+        motor.subscribe(readback, event_type=motor.SUB_READBACK, run=False)
+
+        # an IOC whose clock is far behind
+        t0 = time.time()
+        sim.records['SIM:hist_ts.RBV'].update(0.25, timestamp=1000.0)
+        while not readbacks and time.time() - t0 < 2.0:
+            time.sleep(0.001)
+
+        # SUB_READBACK keeps local time; only the history has the IOC time
+        value, timestamp = readbacks[-1]
+        self.assertEqual(value, 0.25)
+        self.assertGreaterEqual(timestamp, t0)
+        self.assertEqual(motor.history.last()[0][-1], 1000.0)
+
+    def test_motor_initial_ioc_time(self):
+        sim = SimBackend(latency=1e-3)
+        SimMotor(sim, 'SIM:hist_initial')
+        rbv = sim.records['SIM:hist_initial.RBV']
+
+        # an IOC whose clock is far behind
+        rbv.update(0.0, timestamp=1000.0)
+
+        with use_backend(sim):
+            motor = EpicsMotor('SIM:hist_initial', name='hist_initial')
+
+        motor.enable_history()
+        motor._read_initial_state()
+        self.assertEqual(motor.history.last()[0][-1], 1000.0)
+
+        # later monitor updates are not dropped as out of order
+        rbv.update(0.5, timestamp=1001.0)
+        t0 = time.time()
+        while len(motor.history) < 2 and time.time() - t0 < 2.0:
+            time.sleep(0.001)
+
+        self.assertEqual(list(motor.history.values), [0.0, 0.5])